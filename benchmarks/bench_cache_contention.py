@@ -0,0 +1,72 @@
+"""Measure emoji cache lookups per second from many threads at once.
+
+Run with ``uv run python benchmarks/bench_cache_contention.py``.
+
+Every thread looks up the same hot set of emoji payloads, as a thread pool
+of renderers sharing one cache does. The table compares the single-lock
+``LRUCacheDict``, the single-lock ``ByteLRUCache`` and a ``ShardedCache``
+whose hits skip the lock. On a GIL build the locks mostly cost their
+acquire and release; on a free-threaded build they also serialize threads.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+import emoji
+
+from parmoji.cache import ByteLRUCache, LRUCacheDict, ShardedCache
+
+LOOKUPS = 50_000
+HOT = sorted(emoji.EMOJI_DATA)[:200]
+
+
+def make_caches() -> dict[str, Callable[[], Any]]:
+    return {
+        "LRUCacheDict": lambda: LRUCacheDict(maxsize=1000),
+        "ByteLRUCache": lambda: ByteLRUCache(1 << 20, sizeof=len),
+        "ShardedCache": lambda: ShardedCache(1 << 20, sizeof=len, shards=16),
+    }
+
+
+def throughput(cache: Any, threads: int) -> float:
+    for key in HOT:
+        cache[key] = key.encode()
+    keys = [random.Random(n).choices(HOT, k=LOOKUPS) for n in range(threads)]
+    start = threading.Barrier(threads + 1)
+
+    def work(mine: list[str]) -> None:
+        get = cache.get
+        start.wait()
+        for key in mine:
+            get(key)
+
+    workers = [threading.Thread(target=work, args=(keys[n],)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * LOOKUPS / (time.perf_counter() - began)
+
+
+def main(max_threads: int = 32) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"cpus={os.cpu_count()} gil={'on' if gil else 'off'}  lookups per second (thousands)")
+    caches = make_caches()
+    print(f"{'threads':>8}" + "".join(f"{name:>15}" for name in caches))
+    threads = 1
+    while threads <= max_threads:
+        rates = [max(throughput(make(), threads) for _ in range(3)) for make in caches.values()]
+        print(f"{threads:>8}" + "".join(f"{rate / 1000:>15.0f}" for rate in rates))
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare emoji cache hit rates of the LRU and TinyLFU policies on traces.
+
+Run with ``uv run python benchmarks/bench_cache_policy.py [trace.txt ...]``.
+
+Each trace is replayed through a renderer's emoji cache, once per policy,
+and every miss is a fetch from the source. Three synthetic workloads are
+always run: a steady Zipf-distributed chat, the same chat where some
+messages spam bursts of rare emoji, and a chat whose popular emoji keep
+changing, the case that favours recency. Recorded workloads can be added
+as text files holding one message per line; the emoji and Discord emoji in
+each message are looked up in order.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import emoji
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji.helpers import NodeType, to_nodes
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (8, 8)).save(_PNG, format="PNG")
+
+CACHE_SIZE = 200
+
+
+class CountingSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetches = 0
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        self.fetches += 1
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> BytesIO:
+        self.fetches += 1
+        return BytesIO(_PNG.getvalue())
+
+
+def steady(size: int, seed: int = 0) -> list[str]:
+    """Draw emoji from a Zipf distribution, as in everyday chat."""
+    rng = random.Random(seed)
+    pool = rng.sample(sorted(emoji.EMOJI_DATA), 1000)
+    weights = [1 / rank for rank in range(1, len(pool) + 1)]
+    return rng.choices(pool, weights, k=size)
+
+
+def spammy(size: int, seed: int = 0) -> list[str]:
+    """Steady chat where every 2000 lookups a message spams 300 rare emoji."""
+    rng = random.Random(seed + 1)
+    every = sorted(emoji.EMOJI_DATA)
+    chat = steady(size, seed)
+    trace: list[str] = []
+    for start in range(0, size, 2000):
+        trace += chat[start : start + 2000]
+        trace += rng.sample(every, 300)
+    return trace
+
+
+def shifting(size: int, seed: int = 0) -> list[str]:
+    """Chat whose popular emoji change completely every 5000 lookups."""
+    trace: list[str] = []
+    for start in range(0, size, 5000):
+        trace += steady(5000, seed + start)
+    return trace
+
+
+def recorded(path: Path) -> list[str]:
+    """Extract the emoji of every message in a chat log, one message per line."""
+    trace: list[str] = []
+    for line in to_nodes(path.read_text(encoding="utf-8")):
+        for node in line:
+            if node.type is NodeType.emoji:
+                trace.append(node.content)
+            elif node.type is NodeType.discord_emoji:
+                trace.append(f"<:_:{node.content}>")
+    return trace
+
+
+def hit_rate(trace: list[str], policy: str) -> float:
+    source = CountingSource()
+    with Parmoji(Image.new("RGBA", (8, 8)), source=source, cache_size=CACHE_SIZE, cache_policy=policy) as renderer:
+        for key in trace:
+            if key.startswith("<"):
+                renderer._get_discord_emoji(int(key[5:-1]))
+            else:
+                renderer._get_emoji(key)
+    return 1 - source.fetches / len(trace)
+
+
+def main(paths: list[str]) -> None:
+    traces = {"steady": steady(40_000), "spam": spammy(40_000), "shifting": shifting(40_000)}
+    for path in map(Path, paths):
+        traces[path.name] = recorded(path)
+
+    print(f"cache_size={CACHE_SIZE}")
+    print(f"{'trace':<16}{'lookups':>9}{'distinct':>10}{'lru':>9}{'tinylfu':>9}")
+    for name, trace in traces.items():
+        if not trace:
+            continue
+        lru, tinylfu = hit_rate(trace, "lru"), hit_rate(trace, "tinylfu")
+        print(f"{name:<16}{len(trace):>9}{len(set(trace)):>10}{lru:>9.2%}{tinylfu:>9.2%}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""Measure emoji cache hit rate on text mixing qualification variants.
+
+Run with ``uv run python benchmarks/bench_canonical_keys.py``.
+
+Chat text often carries the same emoji with and without U+FE0F (``"☹"`` vs
+``"☹️"``). Each distinct key costs a source fetch and a cache slot, so the
+hit rate shows how well variants are collapsed.
+"""
+
+from __future__ import annotations
+
+import random
+from io import BytesIO
+
+import emoji
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (8, 8)).save(_PNG, format="PNG")
+
+
+class CountingSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetches = 0
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        self.fetches += 1
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def corpus(size: int, seed: int = 0) -> list[str]:
+    """Draw emoji that have unqualified variants, picking a random form each time."""
+    variants: dict[str, list[str]] = {}
+    for sequence in emoji.EMOJI_DATA:
+        variants.setdefault(sequence.replace("\ufe0f", ""), []).append(sequence)
+    mixed = [forms for forms in variants.values() if len(forms) > 1]
+    rng = random.Random(seed)
+    pool = rng.sample(mixed, 200)
+    return [rng.choice(rng.choice(pool)) for _ in range(size)]
+
+
+def main(size: int = 20_000) -> None:
+    lookups = corpus(size)
+    source = CountingSource()
+    with Parmoji(Image.new("RGBA", (8, 8)), source=source, cache_size=1000) as renderer:
+        for sequence in lookups:
+            renderer._get_emoji(sequence)
+    hit_rate = 1 - source.fetches / len(lookups)
+    print(f"lookups {len(lookups)}  distinct raw keys {len(set(lookups))}  fetches {source.fetches}")
+    print(f"hit rate {hit_rate:.2%}")
+
+
+if __name__ == "__main__":
+    main()
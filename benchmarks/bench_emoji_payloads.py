@@ -0,0 +1,82 @@
+"""Count memory allocated while serving cached emoji payloads.
+
+Run with ``uv run python benchmarks/bench_emoji_payloads.py``.
+
+Emoji fetched from a source are cached as encoded bytes, and every render
+that uses one gets a stream over them. The decoded tier is disabled here so
+each render goes through those streams. The table shows the bytes
+allocated per render and the time per stream handed out.
+"""
+
+from __future__ import annotations
+
+import threading
+import timeit
+import tracemalloc
+from io import BytesIO
+
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (160, 160), (255, 200, 0, 255)).save(_PNG, format="PNG", compress_level=0)
+
+TEXT = "👍 😂 ❤️ 🎉 🔥"
+
+
+class StaticSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def allocated_per_render(renderer: Parmoji, font: ImageFont.FreeTypeFont, renders: int) -> float:
+    tracemalloc.start()
+    try:
+        for _ in range(renders):
+            renderer.text((0, 0), TEXT, fill="white", font=font)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main(renders: int = 200, threads: int = 8) -> None:
+    font = ImageFont.load_default(size=18)
+    image = Image.new("RGBA", (240, 40), (0, 0, 0, 0))
+    print(f"payload: {len(_PNG.getvalue())} bytes, {len(TEXT.split())} emoji per render")
+
+    with Parmoji(image, source=StaticSource(), decoded_cache_bytes=0) as renderer:
+        renderer.text((0, 0), TEXT, fill="white", font=font)
+        peak = allocated_per_render(renderer, font, renders)
+        print(f"peak traced memory over {renders} renders: {peak / 1024:.1f} KiB")
+
+        number = 20_000
+        fetch = min(timeit.repeat(lambda: renderer._get_emoji("👍"), number=number, repeat=5))
+        print(f"stream per cached emoji: {fetch / number * 1e6:.2f} us")
+
+        streams = []
+
+        def grab() -> None:
+            streams.extend(renderer._get_emoji("👍") for _ in range(1000))
+
+        tracemalloc.start()
+        workers = [threading.Thread(target=grab) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{len(streams)} concurrent streams held: {current / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Count source fetches when many threads miss on the same new emoji at once.
+
+Run with ``uv run python benchmarks/bench_fetch_burst.py [threads]``.
+
+Each round, a burst of threads renders a caption holding emoji nobody has
+rendered yet, as happens when an emoji starts trending. The source takes
+50 ms per fetch, as a CDN round trip would. Threads that miss on the same
+emoji wait on one fetch, so each round should cost one fetch per emoji and
+about one round trip of wall time.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from io import BytesIO
+
+import emoji
+from PIL import Image, ImageFont
+
+from parmoji import EmojiRenderer
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (72, 72), (255, 200, 0, 255)).save(_PNG, format="PNG")
+
+ROUNDS = 5
+PER_CAPTION = 3
+# Pictographs from here on are single code points every source can fetch
+FIRST_PICTOGRAPH = 0x1F300
+
+
+class SlowSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        with self._lock:
+            self.fetches += 1
+        time.sleep(0.05)
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def main(threads: int = 32) -> None:
+    font = ImageFont.load_default(size=18)
+    fresh = iter(sorted(e for e in emoji.EMOJI_DATA if len(e) == 1 and ord(e) >= FIRST_PICTOGRAPH))
+    source = SlowSource()
+    print(f"threads={threads} emoji per caption={PER_CAPTION} fetch latency=50ms")
+    print(f"{'round':>6}{'fetches':>9}{'ms':>8}")
+    with EmojiRenderer(source=source) as renderer:
+        for n in range(ROUNDS):
+            caption = " ".join(next(fresh) for _ in range(PER_CAPTION))
+            start = threading.Barrier(threads + 1)
+
+            def work(text: str = caption, start: threading.Barrier = start) -> None:
+                start.wait()
+                with renderer.on(Image.new("RGBA", (200, 40))) as parmoji:
+                    parmoji.text((4, 4), text, fill="white", font=font)
+
+            workers = [threading.Thread(target=work) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            before = source.fetches
+            start.wait()
+            began = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - began
+            print(f"{n:>6}{source.fetches - before:>9}{elapsed * 1e3:>8.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,67 @@
+"""Benchmark the per-line cost of drawing text that contains emoji.
+
+Run with ``uv run python benchmarks/bench_line_offset.py``.
+
+Every line with emoji needs the offset Pillow applies to its ink, so the
+emoji can be pasted against it. The table shows the time per line to draw
+a label, next to the cost of reading that offset by rasterizing the line
+with ``getmask2`` and from the font's cached metrics.
+"""
+
+from __future__ import annotations
+
+import timeit
+from io import BytesIO
+
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.helpers import font_metrics
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (72, 72), (255, 200, 0, 255)).save(_PNG, format="PNG")
+
+LINES = {
+    "short": "ok 👍",
+    "label": "jay3332 😀 level 17 (top 5%)",
+    "long": "deploy finished 🚀 in 42s, 318 checks passed ✅, 2 flaky tests retried 🔁 on runner 7",
+}
+
+
+class StaticSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def main(number: int = 500) -> None:
+    font = ImageFont.load_default(size=18)
+    image = Image.new("RGBA", (900, 40), (0, 0, 0, 0))
+    metrics = font_metrics(font)
+
+    print(f"{'line':<8}{'text() us':>12}{'getmask2 us':>14}{'cached us':>12}")
+    with Parmoji(image, source=StaticSource()) as renderer:
+        for name, text in LINES.items():
+            renderer.text((10, 10), text, fill="white", font=font)
+            draw = min(
+                timeit.repeat(
+                    lambda t=text: renderer.text((10, 10), t, fill="white", font=font), number=number, repeat=5
+                )
+            )
+            # The line as drawn, with emoji replaced by placeholder spaces
+            line = renderer.layout(text, font).lines[0].text
+            mask = min(timeit.repeat(lambda t=line: font.getmask2(t, "L", anchor="la", ink=1), number=number, repeat=5))
+            cached = min(
+                timeit.repeat(lambda t=line: metrics.offset(t, mode="L", anchor="la"), number=number, repeat=5)
+            )
+            print(f"{name:<8}{draw / number * 1e6:>12.1f}{mask / number * 1e6:>14.1f}{cached / number * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark Parmoji.text on emoji-free input against plain Pillow.
+
+Run with ``uv run python benchmarks/bench_plain_text.py``.
+
+Emoji-free text should cost about the same as a direct ``ImageDraw.text``
+call, since Parmoji hands it straight to Pillow.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from PIL import Image, ImageDraw, ImageFont
+
+from parmoji import Parmoji
+
+LINES = {
+    "single line": "Status: all systems operational (42 checks)",
+    "three lines": "user: jay3332\nlevel: 17 (top 5%)\nlast seen: 2 minutes ago",
+}
+
+
+def main(number: int = 500) -> None:
+    font = ImageFont.load_default(size=16)
+    image = Image.new("RGBA", (480, 120), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    print(f"{'input':<14}{'pillow us':>12}{'parmoji us':>12}{'overhead':>10}")
+    with Parmoji(image, cache=False) as renderer:
+        for name, text in LINES.items():
+            pillow = min(
+                timeit.repeat(lambda t=text: draw.text((10, 10), t, fill="white", font=font), number=number, repeat=5)
+            )
+            parmoji = min(
+                timeit.repeat(
+                    lambda t=text: renderer.text((10, 10), t, fill="white", font=font), number=number, repeat=5
+                )
+            )
+            pillow_us = pillow / number * 1e6
+            parmoji_us = parmoji / number * 1e6
+            print(f"{name:<14}{pillow_us:>12.1f}{parmoji_us:>12.1f}{parmoji_us / pillow_us - 1:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
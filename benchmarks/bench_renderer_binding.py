@@ -0,0 +1,56 @@
+"""Measure the per-image cost of getting a renderer for an image.
+
+Run with ``uv run python benchmarks/bench_renderer_binding.py``.
+
+Compares a ``Parmoji`` created per image from a source class (the common
+pattern), one created per image around a reused source instance, and an
+``EmojiRenderer`` bound per image with ``on()``. The first table times
+only creating and closing the renderer; the second adds drawing one
+caption with emoji. No network is used.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from PIL import Image, ImageFont
+
+from parmoji import EmojiRenderer, Parmoji
+from parmoji.source import Twemoji
+
+TEXT = "plain caption without emoji"
+
+
+def main(number: int = 2000) -> None:
+    font = ImageFont.load_default(size=18)
+    image = Image.new("RGBA", (320, 40))
+    source = Twemoji()
+    renderer = EmojiRenderer(source=Twemoji)
+
+    def per_image_class(draw: bool) -> None:
+        with Parmoji(image, source=Twemoji) as parmoji:
+            if draw:
+                parmoji.text((4, 4), TEXT, fill="white", font=font)
+
+    def per_image_instance(draw: bool) -> None:
+        with Parmoji(image, source=source) as parmoji:
+            if draw:
+                parmoji.text((4, 4), TEXT, fill="white", font=font)
+
+    def bound(draw: bool) -> None:
+        with renderer.on(image) as parmoji:
+            if draw:
+                parmoji.text((4, 4), TEXT, fill="white", font=font)
+
+    cases = {"Parmoji(source=cls)": per_image_class, "Parmoji(source=obj)": per_image_instance, "on(image)": bound}
+    for draw in (False, True):
+        print("setup + close + text()" if draw else "setup + close")
+        for name, case in cases.items():
+            n = number // 10 if case is per_image_class else number
+            best = min(timeit.repeat(lambda c=case, d=draw: c(d), number=n, repeat=5))
+            print(f"  {name:<22}{best / n * 1e6:>10.1f} us")
+    renderer.close()
+
+
+if __name__ == "__main__":
+    main()
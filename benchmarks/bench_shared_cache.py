@@ -0,0 +1,62 @@
+"""Measure per-image renders when each image gets its own renderer.
+
+Run with ``uv run python benchmarks/bench_shared_cache.py``.
+
+A service typically creates one ``Parmoji`` per generated image. Without a
+shared cache every renderer starts cold: it fetches, decodes and resizes
+each emoji again. With ``emoji_cache=`` the renderers reuse what earlier
+ones cached. The source here serves PNGs from memory, so real CDN or disk
+sources gain more.
+"""
+
+from __future__ import annotations
+
+import time
+from io import BytesIO
+
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.cache import EmojiCache
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (72, 72), (255, 200, 0, 255)).save(_PNG, format="PNG")
+
+TEXT = "build 😀 passed ✅ in 42s 🚀\nreviewed by 👍 and ❤️"
+
+
+class StaticSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetches = 0
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        self.fetches += 1
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def per_image(images: int, emoji_cache: EmojiCache | None) -> tuple[float, int]:
+    font = ImageFont.load_default(size=18)
+    fetches = 0
+    began = time.perf_counter()
+    for _ in range(images):
+        source = StaticSource()
+        with Parmoji(Image.new("RGBA", (320, 60)), source=source, emoji_cache=emoji_cache) as renderer:
+            renderer.text((4, 4), TEXT, fill="white", font=font)
+        fetches += source.fetches
+    return (time.perf_counter() - began) / images, fetches
+
+
+def main(images: int = 300) -> None:
+    print(f"{'cache':<10}{'ms/image':>10}{'fetches':>10}")
+    for name, emoji_cache in (("per-image", None), ("shared", EmojiCache())):
+        elapsed, fetches = per_image(images, emoji_cache)
+        print(f"{name:<10}{elapsed * 1e3:>10.2f}{fetches:>10}")
+
+
+if __name__ == "__main__":
+    main()
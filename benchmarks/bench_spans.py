@@ -0,0 +1,47 @@
+"""Compare the memory held by ``to_nodes`` and ``parse_spans`` results.
+
+Run with ``uv run python benchmarks/bench_spans.py``.
+
+``to_nodes`` keeps one ``Node`` tuple and one content string per text run or
+emoji; ``parse_spans`` keeps three array columns of offsets into the source.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from parmoji.helpers import parse_spans, to_nodes
+
+CORPORA = {
+    "chat log (2k lines)": "\n".join(
+        f"user{i}: nice one 😀 👍🏽 <:blob:123456789012345678> see you" for i in range(2000)
+    ),
+    "emoji-dense (50k chars)": ("hi 😀 👍🏽 🇺🇸 👨‍👩‍👧 " * 2500)[:50_000],
+}
+
+
+def _measure(parse: Callable[[str], Any], text: str) -> Tuple[float, int]:
+    seconds = min(timeit.repeat(lambda: parse(text), number=1, repeat=3))
+    tracemalloc.start()
+    result = parse(text)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, retained
+
+
+def main() -> None:
+    print(f"{'corpus':<26}{'nodes KiB':>11}{'spans KiB':>11}{'nodes ms':>10}{'spans ms':>10}")
+    for name, text in CORPORA.items():
+        node_time, node_bytes = _measure(to_nodes, text)
+        span_time, span_bytes = _measure(parse_spans, text)
+        print(
+            f"{name:<26}{node_bytes / 1024:>11.0f}{span_bytes / 1024:>11.0f}"
+            f"{node_time * 1e3:>10.1f}{span_time * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
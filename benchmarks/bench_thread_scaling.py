@@ -0,0 +1,79 @@
+"""Measure how rendering throughput scales with threads in one process.
+
+Run with ``uv run python benchmarks/bench_thread_scaling.py [max_threads]``,
+ideally on a free-threaded build (``python3.13t``).
+
+A fixed number of captions is rendered by 1, 2, 4, ... threads sharing one
+``EmojiRenderer``, each thread binding it to its own images. With the GIL
+the threads take turns, so throughput stays flat; without it, it should
+grow with the cores available.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from io import BytesIO
+
+from PIL import Image, ImageFont
+
+from parmoji import EmojiRenderer
+from parmoji.source import BaseSource
+
+_PNG = BytesIO()
+Image.new("RGBA", (72, 72), (255, 200, 0, 255)).save(_PNG, format="PNG")
+
+TEXTS = ["build 😀 passed ✅ in 42s 🚀", "reviewed by 👍 and ❤️", "deploy 🎉 done 🔥"]
+RENDERS = 1200
+
+
+class StaticSource(BaseSource):
+    def __init__(self, disk_cache: bool = False) -> None:
+        super().__init__(disk_cache=False)
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        return BytesIO(_PNG.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+def throughput(renderer: EmojiRenderer, threads: int) -> float:
+    fonts = [ImageFont.load_default(size=size) for size in (14, 18, 22)]
+    start = threading.Barrier(threads + 1)
+
+    def work(count: int) -> None:
+        start.wait()
+        for i in range(count):
+            with renderer.on(Image.new("RGBA", (360, 40))) as parmoji:
+                parmoji.text((4, 4), TEXTS[i % len(TEXTS)], fill="white", font=fonts[i % len(fonts)])
+
+    workers = [threading.Thread(target=work, args=(RENDERS // threads,)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return RENDERS // threads * threads / (time.perf_counter() - began)
+
+
+def main(max_threads: int = 8) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]} cpus={os.cpu_count()} gil={'on' if gil else 'off'}")
+    print(f"{'threads':>8}{'renders/s':>12}{'speedup':>10}")
+    with EmojiRenderer(source=StaticSource, cache_shards=16) as renderer:
+        throughput(renderer, 1)  # warm the caches and font metrics
+        base = None
+        threads = 1
+        while threads <= max_threads:
+            rate = max(throughput(renderer, threads) for _ in range(3))
+            base = base or rate
+            print(f"{threads:>8}{rate:>12.0f}{rate / base:>10.2f}")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,56 @@
+"""Benchmark the trie tokenizer against the previous sliding-window scanner.
+
+Run with ``uv run python benchmarks/bench_tokenizer.py``.
+
+The legacy implementation is reproduced here verbatim so the comparison keeps
+working after it was removed from ``parmoji.helpers``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import List, Tuple
+
+from parmoji.helpers import DISCORD_EMOJI_PATTERN, find_emojis_in_text, is_emoji
+
+
+def legacy_find_emojis_in_text(text: str) -> List[Tuple[int, int, str]]:
+    """Sliding-window scanner that shipped before the trie tokenizer."""
+    emojis = []
+    i = 0
+    while i < len(text):
+        match = DISCORD_EMOJI_PATTERN.match(text, i)
+        if match:
+            emojis.append((match.start(), match.end(), match.group()))
+            i = match.end()
+            continue
+
+        for length in range(min(10, len(text) - i), 0, -1):
+            candidate = text[i : i + length]
+            if is_emoji(candidate):
+                emojis.append((i, i + length, candidate))
+                i += length
+                break
+        else:
+            i += 1
+
+    return emojis
+
+
+CORPORA = {
+    "ascii (10k chars)": ("The quick brown fox jumps over the lazy dog. " * 230)[:10_000],
+    "latin-1 prose (10k chars)": ("Café crème brûlée à la carte, naïve façade. " * 230)[:10_000],
+    "emoji-dense (10k chars)": ("hi 😀 👍🏽 🇺🇸 👨‍👩‍👧 <:blob:123456789012345678> " * 250)[:10_000],
+}
+
+
+def main(repeat: int = 5) -> None:
+    print(f"{'corpus':<28}{'legacy ms':>12}{'trie ms':>12}{'speedup':>10}")
+    for name, text in CORPORA.items():
+        legacy = min(timeit.repeat(lambda t=text: legacy_find_emojis_in_text(t), number=1, repeat=repeat))
+        trie = min(timeit.repeat(lambda t=text: find_emojis_in_text(t), number=1, repeat=repeat))
+        print(f"{name:<28}{legacy * 1e3:>12.2f}{trie * 1e3:>12.3f}{legacy / trie:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
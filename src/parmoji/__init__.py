@@ -1,12 +1,16 @@
-from . import helpers as helpers, source as source
-from .core import Parmoji as Parmoji
+from . import cache as cache, helpers as helpers, registry as registry, source as source
+from .core import EmojiRenderer as EmojiRenderer, Parmoji as Parmoji, TextLayout as TextLayout
 
 __version__ = "2.0.8"
 __author__ = "jay3332"
 
 __all__ = [
+    "EmojiRenderer",
     "Parmoji",
+    "TextLayout",
+    "cache",
     "helpers",
+    "registry",
     "source",
     "__version__",
     "__author__",
@@ -0,0 +1,713 @@
+"""In-memory caches shared by the renderer.
+
+This module provides:
+- `LRUCacheDict`, an entry-count bounded LRU used for fetched emoji payloads.
+- `ByteLRUCache`, an LRU bounded by the total size of its values in bytes,
+  used for decoded and resized emoji images, and for fetched payloads when
+  the renderer is given a byte budget.
+- `CacheStats`, a snapshot of a `ByteLRUCache`'s counters.
+- `FrequencySketch`, the approximate access counter behind the
+  ``"tinylfu"`` admission policy of `ByteLRUCache`.
+- `ShardedCache`, a `ByteLRUCache` split into hash-partitioned shards for
+  renderers shared by many threads.
+- `EmojiCache`, one budget for every emoji cache of many renderers, and
+  `shared_emoji_cache()`, an opt-in process-wide instance of it.
+- `SingleFlight`, which makes concurrent cache misses for one key share a
+  single fetch.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Callable, Dict, Hashable, Iterator, NamedTuple, Optional, Tuple, TypeVar
+
+from PIL import Image
+
+__all__ = (
+    "CACHE_POLICIES",
+    "ByteLRUCache",
+    "CacheStats",
+    "CacheView",
+    "EmojiCache",
+    "FrequencySketch",
+    "LRUCacheDict",
+    "ShardedCache",
+    "SingleFlight",
+    "image_nbytes",
+    "shared_emoji_cache",
+)
+
+CACHE_POLICIES: Tuple[str, ...] = ("lru", "tinylfu")
+
+_T = TypeVar("_T")
+
+_MASK64 = (1 << 64) - 1
+_SKETCH_DEPTH = 4
+# Each row is indexed by its own 16 bits of one 64-bit hash
+_SKETCH_MAX_WIDTH = 1 << 16
+_SKETCH_MIN_WIDTH = 64
+_SKETCH_MAX_COUNT = 15
+# Rough weight of a small entry, such as an emoji's (width, height)
+_SMALL_ENTRY_NBYTES = 64
+
+
+class LRUCacheDict(OrderedDict[Any, Any]):
+    """Simple LRU cache implementation using OrderedDict.
+
+    Every read and write, including membership tests and iteration, holds
+    the lock, so the cache stays consistent without the GIL. Iterating
+    walks a snapshot of the keys.
+
+    Note: Uses Any typing to avoid issues with external stubs and keep runtime behavior intact.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        super().__init__()
+        self.maxsize: int = maxsize
+        self._lock: threading.Lock = threading.Lock()
+
+    # The lock is not reentrant, so methods holding it only call the OrderedDict methods directly
+
+    def __setitem__(self, key: Any, value: Any) -> None:  # type: ignore[override]
+        with self._lock:
+            if super().__contains__(key):
+                # Move to end (most recently used)
+                self.move_to_end(key)
+            super().__setitem__(key, value)
+            if len(self) > self.maxsize:
+                # Remove least recently used
+                oldest = next(super().__iter__())
+                # Close BytesIO if it exists
+                val = super().__getitem__(oldest)
+                if hasattr(val, "close"):
+                    with suppress(Exception):
+                        val.close()  # type: ignore[call-arg]
+                super().__delitem__(oldest)
+
+    def __getitem__(self, key: Any) -> Any:  # type: ignore[override]
+        with self._lock:
+            value = super().__getitem__(key)
+            # Move to end (most recently used)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key: Any, default: Any = None) -> Any:  # type: ignore[override]
+        with self._lock:
+            if super().__contains__(key):
+                value = super().__getitem__(key)  # type: ignore[misc]
+                # Move to end (most recently used)
+                super().move_to_end(key)
+                return value
+            return default
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """Return the value for ``key`` without marking it as recently used, or ``default``."""
+        with self._lock:
+            return super().get(key, default)
+
+    def __delitem__(self, key: Any) -> None:  # type: ignore[override]
+        with self._lock:
+            super().__delitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """Return the size of an image's decoded pixels in bytes."""
+    return image.width * image.height * len(image.getbands())
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of a :class:`ByteLRUCache`'s counters.
+
+    Attributes
+    ----------
+    hits: int
+        Lookups that found a value.
+    misses: int
+        Lookups that found nothing.
+    evictions: int
+        Entries dropped to keep the cache within its budget.
+    rejections: int
+        New values the ``"tinylfu"`` policy declined to store because they
+        were requested less often than the entries they would displace.
+    entries: int
+        The number of cached values.
+    nbytes: int
+        The total size of the cached values, in bytes.
+    max_bytes: int
+        The budget, in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    rejections: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+class FrequencySketch:
+    """Approximate access counts for an unbounded set of keys.
+
+    A count-min sketch of four rows of 4-bit counters. Estimates never
+    undercount and rarely overcount. Once the sketch has recorded ten
+    accesses per counter column, every counter is halved, so popularity
+    that has faded is forgotten.
+
+    Parameters
+    ----------
+    width: int
+        Counters per row, rounded up to a power of two and capped at 65536.
+        Should be around the number of distinct keys the cache holds.
+        Defaults to 4096.
+    """
+
+    __slots__ = ("_counters", "_mask", "_width", "additions", "sample_size")
+
+    def __init__(self, width: int = 4096) -> None:
+        self._width: int = min(1 << max(1, (width - 1).bit_length()), _SKETCH_MAX_WIDTH)
+        self._mask: int = self._width - 1
+        self._counters: bytearray = bytearray(self._width * _SKETCH_DEPTH)
+        self.additions: int = 0
+        self.sample_size: int = 10 * self._width
+
+    @property
+    def width(self) -> int:
+        """Counters per row."""
+        return self._width
+
+    def _indexes(self, key: Hashable) -> Tuple[int, int, int, int]:
+        # Hashing a 1-tuple mixes the bits of keys such as ints, which hash to themselves
+        h = hash((key,)) & _MASK64
+        mask, width = self._mask, self._width
+        return (
+            h & mask,
+            width + ((h >> 16) & mask),
+            2 * width + ((h >> 32) & mask),
+            3 * width + ((h >> 48) & mask),
+        )
+
+    def increment(self, key: Hashable) -> None:
+        """Record one access to ``key``."""
+        counters = self._counters
+        for i in self._indexes(key):
+            if counters[i] < _SKETCH_MAX_COUNT:
+                counters[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Return the approximate number of recent accesses to ``key``."""
+        counters = self._counters
+        a, b, c, d = self._indexes(key)
+        return min(counters[a], counters[b], counters[c], counters[d])
+
+    def _age(self) -> None:
+        self._counters = bytearray(count >> 1 for count in self._counters)
+        self.additions //= 2
+
+
+class ByteLRUCache:
+    """A thread-safe LRU cache bounded by the total size of its values.
+
+    Each value is weighed once, when stored, and the least recently used
+    entries are evicted until the total fits the budget. A value larger than
+    the whole budget is not stored at all. Hits, misses and evictions are
+    counted, see :attr:`stats`.
+
+    Pure recency lets a burst of one-off keys flush a steady hot set. With
+    the ``"tinylfu"`` policy every lookup is also recorded in a
+    :class:`FrequencySketch`, and a new value that does not fit is only
+    stored if it was requested more often than each entry it would evict.
+    Otherwise it is rejected and the cache is left as it was. The sketch
+    grows with the number of entries, so popularity fades after about ten
+    lookups per cached entry and a changing hot set can still move in.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The budget, in bytes, for all values together.
+    sizeof: Callable[[Any], int]
+        Returns the size of a value in bytes. Defaults to
+        :func:`image_nbytes`, the decoded size of a Pillow image.
+    policy: str
+        ``"lru"`` (the default) or ``"tinylfu"``.
+    lock_free_reads: bool
+        Serve hits from :meth:`get` without waiting for the lock. Only safe
+        for values nobody mutates, such as ``bytes`` or emoji images. A hit
+        that finds the lock taken is returned without being counted or
+        marked as recently used. Defaults to `False`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = image_nbytes,
+        policy: str = "lru",
+        *,
+        lock_free_reads: bool = False,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"policy must be one of {CACHE_POLICIES}, not {policy!r}")
+
+        self.max_bytes: int = max_bytes
+        self._sizeof: Callable[[Any], int] = sizeof
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._nbytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.rejections: int = 0
+        self.policy: str = policy
+        self._sketch: Optional[FrequencySketch] = FrequencySketch(_SKETCH_MIN_WIDTH) if policy == "tinylfu" else None
+        self.lock_free_reads: bool = lock_free_reads
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached values, in bytes."""
+        return self._nbytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """A consistent snapshot of the cache's counters and size."""
+        with self._lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.rejections,
+                len(self._entries),
+                self._nbytes,
+                self.max_bytes,
+            )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it as recently used, or ``default``."""
+        if self.lock_free_reads:
+            # Dict lookups are atomic with or without the GIL, so a hit never queues on the lock
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._lock.acquire(blocking=False):
+                    # The key may have been evicted since the lookup
+                    self.hits += 1
+                    if self._sketch is not None:
+                        self._sketch.increment(key)
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                    self._lock.release()
+                return entry[0]
+
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key``, or ``default``, without counting or reordering anything."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return default if entry is None else entry[0]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            if size > self.max_bytes:
+                return
+            if old is None and self._sketch is not None and not self._admit(key, size):
+                self.rejections += 1
+                return
+            self._entries[key] = (value, size)
+            self._nbytes += size
+            if self._sketch is not None and len(self._entries) > self._sketch.width:
+                # Counts are dropped; popular keys earn them back within a sample
+                self._sketch = FrequencySketch(2 * len(self._entries))
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+                self.evictions += 1
+
+    def _admit(self, key: Hashable, size: int) -> bool:
+        # Only called with the lock held and a sketch in place
+        excess = self._nbytes + size - self.max_bytes
+        if excess <= 0:
+            return True
+
+        frequency = self._sketch.estimate(key)  # type: ignore[union-attr]
+        for victim, (_, victim_size) in self._entries.items():
+            if self._sketch.estimate(victim) >= frequency:  # type: ignore[union-attr]
+                return False
+            excess -= victim_size
+            if excess <= 0:
+                break
+        return True
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            _, size = self._entries.pop(key)
+            self._nbytes -= size
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def clear(self) -> None:
+        """Drop every cached value. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} entries={len(self)} bytes={self._nbytes}/{self.max_bytes}>"
+
+
+class ShardedCache:
+    """A :class:`ByteLRUCache` split into independently locked shards.
+
+    Keys are spread over the shards by hash, and each shard gets an equal
+    part of the budget, so threads looking up different keys rarely wait on
+    the same lock. Recency and admission are tracked per shard, which makes
+    eviction approximately, not strictly, least recently used.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The budget, in bytes, for all shards together.
+    sizeof: Callable[[Any], int]
+        Returns the size of a value in bytes. Defaults to
+        :func:`image_nbytes`.
+    policy: str
+        ``"lru"`` (the default) or ``"tinylfu"``, used by every shard.
+    shards: int
+        The number of shards, rounded up to a power of two. Defaults to 16.
+        Budgets too small to give every shard at least one byte get fewer
+        shards, so no shard is left unable to cache anything.
+    lock_free_reads: bool
+        Passed to every shard, see :class:`ByteLRUCache`. Defaults to `True`,
+        since the renderer only caches immutable values.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = image_nbytes,
+        policy: str = "lru",
+        *,
+        shards: int = 16,
+        lock_free_reads: bool = True,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+
+        count = 1 << (shards - 1).bit_length()
+        # A shard with no budget would silently cache nothing
+        count = min(count, 1 << max(max_bytes, 1).bit_length() - 1)
+        self._mask: int = count - 1
+        share, extra = divmod(max_bytes, count)
+        self._shards: Tuple[ByteLRUCache, ...] = tuple(
+            ByteLRUCache(share + (i < extra), sizeof, policy, lock_free_reads=lock_free_reads) for i in range(count)
+        )
+        self.policy: str = policy
+
+    def _shard(self, key: Hashable) -> ByteLRUCache:
+        return self._shards[hash(key) & self._mask]
+
+    @property
+    def shards(self) -> Tuple[ByteLRUCache, ...]:
+        """The shards, each a :class:`ByteLRUCache`."""
+        return self._shards
+
+    @property
+    def max_bytes(self) -> int:
+        """The budget of all shards together, in bytes."""
+        return sum(shard.max_bytes for shard in self._shards)
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached values, in bytes."""
+        return sum(shard.nbytes for shard in self._shards)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The shards' counters and sizes, added up."""
+        return CacheStats(*map(sum, zip(*(shard.stats for shard in self._shards), strict=True)))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it as recently used, or ``default``."""
+        return self._shards[hash(key) & self._mask].get(key, default)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key``, or ``default``, without counting or reordering anything."""
+        return self._shard(key).peek(key, default)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._shard(key)[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._shard(key)[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._shard(key)[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shard(key)  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for shard in self._shards for key in shard])
+
+    def clear(self) -> None:
+        """Drop every cached value. The counters are kept."""
+        for shard in self._shards:
+            shard.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} shards={len(self._shards)} entries={len(self)} "
+            f"bytes={self.nbytes}/{self.max_bytes}>"
+        )
+
+
+def _entry_nbytes(value: Any) -> int:
+    # Payloads, decoded or resized images, and (width, height) pairs
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, Image.Image):
+        return image_nbytes(value)
+    return _SMALL_ENTRY_NBYTES
+
+
+class CacheView:
+    """One namespace of a shared cache.
+
+    Behaves like a cache of its own, storing each key as
+    ``(namespace, key)`` in the underlying cache. Its :attr:`stats` are those
+    of the whole underlying cache.
+
+    Parameters
+    ----------
+    cache: Union[:class:`ByteLRUCache`, :class:`ShardedCache`]
+        The shared cache.
+    namespace: Hashable
+        Prefix that keeps this view's keys apart from every other view's.
+    """
+
+    __slots__ = ("_cache", "_namespace")
+
+    def __init__(self, cache: Any, namespace: Hashable) -> None:
+        self._cache: Any = cache
+        self._namespace: Hashable = namespace
+
+    @property
+    def stats(self) -> CacheStats:
+        """The underlying cache's counters and size."""
+        return self._cache.stats
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it as recently used, or ``default``."""
+        return self._cache.get((self._namespace, key), default)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key``, or ``default``, without counting or reordering anything."""
+        return self._cache.peek((self._namespace, key), default)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._cache[(self._namespace, key)]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._cache[(self._namespace, key)] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._cache[(self._namespace, key)]
+
+    def __contains__(self, key: object) -> bool:
+        return (self._namespace, key) in self._cache
+
+    def __iter__(self) -> Iterator[Hashable]:
+        namespace = self._namespace
+        return iter([key for prefix, key in self._cache if prefix == namespace])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} namespace={self._namespace!r} of {self._cache!r}>"
+
+
+class _Flight:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one.
+
+    While a call for a key is running, other threads calling :meth:`do` with
+    that key wait for it and get its result, or its exception, instead of
+    running their own. Results are shared, so they should be immutable,
+    such as ``bytes``. Once the call finishes the key is forgotten; caching
+    the result is up to the caller.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        """Return ``fn()``, unless a call for ``key`` is in flight, then wait for its result."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+class EmojiCache:
+    """Emoji caches that many :class:`~.Parmoji` renderers share.
+
+    Pass one to ``Parmoji(emoji_cache=...)`` so renderers created per image
+    start with the payloads, decoded and resized emoji earlier renderers
+    cached, instead of cold. Every kind of entry counts against one budget,
+    evicted by one policy. Renderers only share entries when they use the
+    same kind of source and custom emoji registry, see
+    :attr:`~.BaseSource.cache_key`.
+
+    This class is thread-safe, and hits never wait for a lock since every
+    cached value is immutable.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The budget, in bytes, for all cached emoji. Defaults to 64 MiB.
+    policy: str
+        ``"lru"`` (the default) or ``"tinylfu"``, see :class:`ByteLRUCache`.
+    shards: int
+        Split the cache into this many shards, see :class:`ShardedCache`.
+        Defaults to `1`, unsharded.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, *, policy: str = "lru", shards: int = 1) -> None:
+        self._cache: Any
+        if shards > 1:
+            self._cache = ShardedCache(max_bytes, _entry_nbytes, policy, shards=shards)
+        else:
+            self._cache = ByteLRUCache(max_bytes, _entry_nbytes, policy, lock_free_reads=True)
+        # Misses from every renderer sharing this cache coalesce into one fetch per emoji
+        self.inflight: SingleFlight = SingleFlight()
+
+    def view(self, namespace: Hashable) -> CacheView:
+        """Return a view that keeps its keys apart from other namespaces."""
+        return CacheView(self._cache, namespace)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The cache's counters and size."""
+        return self._cache.stats
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached values, in bytes."""
+        return self._cache.nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        """The budget, in bytes."""
+        return self._cache.max_bytes
+
+    def clear(self) -> None:
+        """Drop every cached emoji, for every renderer. The counters are kept."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} entries={len(self)} bytes={self.nbytes}/{self.max_bytes}>"
+
+
+_shared_emoji_cache: Optional[EmojiCache] = None
+_shared_emoji_cache_lock = threading.Lock()
+
+
+def shared_emoji_cache() -> EmojiCache:
+    """Return the process-wide :class:`EmojiCache`, created on first use.
+
+    Renderers only use it when passed ``Parmoji(emoji_cache=shared_emoji_cache())``.
+    """
+    global _shared_emoji_cache  # noqa: PLW0603
+    # Locked, so racing first calls can't each create their own
+    with _shared_emoji_cache_lock:
+        if _shared_emoji_cache is None:
+            _shared_emoji_cache = EmojiCache()
+        return _shared_emoji_cache
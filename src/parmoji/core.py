@@ -10,12 +10,28 @@ from __future__ import annotations
 
 import logging
 import math
-import threading
-from collections import OrderedDict
+import re
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, SupportsInt, Tuple, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    SupportsInt,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import PIL
 from PIL import Image, ImageDraw, ImageFont
@@ -25,7 +41,28 @@ try:
 except Exception:  # pragma: no cover - requests optional at runtime
     Session = None  # type: ignore[assignment]
 
-from .helpers import NodeType, getsize, to_nodes
+from .cache import (
+    ByteLRUCache,
+    CacheStats,
+    CacheView,
+    EmojiCache,
+    LRUCacheDict,
+    ShardedCache,
+    SingleFlight,
+    image_nbytes,
+)
+from .helpers import (
+    FontMetrics,
+    NodeType,
+    ParseCache,
+    ParsedText,
+    canonical_emoji,
+    default_font,
+    font_metrics,
+    getsize,
+    iter_nodes,
+)
+from .registry import CustomEmojiRegistry
 from .source import BaseSource, HTTPBasedSource, Twemoji, _has_requests
 
 logger = logging.getLogger(__name__)
@@ -57,58 +94,133 @@ else:
 
 ColorT = Optional[ColorBaseT]
 
+# An emoji as fetched for layout: decoded when cached, otherwise its encoded image
+_Asset = Union[Image.Image, BytesIO]
+_ByteCache = Union[ByteLRUCache, ShardedCache, CacheView]
+_PayloadCache = Union[LRUCacheDict, ByteLRUCache, ShardedCache, CacheView]
+
+
+def _one(_value: Any) -> int:
+    return 1
+
 
 P = TypeVar("P", bound="Parmoji")
+_T = TypeVar("_T")
 
-__all__ = ("Parmoji",)
+__all__ = ("EmojiRenderer", "Parmoji", "TextLayout", "LayoutLine", "LayoutEmoji")
 
 # Module-level constants for small magic values
 ANCHOR_LEN: int = 2
 
+# ASCII text can only contain emoji as Discord tags. Line separators other than
+# "\n" are excluded too, since Pillow splits lines on "\n" alone.
+_NOT_PLAIN_TEXT_PATTERN: re.Pattern[str] = re.compile(r"[<\r\x0b\x0c\x1c-\x1e]")
+
+# Layouts are measured as if drawn this far from the image origin, so Pillow's
+# truncation of coordinates matches drawing at any whole-pixel xy on the image
+_LAYOUT_ORIGIN: int = 1 << 16
+
+
+def _round_half_up(value: float) -> int:
+    # Unlike round(), moving value by whole pixels moves the result by as many
+    return math.floor(value + 0.5)
+
+
+class LayoutEmoji(NamedTuple):
+    """An emoji placed on a :class:`~.LayoutLine`.
+
+    Attributes
+    ----------
+    x: int
+        Horizontal distance from the start of the line's ink, before the
+        emoji position offset is applied.
+    image: :class:`PIL.Image.Image`
+        The resized RGBA emoji image that gets pasted.
+    """
+
+    x: int
+    image: Image.Image
+
+
+class LayoutLine(NamedTuple):
+    """One measured line of a :class:`~.TextLayout`.
+
+    Attributes
+    ----------
+    text: str
+        The line as drawn by Pillow, with each emoji replaced by placeholder spaces.
+    width: int
+        The advance width of :attr:`text`.
+    x: float
+        Horizontal position of the line relative to ``xy``, after anchor and alignment.
+    y: float
+        Vertical position of the line relative to ``xy``.
+    origin: Tuple[float, float]
+        Where the line's ink starts relative to ``xy``, for whole-pixel ``xy``.
+    emojis: Tuple[:class:`~.LayoutEmoji`, ...]
+        The line's emoji, from left to right.
+    """
+
+    text: str
+    width: int
+    x: float
+    y: float
+    origin: Tuple[float, float]
+    emojis: Tuple[LayoutEmoji, ...]
+
+
+@dataclass(frozen=True)
+class TextLayout:
+    """An immutable, fully measured text layout.
 
-class LRUCacheDict(OrderedDict[Any, Any]):
-    """Simple LRU cache implementation using OrderedDict.
+    Created by :meth:`Parmoji.layout`, which parses the text, fetches and
+    resizes every emoji and measures every line once. Pass it to
+    :meth:`Parmoji.draw_layout` to draw it any number of times, onto any
+    image, without repeating that work.
 
-    Note: Uses Any typing to avoid issues with external stubs and keep runtime behavior intact.
+    Attributes
+    ----------
+    lines: Tuple[:class:`~.LayoutLine`, ...]
+        The laid out lines.
+    bbox: Tuple[int, int, int, int]
+        The bounding box of all drawn text and emoji, relative to ``xy``.
+    font
+        The font the layout was measured with.
+
+    The remaining attributes record the options passed to :meth:`Parmoji.layout`.
     """
 
-    def __init__(self, maxsize: int = 1000) -> None:
-        super().__init__()
-        self.maxsize: int = maxsize
-        self._lock: threading.Lock = threading.Lock()
-
-    def __setitem__(self, key: Any, value: Any) -> None:  # type: ignore[override]
-        with self._lock:
-            if key in self:
-                # Move to end (most recently used)
-                self.move_to_end(key)
-            super().__setitem__(key, value)
-            if len(self) > self.maxsize:
-                # Remove least recently used
-                oldest = next(iter(self))
-                # Close BytesIO if it exists
-                val = super().__getitem__(oldest)
-                if hasattr(val, "close"):
-                    with suppress(Exception):
-                        val.close()  # type: ignore[call-arg]
-                del self[oldest]
-
-    def __getitem__(self, key: Any) -> Any:  # type: ignore[override]
-        with self._lock:
-            value = super().__getitem__(key)
-            # Move to end (most recently used)
-            self.move_to_end(key)
-            return value
-
-    def get(self, key: Any, default: Any = None) -> Any:  # type: ignore[override]
-        # Avoid calling __getitem__ while holding the lock (would deadlock)
-        with self._lock:
-            if key in self:
-                value = super().__getitem__(key)  # type: ignore[misc]
-                # Move to end (most recently used)
-                super().move_to_end(key)
-                return value
-            return default
+    lines: Tuple[LayoutLine, ...]
+    bbox: Tuple[int, int, int, int]
+    font: FontT
+    anchor: str
+    spacing: int
+    node_spacing: int
+    align: str
+    direction: Optional[str]
+    features: Optional[Tuple[str, ...]]
+    language: Optional[str]
+    stroke_width: int
+    embedded_color: bool
+    emoji_scale_factor: float
+    emoji_position_offset: Tuple[int, int]
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """The width and height of :attr:`bbox`."""
+        left, top, right, bottom = self.bbox
+        return right - left, bottom - top
+
+    def emoji_boxes(self) -> List[Tuple[int, int, int, int]]:
+        """Return the box each emoji is pasted into, relative to ``xy``."""
+        ox, oy = self.emoji_position_offset
+        boxes = []
+        for line in self.lines:
+            left, top = line.origin
+            for placed in line.emojis:
+                x, y = _round_half_up(left + placed.x + ox), _round_half_up(top + oy)
+                boxes.append((x, y, x + placed.image.width, y + placed.image.height))
+        return boxes
 
 
 class Parmoji:
@@ -129,6 +241,37 @@ class Parmoji:
         Enabling this is recommended and by default.
     cache_size: int
         Maximum number of cached emojis (default 1000).
+    cache_bytes: Optional[int]
+        Budget, in bytes, for the encoded emoji and Discord emoji fetched
+        from the source, which then share one cache weighed by payload size
+        instead of ``cache_size``. Together with ``image_cache_bytes`` and
+        ``decoded_cache_bytes`` this caps the renderer's cache memory.
+        Defaults to `None`, counting entries.
+    cache_policy: str
+        How the emoji caches choose what to keep. ``"lru"`` (the default)
+        keeps the most recently used. ``"tinylfu"`` only lets a new emoji
+        displace entries that were requested less often, so a message full
+        of rare emoji can't flush the steady hot set.
+    cache_shards: int
+        Split every emoji cache into this many independently locked shards,
+        whose hits skip the lock entirely, for renderers used by many
+        threads at once. Eviction is then least recently used per shard.
+        Caches whose budget can't give every shard room get fewer shards.
+        Defaults to `1`, unsharded.
+    emoji_cache: Optional[:class:`~.EmojiCache`]
+        A cache shared with other renderers, such as
+        :func:`~.cache.shared_emoji_cache`, used for every emoji cache
+        instead of this renderer's own. It is kept warm across renderers
+        and through :meth:`close`, under its own budget and policy, so
+        the other cache options are ignored. Defaults to `None`.
+    image_cache_bytes: int
+        Budget, in bytes of decoded pixels, for emoji resized to the sizes
+        they are drawn at. The least recently used are evicted first.
+        Defaults to 32 MiB.
+    decoded_cache_bytes: int
+        Budget, in bytes of decoded pixels, for emoji decoded at their
+        original size, so cached emoji are never decoded twice. Only used
+        when ``cache`` is enabled. Defaults to 32 MiB.
     draw: :class:`PIL.ImageDraw.ImageDraw`
         The drawing instance to use. If left unfilled,
         a new drawing instance will be created.
@@ -142,6 +285,16 @@ class Parmoji:
     disk_cache: bool
         Whether or not to permanently cache cdn-fetched emojis to disk,
         defaults to `False` but can greatly improve speed in certain cases.
+    parse_cache: Optional[:class:`~.ParseCache`]
+        A parse cache used to memoize parsed lines across calls. Useful when
+        the same captions are rendered repeatedly. Defaults to `None` (off).
+    shortcodes: bool
+        Whether to render ``:name:`` shortcodes such as ``:thumbsup:`` as
+        emoji, alongside Unicode and Discord emoji. Defaults to `False`.
+    custom_emoji: Optional[:class:`~.CustomEmojiRegistry`]
+        A registry of custom emoji to render from local files or bytes when
+        written as ``:name:``. Registered names take precedence over
+        shortcodes. Defaults to `None`.
     """
 
     def __init__(  # noqa: PLR0913 - public API mirrors Pillow + extras
@@ -151,11 +304,20 @@ class Parmoji:
         source: Union[BaseSource, Type[BaseSource]] = Twemoji,
         cache: bool = True,
         cache_size: int = 1000,
+        cache_bytes: Optional[int] = None,
+        cache_policy: str = "lru",
+        cache_shards: int = 1,
+        emoji_cache: Optional[EmojiCache] = None,
+        image_cache_bytes: int = 32 * 1024 * 1024,
+        decoded_cache_bytes: int = 32 * 1024 * 1024,
         draw: Optional[ImageDraw.ImageDraw] = None,
         render_discord_emoji: bool = True,
         emoji_scale_factor: float = 1.0,
         emoji_position_offset: Tuple[int, int] = (0, 0),
         disk_cache: bool = False,
+        parse_cache: Optional[ParseCache] = None,
+        shortcodes: bool = False,
+        custom_emoji: Optional[CustomEmojiRegistry] = None,
     ) -> None:
         self.image: Image.Image = image
         self.draw: Optional[ImageDraw.ImageDraw] = draw
@@ -173,20 +335,51 @@ class Parmoji:
 
         self._cache: bool = cache
         self._cache_size: int = cache_size
+        self._cache_bytes: Optional[int] = cache_bytes
+        self._cache_policy: str = cache_policy
+        self._cache_shards: int = cache_shards
+        self._parse_cache: Optional[ParseCache] = parse_cache
+        self._shortcodes: bool = shortcodes
+        self._custom_emoji: Optional[CustomEmojiRegistry] = custom_emoji
         self._closed: bool = False
         self._new_draw: bool = False
+        # Renderers bound by EmojiRenderer.on() share the source and caches
+        self._owns_resources: bool = True
 
         self._render_discord_emoji: bool = render_discord_emoji
         self._default_emoji_scale_factor: float = emoji_scale_factor
         self._default_emoji_position_offset: Tuple[int, int] = emoji_position_offset
 
-        # Use LRU cache with size limit to prevent memory leaks
-        self._emoji_cache: LRUCacheDict = LRUCacheDict(maxsize=cache_size)
-        self._discord_emoji_cache: LRUCacheDict = LRUCacheDict(maxsize=cache_size // 2)
-
-        # Cache for processed images to avoid double processing
-        self._processed_image_cache: Dict[str, Image.Image] = {}
-        self._cache_lock = threading.Lock()
+        self._emoji_cache: _PayloadCache
+        self._discord_emoji_cache: _PayloadCache
+        self._decoded_cache: _ByteCache
+        self._processed_image_cache: _ByteCache
+        self._emoji_sizes: Union[LRUCacheDict, CacheView]
+        self._shared_cache: Optional[EmojiCache] = emoji_cache
+
+        # Concurrent misses for one emoji wait on a single fetch
+        self._inflight: SingleFlight
+        self._inflight_namespace: Hashable = None
+
+        if emoji_cache is None:
+            self._inflight = SingleFlight()
+            # Use LRU cache with size limit to prevent memory leaks
+            self._reset_payload_caches()
+            # Decoded RGBA emoji at their original size, keyed by asset key
+            self._decoded_cache = self._new_cache(decoded_cache_bytes)
+            # Resized emoji keyed by (asset key, width, height, resample filter)
+            self._processed_image_cache = self._new_cache(image_cache_bytes)
+            # Original (width, height) of each emoji, so measuring never needs a decode
+            self._emoji_sizes = LRUCacheDict(maxsize=cache_size)
+        else:
+            # Custom emoji names are only unique within a registry
+            namespace = (source.cache_key, custom_emoji)
+            self._inflight = emoji_cache.inflight
+            self._inflight_namespace = namespace
+            self._emoji_cache = self._discord_emoji_cache = emoji_cache.view(("payload", namespace))
+            self._decoded_cache = emoji_cache.view(("decoded", namespace))
+            self._processed_image_cache = emoji_cache.view(("resized", namespace))
+            self._emoji_sizes = emoji_cache.view(("size", namespace))
 
         self._create_draw()
 
@@ -202,7 +395,7 @@ class Parmoji:
         if not self._closed:
             raise ValueError("Renderer is already open.")
 
-        if _has_requests and isinstance(self.source, HTTPBasedSource) and Session is not None:
+        if self._owns_resources and _has_requests and isinstance(self.source, HTTPBasedSource) and Session is not None:
             self.source._requests_session = Session()  # type: ignore[misc]
 
         self._create_draw()
@@ -226,68 +419,127 @@ class Parmoji:
             del self.draw
             self.draw = None
 
-        if isinstance(self.source, HTTPBasedSource):
-            # Use the source's close method which handles httpx/requests properly
-            self.source.close()
+        if self._owns_resources:
+            if isinstance(self.source, HTTPBasedSource):
+                # Use the source's close method which handles httpx/requests properly
+                self.source.close()
 
-        if self._cache:
-            for stream in self._emoji_cache.values():
-                stream.close()
+            if self._cache and self._shared_cache is None:
+                self._reset_payload_caches()
 
-            for stream in self._discord_emoji_cache.values():
-                stream.close()
+        self._closed = True
 
+    def _bind(self: P, image: Image.Image, draw: Optional[ImageDraw.ImageDraw] = None) -> P:
+        """Return a renderer for ``image`` that shares this one's source and caches without owning them."""
+        bound = object.__new__(type(self))
+        bound.__dict__.update(self.__dict__)
+        bound.image = image
+        bound.draw = draw
+        bound._new_draw = False
+        bound._closed = False
+        bound._owns_resources = False
+        bound._create_draw()
+        return bound
+
+    def _new_cache(self, max_bytes: int, sizeof: Callable[[Any], int] = image_nbytes) -> _ByteCache:
+        if self._cache_shards > 1:
+            return ShardedCache(max_bytes, sizeof, self._cache_policy, shards=self._cache_shards)
+        return ByteLRUCache(max_bytes, sizeof, self._cache_policy)
+
+    def _reset_payload_caches(self) -> None:
+        if self._cache_bytes is not None:
+            # One budget for both; Discord IDs are ints, so keys never collide
+            self._emoji_cache = self._discord_emoji_cache = self._new_cache(self._cache_bytes, len)
+        elif self._cache_policy == "lru" and self._cache_shards == 1:
             self._emoji_cache = LRUCacheDict(maxsize=self._cache_size)
             self._discord_emoji_cache = LRUCacheDict(maxsize=max(1, self._cache_size // 2))
-
-        self._closed = True
+        else:
+            # Every entry weighs one, so the budget is an entry count
+            self._emoji_cache = self._new_cache(self._cache_size, _one)
+            self._discord_emoji_cache = self._new_cache(max(1, self._cache_size // 2), _one)
+
+    @property
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Counters and sizes of the renderer's byte-budgeted caches.
+
+        The keys are ``"decoded"`` and ``"resized"`` for the decoded and
+        resized emoji tiers, plus ``"payloads"`` when ``cache_bytes`` is set,
+        or ``"emoji"`` and ``"discord"`` when only ``cache_policy`` or
+        ``cache_shards`` is. With a shared ``emoji_cache``, the only key is
+        ``"shared"``.
+        """
+        if self._shared_cache is not None:
+            return {"shared": self._shared_cache.stats}
+
+        stats = {"decoded": self._decoded_cache.stats, "resized": self._processed_image_cache.stats}
+        if self._emoji_cache is self._discord_emoji_cache:
+            stats["payloads"] = self._emoji_cache.stats  # type: ignore[union-attr]
+        else:
+            for name, cache in (("emoji", self._emoji_cache), ("discord", self._discord_emoji_cache)):
+                if isinstance(cache, (ByteLRUCache, ShardedCache)):
+                    stats[name] = cache.stats
+        return stats
 
     def _create_draw(self) -> None:
         if self.draw is None:
             self._new_draw = True
             self.draw = ImageDraw.Draw(self.image)
 
+    def _cached_stream(
+        self, cache: _PayloadCache, key: Hashable, fetch: Callable[[], Optional[BytesIO]]
+    ) -> Optional[BytesIO]:
+        """Return a stream over an emoji's payload, fetching and caching it on a miss.
+
+        Payloads are cached as immutable ``bytes``. A ``BytesIO`` created from
+        bytes shares them until it is written to, so every stream handed out
+        reads the one cached buffer without copying it or taking a lock.
+
+        Threads that miss on the same key at once wait for a single fetch
+        and share its payload.
+        """
+        if not self._cache:
+            return fetch()
+
+        payload = cache.get(key)
+        if payload is None:
+
+            def load() -> Optional[bytes]:
+                # A fetch that finished since our miss may have cached it; peek, as the miss is counted
+                cached = cache.peek(key)
+                if cached is not None:
+                    return cached
+                stream = fetch()
+                if not stream:
+                    return None
+                if isinstance(stream, BytesIO):
+                    # Shares the stream's buffer instead of copying it
+                    fetched = stream.getvalue()
+                else:
+                    stream.seek(0)
+                    fetched = stream.read()
+                cache[key] = fetched
+                return fetched
+
+            payload = self._inflight.do((self._inflight_namespace, key), load)
+            if payload is None:
+                return None
+        return BytesIO(payload)
+
     def _get_emoji(self, emoji: str, /) -> Optional[BytesIO]:
-        if self._cache:
-            cached = self._emoji_cache.get(emoji)
-            if cached:
-                # Create a new BytesIO copy to avoid thread issues
-                with self._cache_lock:
-                    cached.seek(0)
-                    return BytesIO(cached.read())
-
-        stream = self.source.get_emoji(emoji)
-        if stream:
-            if self._cache:
-                # Store a copy in cache
-                stream.seek(0)
-                cache_copy = BytesIO(stream.read())
-                self._emoji_cache[emoji] = cache_copy
-                stream.seek(0)
-            return stream
-        return None
+        # Qualification variants of one emoji share a cache entry and a fetch
+        emoji = canonical_emoji(emoji)
+        return self._cached_stream(self._emoji_cache, emoji, lambda: self.source.get_emoji(emoji))
 
     def _get_discord_emoji(self, emoji_id: SupportsInt, /) -> Optional[BytesIO]:
         emoji_id = int(emoji_id)
+        return self._cached_stream(self._discord_emoji_cache, emoji_id, lambda: self.source.get_discord_emoji(emoji_id))
 
-        if self._cache:
-            cached = self._discord_emoji_cache.get(emoji_id)
-            if cached:
-                # Create a new BytesIO copy to avoid thread issues
-                with self._cache_lock:
-                    cached.seek(0)
-                    return BytesIO(cached.read())
-
-        stream = self.source.get_discord_emoji(emoji_id)
-        if stream:
-            if self._cache:
-                # Store a copy in cache
-                stream.seek(0)
-                cache_copy = BytesIO(stream.read())
-                self._discord_emoji_cache[emoji_id] = cache_copy
-                stream.seek(0)
-            return stream
-        return None
+    def _get_custom_emoji(self, name: str, /) -> Optional[BytesIO]:
+        registry = self._custom_emoji
+        if registry is None:
+            return None
+
+        return self._cached_stream(self._emoji_cache, self._custom_emoji_key(name), lambda: registry.get(name))
 
     # This helper mirrors Pillow's removed multiline spacing logic (Pillow ≥11.2).
     # Implementation derived from Pillow; see license:
@@ -299,18 +551,24 @@ class Parmoji:
         stroke_width: float,
     ) -> float:
         assert self.draw is not None
-        return self.draw.textbbox((0, 0), "A", font, stroke_width=stroke_width)[3] + stroke_width + spacing
+        return font_metrics(font).line_height(self.draw, stroke_width) + stroke_width + spacing
 
     def getsize(
-        self, text: str, font: Optional[FontT] = None, *, spacing: int = 4, emoji_scale_factor: Optional[float] = None
+        self,
+        text: Union[str, TextIO, ParsedText],
+        font: Optional[FontT] = None,
+        *,
+        spacing: int = 4,
+        emoji_scale_factor: Optional[float] = None,
     ) -> Tuple[int, int]:
         """Return the width and height of the text when rendered.
         This method supports multiline text.
 
         Parameters
         ----------
-        text: str
-            The text to use.
+        text: Union[str, TextIO, :class:`~.ParsedText`]
+            The text to use, a text file object to measure line by line, or
+            text already parsed with :func:`~.parse_spans`.
         font
             The font of the text.
         spacing: int
@@ -323,12 +581,20 @@ class Parmoji:
         if emoji_scale_factor is None:
             emoji_scale_factor = self._default_emoji_scale_factor
 
-        return getsize(text, font, spacing=spacing, emoji_scale_factor=emoji_scale_factor)
+        return getsize(
+            text,
+            font,
+            spacing=spacing,
+            emoji_scale_factor=emoji_scale_factor,
+            cache=self._parse_cache,
+            shortcodes=self._shortcodes,
+            registry=self._custom_emoji,
+        )
 
     def text(  # noqa: PLR0913 - public API mirrors Pillow's ImageDraw.text
         self,
         xy: Tuple[int, int],
-        text: str,
+        text: Union[str, TextIO, ParsedText],
         fill: ColorT = None,
         font: Optional[FontT] = None,
         anchor: Optional[str] = None,
@@ -362,8 +628,12 @@ class Parmoji:
         ----------
         xy: Tuple[int, int]
             The position to render the text at.
-        text: str
-            The text to render.
+        text: Union[str, TextIO, :class:`~.ParsedText`]
+            The text to render, a text file object, or text already parsed
+            with :func:`~.parse_spans`. Left-aligned text with an
+            ascender/baseline anchor is parsed, laid out and drawn one line
+            at a time, so memory stays flat however long the input is.
+            File input is always treated as multiline.
         fill
             The fill color of the text.
         font
@@ -384,7 +654,33 @@ class Parmoji:
         font, emoji_scale_factor, emoji_position_offset, draw = self._prepare_text_params(
             font, emoji_scale_factor, emoji_position_offset
         )
-        anchor = self._validate_anchor_and_direction(anchor, direction, text)
+        source = text.text if isinstance(text, ParsedText) else text
+        anchor = self._validate_anchor_and_direction(anchor, direction, source if isinstance(source, str) else "\n")
+
+        # Emoji-free text needs no parsing, fetching or offsets: hand it to Pillow as-is
+        if (
+            isinstance(source, str)
+            and not self._may_hold_emoji_tokens(text)
+            and self._is_plain_text(source, anchor, align)
+        ):
+            draw.text(
+                xy,
+                source,
+                *args,
+                fill=fill,
+                font=font,
+                anchor=anchor,
+                spacing=spacing,
+                align=align,
+                direction=direction,
+                features=features,
+                language=language,
+                stroke_width=stroke_width,
+                stroke_fill=stroke_fill,
+                embedded_color=embedded_color,
+                **kwargs,
+            )
+            return
 
         # Bundle rendering parameters into a context object to minimize arg counts
         ctx = _RenderCtx(
@@ -409,55 +705,320 @@ class Parmoji:
             ink=self._resolve_ink(draw, fill),
         )
 
-        # Layout: split into nodes and precompute per-line placeholders/widths
-        nodes = to_nodes(text)
+        # Layout: parse and lay out lines lazily so large inputs stream through
         line_spacing = self._multiline_spacing(font, spacing, stroke_width)
-        nodes_line_to_print, widths, max_width, streams = self._build_lines(nodes=nodes, ctx=ctx)
+        space_text_length = self._space_width(ctx)
+        lines: Iterable[_LineLayout] = (
+            self._layout_line(line, space_text_length, ctx)
+            for line in iter_nodes(
+                text, cache=self._parse_cache, shortcodes=self._shortcodes, registry=self._custom_emoji
+            )
+        )
 
-        # Anchor-adjust initial y for multi-line text
         x, y = xy
         original_x = x
-        y = self._adjust_y_for_anchor(y, anchor, len(nodes), line_spacing)
-
-        # Draw each line once; then paste emoji and advance
-        for node_id, line in enumerate(nodes):
-            x_line = self._aligned_x(original_x, anchor, align, max_width - widths[node_id])
-
-            # Draw the plain-text line (with emoji placeholders)
-            line_text = nodes_line_to_print[node_id]
-            if line_text:
-                ctx.draw.text(
-                    (x_line, y),
-                    line_text,
-                    *ctx.args,
-                    fill=ctx.fill,
-                    font=ctx.font,
-                    anchor=ctx.anchor,
-                    spacing=ctx.spacing,
-                    align=ctx.align,
-                    direction=ctx.direction,
-                    features=ctx.features,
-                    language=ctx.language,
-                    stroke_width=ctx.stroke_width,
-                    stroke_fill=ctx.stroke_fill,
-                    embedded_color=ctx.embedded_color,
-                    **ctx.kwargs,
-                )
+        max_width = 0
+        if self._needs_all_widths(anchor, align):
+            # Alignment and middle/descender anchors depend on every line
+            lines = list(lines)
+            max_width = max((laid.width for laid in lines), default=0)
+            y = self._adjust_y_for_anchor(y, anchor, len(lines), line_spacing)
+
+        # Draw each line once, then paste its emoji
+        for laid in lines:
+            x_line = self._aligned_x(original_x, anchor, align, max_width - laid.width)
+            self._draw_line(laid, x_line, y, ctx, self.image)
+            y += line_spacing
+
+    def layout(  # noqa: PLR0913 - mirrors the layout options of text()
+        self,
+        text: Union[str, TextIO, ParsedText],
+        font: Optional[FontT] = None,
+        *,
+        anchor: Optional[str] = None,
+        spacing: int = 4,
+        node_spacing: int = 0,
+        align: str = "left",
+        direction: Optional[str] = None,
+        features: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        stroke_width: int = 0,
+        embedded_color: bool = False,
+        emoji_scale_factor: Optional[float] = None,
+        emoji_position_offset: Optional[Tuple[int, int]] = None,
+    ) -> TextLayout:
+        """Parse, fetch and measure text once, for drawing with :meth:`draw_layout`.
+
+        The layout uses exactly the same placement as :meth:`text`, so
+        ``layout.size`` is the size :meth:`text` draws and ``layout.bbox``
+        its bounds: offset by any whole-pixel ``xy`` whose text lands on the
+        image, it equals :meth:`textbbox` at ``xy``. Options have the same
+        meaning as in :meth:`text`.
+
+        Parameters
+        ----------
+        text: Union[str, TextIO, :class:`~.ParsedText`]
+            The text to lay out.
+        font
+            The font to measure the text with.
+
+        Returns
+        -------
+        :class:`~.TextLayout`
+        """
+        font, emoji_scale_factor, emoji_position_offset, draw = self._prepare_text_params(
+            font, emoji_scale_factor, emoji_position_offset
+        )
+        source = text.text if isinstance(text, ParsedText) else text
+        anchor = self._validate_anchor_and_direction(anchor, direction, source if isinstance(source, str) else "\n")
+        ctx = _RenderCtx(
+            draw=draw,
+            font=font,
+            fill=None,
+            anchor=anchor,
+            spacing=spacing,
+            node_spacing=node_spacing,
+            align=align,
+            direction=direction,
+            features=features,
+            language=language,
+            stroke_width=stroke_width,
+            stroke_fill=None,
+            embedded_color=embedded_color,
+            args=(),
+            kwargs={},
+            emoji_scale_factor=emoji_scale_factor,
+            emoji_position_offset=emoji_position_offset,
+            mode=(draw.fontmode if not (stroke_width == 0 and embedded_color) else "RGBA"),
+            ink=self._resolve_ink(draw, None),
+        )
+
+        line_spacing = self._multiline_spacing(font, spacing, stroke_width)
+        space_text_length = self._space_width(ctx)
+        laid_lines = [
+            self._layout_line(line, space_text_length, ctx)
+            for line in iter_nodes(
+                text, cache=self._parse_cache, shortcodes=self._shortcodes, registry=self._custom_emoji
+            )
+        ]
+        max_width = max((laid.width for laid in laid_lines), default=0)
+
+        at = _LAYOUT_ORIGIN
+        y = self._adjust_y_for_anchor(at, anchor, len(laid_lines), line_spacing)
+        lines = []
+        for laid in laid_lines:
+            x = self._aligned_x(at, anchor, align, max_width - laid.width)
+            left, top = self._apply_font_offset(laid.text, x, y, ctx)
+            lines.append(LayoutLine(laid.text, laid.width, x - at, y - at, (left - at, top - at), laid.emojis))
+            y += line_spacing
+
+        result = TextLayout(
+            lines=tuple(lines),
+            bbox=(0, 0, 0, 0),
+            font=font,
+            anchor=anchor,
+            spacing=spacing,
+            node_spacing=node_spacing,
+            align=align,
+            direction=direction,
+            features=tuple(features) if features is not None else None,
+            language=language,
+            stroke_width=stroke_width,
+            embedded_color=embedded_color,
+            emoji_scale_factor=emoji_scale_factor,
+            emoji_position_offset=emoji_position_offset,
+        )
+        return replace(result, bbox=self._layout_bbox(result, draw))
+
+    def draw_layout(
+        self,
+        xy: Tuple[float, float],
+        layout: TextLayout,
+        fill: ColorT = None,
+        *,
+        stroke_fill: ColorT = None,
+        image: Optional[Image.Image] = None,
+    ) -> None:
+        """Draw a :class:`~.TextLayout` without parsing, fetching or measuring again.
+
+        Parameters
+        ----------
+        xy: Tuple[float, float]
+            The position to draw the layout at, as in :meth:`text`.
+        layout: :class:`~.TextLayout`
+            A layout returned by :meth:`layout`.
+        fill
+            The fill color of the text.
+        stroke_fill
+            The color of the text stroke.
+        image: Optional[:class:`PIL.Image.Image`]
+            The image to draw on. Defaults to this renderer's image.
+        """
+        if self.draw is None:
+            self._create_draw()
+        assert self.draw is not None
+        target = self.image if image is None else image
+        draw = self.draw if target is self.image else ImageDraw.Draw(target)
+        ctx = _RenderCtx(
+            draw=draw,
+            font=layout.font,
+            fill=fill,
+            anchor=layout.anchor,
+            spacing=layout.spacing,
+            node_spacing=layout.node_spacing,
+            align=layout.align,
+            direction=layout.direction,
+            features=list(layout.features) if layout.features is not None else None,
+            language=layout.language,
+            stroke_width=layout.stroke_width,
+            stroke_fill=stroke_fill,
+            embedded_color=layout.embedded_color,
+            args=(),
+            kwargs={},
+            emoji_scale_factor=layout.emoji_scale_factor,
+            emoji_position_offset=layout.emoji_position_offset,
+            mode=(draw.fontmode if not (layout.stroke_width == 0 and layout.embedded_color) else "RGBA"),
+            ink=self._resolve_ink(draw, fill),
+        )
+
+        x, y = xy
+        for line in layout.lines:
+            self._draw_line(line, x + line.x, y + line.y, ctx, target)
+
+    def textbbox(  # noqa: PLR0913 - mirrors the layout options of text()
+        self,
+        xy: Tuple[float, float],
+        text: Union[str, TextIO, ParsedText],
+        font: Optional[FontT] = None,
+        *,
+        anchor: Optional[str] = None,
+        spacing: int = 4,
+        node_spacing: int = 0,
+        align: str = "left",
+        direction: Optional[str] = None,
+        features: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        stroke_width: int = 0,
+        embedded_color: bool = False,
+        emoji_scale_factor: Optional[float] = None,
+        emoji_position_offset: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[int, int, int, int]:
+        """Return the bounding box of the text :meth:`text` would draw at ``xy``.
+
+        Like Pillow's `ImageDraw.textbbox`, but emoji-aware. Nothing is
+        rasterized: text is measured from font metrics and emoji from their
+        cached size or their image header, so no emoji is decoded. Emoji
+        are still fetched, since their presence decides the placeholder
+        layout. Options have the same meaning as in :meth:`text`.
+
+        Parameters
+        ----------
+        xy: Tuple[float, float]
+            The position the text would be drawn at.
+        text: Union[str, TextIO, :class:`~.ParsedText`]
+            The text to measure.
+        font
+            The font to measure the text with.
 
-            # Compute PIL text offset similar to ImageDraw.text internals
-            x_line, line_y = self._apply_font_offset(line_text, x_line, y, ctx)
+        Returns
+        -------
+        Tuple[int, int, int, int]
+            ``(left, top, right, bottom)`` in image coordinates.
+        """
+        font, emoji_scale_factor, emoji_position_offset, draw = self._prepare_text_params(
+            font, emoji_scale_factor, emoji_position_offset
+        )
+        source = text.text if isinstance(text, ParsedText) else text
+        anchor = self._validate_anchor_and_direction(anchor, direction, source if isinstance(source, str) else "\n")
+
+        if (
+            isinstance(source, str)
+            and not self._may_hold_emoji_tokens(text)
+            and self._is_plain_text(source, anchor, align)
+        ):
+            return draw.textbbox(
+                xy,
+                source,
+                font,
+                anchor=anchor,
+                spacing=spacing,
+                align=align,
+                direction=direction,
+                features=features,
+                language=language,
+                stroke_width=stroke_width,
+                embedded_color=embedded_color,
+            )
+
+        ctx = _RenderCtx(
+            draw=draw,
+            font=font,
+            fill=None,
+            anchor=anchor,
+            spacing=spacing,
+            node_spacing=node_spacing,
+            align=align,
+            direction=direction,
+            features=features,
+            language=language,
+            stroke_width=stroke_width,
+            stroke_fill=None,
+            embedded_color=embedded_color,
+            args=(),
+            kwargs={},
+            emoji_scale_factor=emoji_scale_factor,
+            emoji_position_offset=emoji_position_offset,
+            mode=(draw.fontmode if not (stroke_width == 0 and embedded_color) else "RGBA"),
+            ink=self._resolve_ink(draw, None),
+        )
 
-            # Paste emoji and advance x across nodes
-            x_line = self._paste_emoji_for_line(
-                line=line,
-                streams=streams.get(node_id, {}),
-                x_start=x_line,
-                y_start=line_y,
-                ctx=ctx,
+        line_spacing = self._multiline_spacing(font, spacing, stroke_width)
+        space_text_length = self._space_width(ctx)
+        lines = []
+        for line in iter_nodes(text, cache=self._parse_cache, shortcodes=self._shortcodes, registry=self._custom_emoji):
+            text_line, assets = self._collect_line(line, space_text_length, ctx)
+            width = ctx.metrics.text_length(
+                ctx.draw, text_line, direction=direction, features=features, language=language
             )
+            lines.append((text_line, int(width), self._advance_emoji(line, assets, ctx, self._emoji_size)))
+        max_width = max((width for _text, width, _emoji in lines), default=0)
 
+        x, y = xy
+        if self._needs_all_widths(anchor, align):
+            y = self._adjust_y_for_anchor(y, anchor, len(lines), line_spacing)
+        ox, oy = emoji_position_offset
+        boxes: List[Tuple[float, float, float, float]] = []
+        for text_line, width, placed in lines:
+            x_line = self._aligned_x(x, anchor, align, max_width - width)
+            if text_line:
+                boxes.append(
+                    draw.textbbox(
+                        (x_line, y),
+                        text_line,
+                        font,
+                        anchor=anchor,
+                        direction=direction,
+                        features=features,
+                        language=language,
+                        stroke_width=stroke_width,
+                        embedded_color=embedded_color,
+                    )
+                )
+            left, top = self._apply_font_offset(text_line, x_line, y, ctx)
+            for emoji_x, emoji_width, emoji_height, _ in placed:
+                emoji_left, emoji_top = _round_half_up(left + emoji_x + ox), _round_half_up(top + oy)
+                boxes.append((emoji_left, emoji_top, emoji_left + emoji_width, emoji_top + emoji_height))
             y += line_spacing
 
+        if not boxes:
+            return draw.textbbox(xy, "", font, anchor=anchor, stroke_width=stroke_width)
+        return (
+            math.floor(min(box[0] for box in boxes)),
+            math.floor(min(box[1] for box in boxes)),
+            math.ceil(max(box[2] for box in boxes)),
+            math.ceil(max(box[3] for box in boxes)),
+        )
+
     def __enter__(self: P) -> P:
         return self
 
@@ -490,7 +1051,7 @@ class Parmoji:
         if emoji_position_offset is None:
             emoji_position_offset = self._default_emoji_position_offset
         if font is None:
-            font = ImageFont.load_default()
+            font = default_font()
         if self.draw is None:
             self._create_draw()
         assert self.draw is not None
@@ -513,75 +1074,81 @@ class Parmoji:
             raise ValueError(msg)
         return anchor
 
+    def _may_hold_emoji_tokens(self, text: Union[str, ParsedText]) -> bool:
+        """Return whether ``text`` may hold shortcode or custom emoji that the ASCII check can't see."""
+        if isinstance(text, ParsedText):
+            # Parsed with its own settings, so trust its nodes over this renderer's
+            return any(node_type != NodeType.text.value for node_type in text.types)
+        return (self._shortcodes or self._custom_emoji is not None) and ":" in text
+
+    @staticmethod
+    def _is_plain_text(text: str, anchor: str, align: str) -> bool:
+        """Return whether Pillow alone renders ``text`` exactly like the emoji pipeline."""
+        if not text.isascii() or _NOT_PLAIN_TEXT_PATTERN.search(text) is not None:
+            return False
+        if "\n" not in text:
+            # Single lines are never shifted by alignment, but invalid values still raise
+            Parmoji._aligned_x(0, anchor, align, 0)
+            return True
+        # Multiline layout matches Pillow's only when no line is shifted horizontally
+        # (Pillow aligns on float widths) and no trailing empty line is dropped
+        return anchor[0] == "l" and align == "left" and not text.endswith("\n")
+
     @staticmethod
     def _resolve_ink(draw: ImageDraw.ImageDraw, fill: ColorT) -> Any:
         # Access private _getink like Pillow's ImageDraw.text does to compute offsets
         ink, f = draw._getink(fill)  # type: ignore[attr-defined]
         return f if ink is None else ink
 
-    def _build_lines(  # reduced arg count via ctx
-        self,
-        *,
-        nodes: List[List[Any]],
-        ctx: "_RenderCtx",
-    ) -> Tuple[List[str], List[int], int, Dict[int, Dict[int, BytesIO]]]:
-        nodes_line_to_print: List[str] = []
-        widths: List[int] = []
-        max_width = 0
-        streams: Dict[int, Dict[int, BytesIO]] = {}
+    @staticmethod
+    def _needs_all_widths(anchor: str, align: str) -> bool:
+        """Return whether lines must all be measured before the first is drawn."""
+        return anchor[0] != "l" or align != "left" or anchor[1] in "md"
 
+    @staticmethod
+    def _space_width(ctx: "_RenderCtx") -> float:
         # Measure width of a single space with the given options
-        space_text_length = ctx.draw.textlength(
+        space_text_length = ctx.metrics.text_length(
+            ctx.draw,
             " ",
-            ctx.font,
             direction=ctx.direction,
-            features=None,
             language=ctx.language,
             embedded_color=ctx.embedded_color,
         )
         if space_text_length == 0:
             space_text_length = 1
+        return space_text_length
 
-        for node_id, line in enumerate(nodes):
-            text_line = ""
-            streams[node_id] = {}
-            for line_id, node in enumerate(line):
-                content = node.content
-                stream = None
-                if node.type is NodeType.emoji:
-                    stream = self._get_emoji(content)
-                elif self._render_discord_emoji and node.type is NodeType.discord_emoji:
-                    with suppress(Exception):
-                        stream = self._get_discord_emoji(int(content))
-
-                if stream:
-                    streams[node_id][line_id] = stream
-
-                if node.type is NodeType.text or not stream:
-                    text_line += node.content
-                    continue
-
-                # Compute placeholder spaces for this emoji to match PIL layout
-                with Image.open(stream).convert("RGBA") as _tmp_asset:
-                    width = round(ctx.emoji_scale_factor * getattr(ctx.font, "size", 16))  # type: ignore[attr-defined]
-                    ox, _oy = ctx.emoji_position_offset
-                    size = round(width + ox + (ctx.node_spacing * 2))
-                    space_to_add = round(size / space_text_length)
-                    text_line += " " * space_to_add
-
-            nodes_line_to_print.append(text_line)
-            line_width = ctx.draw.textlength(
-                text_line,
-                ctx.font,
-                direction=ctx.direction,
-                features=ctx.features,
-                language=ctx.language,
-            )
-            line_width_int = int(line_width)
-            widths.append(line_width_int)
-            max_width = max(max_width, line_width_int)
+    def _layout_line(self, line: Sequence[Any], space_text_length: float, ctx: "_RenderCtx") -> "_LineLayout":
+        """Fetch a line's emoji, build its text with placeholder spaces and place the emoji."""
+        text_line, assets = self._collect_line(line, space_text_length, ctx)
+        line_width = ctx.metrics.text_length(
+            ctx.draw, text_line, direction=ctx.direction, features=ctx.features, language=ctx.language
+        )
+        placed = self._advance_emoji(line, assets, ctx, self._processed_emoji)
+        return _LineLayout(text_line, int(line_width), tuple(LayoutEmoji(x, asset) for x, _w, _h, asset in placed))
+
+    def _collect_line(
+        self, line: Sequence[Any], space_text_length: float, ctx: "_RenderCtx"
+    ) -> Tuple[str, Dict[int, _Asset]]:
+        """Fetch a line's emoji and build its text with placeholder spaces."""
+        text_line = ""
+        assets: Dict[int, _Asset] = {}
+        for line_id, node in enumerate(line):
+            asset = None if node.type is NodeType.text else self._fetch_asset(node)
+            if asset is None:
+                text_line += node.content
+                continue
 
-        return nodes_line_to_print, widths, max_width, streams
+            assets[line_id] = asset
+            # Compute placeholder spaces for this emoji to match PIL layout
+            width = round(ctx.emoji_scale_factor * getattr(ctx.font, "size", 16))  # type: ignore[attr-defined]
+            ox, _oy = ctx.emoji_position_offset
+            size = round(width + ox + (ctx.node_spacing * 2))
+            space_to_add = round(size / space_text_length)
+            text_line += " " * space_to_add
+
+        return text_line, assets
 
     @staticmethod
     def _adjust_y_for_anchor(y: float, anchor: str, num_lines: int, line_spacing: float) -> float:
@@ -609,97 +1176,290 @@ class Parmoji:
         raise ValueError('align must be "left", "center" or "right"')
 
     def _apply_font_offset(self, text_line: str, x: float, y: float, ctx: "_RenderCtx") -> Tuple[float, float]:
-        # Mirror internal PIL logic to compute pixel-aligned starting point
-        coord: List[int] = []
-        start_fracs: List[float] = []
-        for i in range(2):
-            coord.append(int((x, y)[i]))
-            start_fracs.append(math.modf((x, y)[i])[0])
+        """Return the pixel-aligned top-left corner of a line's ink, as Pillow's ``draw.text`` computes it.
 
+        Pillow offsets the line by the mask offset ``getmask2`` returns. That
+        offset is the top-left of ``font.getbbox``, so it is read from the
+        font's cached metrics instead of rasterizing the line a second time.
+        """
         if ctx.ink is None:
             return x, y
+        if not hasattr(ctx.font, "getmask2"):
+            # Fonts without getmask2 are drawn without a mask offset
+            return float(int(x)), float(int(y))
 
         local_stroke = ctx.stroke_width
-        ink = ctx.ink
-        if local_stroke:
-            # If stroke_fill provided, compute its ink, else reuse ink
-            stroke_ink = self._resolve_ink(ctx.draw, ctx.stroke_fill) if ctx.stroke_fill is not None else ink
-            if stroke_ink is not None:
-                ink = stroke_ink
-                local_stroke = 0
+        # Like draw.text, the fill pass of a stroked line is rendered without the stroke
+        if local_stroke and (ctx.stroke_fill is None or self._resolve_ink(ctx.draw, ctx.stroke_fill) is not None):
+            local_stroke = 0
+        left, top = ctx.metrics.offset(
+            text_line,
+            mode=ctx.mode,
+            direction=ctx.direction,
+            language=ctx.language,
+            stroke_width=local_stroke,
+            anchor=ctx.anchor,
+        )
+        return float(int(x) + left), float(int(y) + top)
 
-        try:
-            start_tuple = (float(start_fracs[0]), float(start_fracs[1]))
-            _, offset = ctx.font.getmask2(  # type: ignore[attr-defined]
-                text_line,
-                ctx.mode,
+    @staticmethod
+    def _measure_text_width(content: str, ctx: "_RenderCtx") -> int:
+        return int(ctx.metrics.run_length(content, direction=ctx.direction, language=ctx.language))
+
+    def _advance_emoji(
+        self,
+        line: Sequence[Any],
+        assets: Dict[int, _Asset],
+        ctx: "_RenderCtx",
+        load: Callable[[Any, _Asset, "_RenderCtx"], Tuple[int, int, _T]],
+    ) -> List[Tuple[int, int, int, _T]]:
+        """Walk a line and return ``(x, width, height, loaded)`` for each drawn emoji.
+
+        ``x`` is the offset from the start of the line's ink. ``load`` returns
+        the emoji's size and whatever the caller needs to draw or measure it.
+        """
+        placed: List[Tuple[int, int, int, _T]] = []
+        x = 0
+        for line_id, node in enumerate(line):
+            if node.type is NodeType.text or line_id not in assets:
+                x += ctx.node_spacing + self._measure_text_width(node.content, ctx)
+                continue
+
+            width, height, loaded = load(node, assets[line_id], ctx)
+            placed.append((x, width, height, loaded))
+            x += ctx.node_spacing + width
+        return placed
+
+    def _asset_key(self, node: Any) -> Hashable:
+        """Return the key an emoji's image is cached under, whatever form it was written in."""
+        if node.type is NodeType.emoji:
+            return canonical_emoji(node.content)
+        if node.type is NodeType.custom_emoji:
+            return self._custom_emoji_key(node.content)
+        return node.content
+
+    def _custom_emoji_key(self, name: str) -> Hashable:
+        # Keyed with colons so names can't collide with Unicode emoji, and by
+        # registry generation so a replaced emoji is never drawn from a stale entry
+        generation = self._custom_emoji.generation if self._custom_emoji is not None else 0
+        return (f":{name}:", generation)
+
+    def _fetch_asset(self, node: Any) -> Optional[_Asset]:
+        """Return an emoji node's decoded image when cached, else its encoded image, or None if it has none."""
+        if node.type is NodeType.discord_emoji and not self._render_discord_emoji:
+            return None
+        if self._cache:
+            decoded = self._decoded_cache.get(self._asset_key(node))
+            if decoded is not None:
+                return decoded
+
+        if node.type is NodeType.emoji:
+            return self._get_emoji(node.content)
+        if node.type is NodeType.custom_emoji:
+            return self._get_custom_emoji(node.content)
+        with suppress(Exception):
+            return self._get_discord_emoji(int(node.content))
+        return None
+
+    def _decoded_emoji(self, asset_key: Hashable, asset: _Asset) -> Image.Image:
+        """Return an emoji decoded to RGBA at its original size, keeping it when caching is enabled."""
+        if isinstance(asset, Image.Image):
+            return asset
+        with Image.open(asset) as encoded:
+            decoded = encoded.convert("RGBA")
+        self._emoji_sizes[asset_key] = decoded.size
+        if self._cache:
+            self._decoded_cache[asset_key] = decoded
+        return decoded
+
+    def _source_size(self, asset_key: Hashable, asset: _Asset) -> Tuple[int, int]:
+        """Return an emoji's original size, reading only the image header on a metadata miss."""
+        if isinstance(asset, Image.Image):
+            return asset.size
+        size = self._emoji_sizes.get(asset_key)
+        if size is None:
+            with Image.open(asset) as encoded:
+                size = encoded.size
+            asset.seek(0)
+            self._emoji_sizes[asset_key] = size
+        return size
+
+    @staticmethod
+    def _target_size(source_size: Tuple[int, int], ctx: "_RenderCtx") -> Tuple[int, int]:
+        """Return the size an emoji is drawn at: the font size wide, keeping its aspect ratio."""
+        original_width, original_height = source_size
+        width = round(ctx.emoji_scale_factor * getattr(ctx.font, "size", 16))  # type: ignore[attr-defined]
+        return width, round(math.ceil(original_height / original_width * width))
+
+    def _processed_emoji(self, node: Any, asset: _Asset, ctx: "_RenderCtx") -> Tuple[int, int, Image.Image]:
+        """Return an emoji resized for the current font, decoding it only when nothing is cached."""
+        asset_key = self._asset_key(node)
+        source_size = asset.size if isinstance(asset, Image.Image) else self._emoji_sizes.get(asset_key)
+        if source_size is not None:
+            size = self._target_size(source_size, ctx)
+            resized = self._processed_image_cache.get((asset_key, *size, LANCZOS))
+            if resized is not None:
+                return resized.width, resized.height, resized
+
+        original = self._decoded_emoji(asset_key, asset)
+        size = self._target_size(original.size, ctx)
+        resized = original.resize(size, LANCZOS)
+        self._processed_image_cache[(asset_key, *size, LANCZOS)] = resized
+        return resized.width, resized.height, resized
+
+    def _emoji_size(self, node: Any, asset: _Asset, ctx: "_RenderCtx") -> Tuple[int, int, None]:
+        """Return the size an emoji is drawn at without decoding it."""
+        width, height = self._target_size(self._source_size(self._asset_key(node), asset), ctx)
+        return width, height, None
+
+    def _draw_line(
+        self, line: Union[_LineLayout, LayoutLine], x: float, y: float, ctx: "_RenderCtx", image: Image.Image
+    ) -> None:
+        """Draw a laid out line's text at ``(x, y)`` and paste its emoji."""
+        if line.text:
+            ctx.draw.text(
+                (x, y),
+                line.text,
                 *ctx.args,
-                direction=ctx.direction,
-                features=None,  # type: ignore[arg-type]
-                language=ctx.language,
-                stroke_width=local_stroke,
-                anchor=ctx.anchor,
-                ink=ink,
-                start=start_tuple,
-                **ctx.kwargs,
-            )
-            off = cast(Tuple[int, int], offset)
-            coord[0] = coord[0] + off[0]
-            coord[1] = coord[1] + off[1]
-        except AttributeError:
-            # Some fonts may not implement getmask2
-            pass
-        return float(coord[0]), float(coord[1])
-
-    def _measure_text_width(self, content: str, ctx: "_RenderCtx") -> int:
-        if HAS_GETLENGTH:
-            return int(ctx.font.getlength(content, direction=ctx.direction, features=None, language=ctx.language))
-        # Estimate width using draw.textlength for compatibility
-        return int(
-            ctx.draw.textlength(
-                content,
+                fill=ctx.fill,
                 font=ctx.font,
+                anchor=ctx.anchor,
+                spacing=ctx.spacing,
+                align=ctx.align,
                 direction=ctx.direction,
-                features=None,
+                features=ctx.features,
                 language=ctx.language,
+                stroke_width=ctx.stroke_width,
+                stroke_fill=ctx.stroke_fill,
+                embedded_color=ctx.embedded_color,
+                **ctx.kwargs,
             )
+
+        # Compute PIL text offset similar to ImageDraw.text internals
+        x, y = self._apply_font_offset(line.text, x, y, ctx)
+        ox, oy = ctx.emoji_position_offset
+        for placed in line.emojis:
+            image.paste(placed.image, (_round_half_up(x + placed.x + ox), _round_half_up(y + oy)), placed.image)
+
+    def _layout_bbox(self, layout: TextLayout, draw: ImageDraw.ImageDraw) -> Tuple[int, int, int, int]:
+        """Return the union of the text and emoji boxes of a layout."""
+        at = _LAYOUT_ORIGIN
+        boxes = [(left + at, top + at, right + at, bottom + at) for left, top, right, bottom in layout.emoji_boxes()]
+        for line in layout.lines:
+            if line.text:
+                boxes.append(
+                    draw.textbbox(
+                        (line.x + at, line.y + at),
+                        line.text,
+                        layout.font,
+                        anchor=layout.anchor,
+                        direction=layout.direction,
+                        features=list(layout.features) if layout.features is not None else None,
+                        language=layout.language,
+                        stroke_width=layout.stroke_width,
+                        embedded_color=layout.embedded_color,
+                    )
+                )
+        if not boxes:
+            return 0, 0, 0, 0
+        return (
+            math.floor(min(box[0] for box in boxes)) - at,
+            math.floor(min(box[1] for box in boxes)) - at,
+            math.ceil(max(box[2] for box in boxes)) - at,
+            math.ceil(max(box[3] for box in boxes)) - at,
         )
 
-    def _paste_emoji_for_line(
-        self,
-        *,
-        line: List[Any],
-        streams: Dict[int, BytesIO],
-        x_start: float,
-        y_start: float,
-        ctx: "_RenderCtx",
-    ) -> float:
-        x = x_start
-        for line_id, node in enumerate(line):
-            content = node.content
-            if node.type is NodeType.text or line_id not in streams:
-                width = self._measure_text_width(content, ctx)
-                x += ctx.node_spacing + width
-                continue
 
-            # Emoji path
-            cache_key = f"{content}_{ctx.emoji_scale_factor}"
-            asset: Optional[Image.Image]
-            width: int
-            if cache_key in self._processed_image_cache:
-                asset = self._processed_image_cache[cache_key]
-                width = asset.width
-            else:
-                with Image.open(streams[line_id]).convert("RGBA") as original_asset:
-                    width = round(ctx.emoji_scale_factor * getattr(ctx.font, "size", 16))  # type: ignore[attr-defined]
-                    size = width, round(math.ceil(original_asset.height / original_asset.width * width))
-                    asset = original_asset.resize(size, LANCZOS)
-                    self._processed_image_cache[cache_key] = asset
-
-            ox, oy = ctx.emoji_position_offset
-            self.image.paste(asset, (round(x + ox), round(y_start + oy)), asset)
-            x += ctx.node_spacing + width
-        return x
+class EmojiRenderer:
+    """A long-lived, thread-safe renderer that binds to images cheaply.
+
+    Creating a :class:`Parmoji` per image sets up a source (an HTTP client,
+    the disk cache directory, the failed request registry) and fresh caches
+    every time. An ``EmojiRenderer`` does that once. :meth:`on` then returns
+    a :class:`Parmoji` for one image that only creates its draw handle,
+    and shares this renderer's source and caches; font metrics are already
+    shared per font.
+
+    .. code-block:: python
+
+        renderer = EmojiRenderer(source=Twemoji, cache_policy="tinylfu")
+        for image in images:
+            with renderer.on(image) as parmoji:
+                parmoji.text((10, 10), "Hello 👋", fill="black")
+        renderer.close()
+
+    Closing a bound :class:`Parmoji` only releases its draw handle. Bound
+    renderers can be used from many threads at once, one per image.
+
+    Parameters
+    ----------
+    **options: Any
+        Keyword arguments of :class:`Parmoji`, other than ``image`` and
+        ``draw``, which are given per image to :meth:`on`.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        if "image" in options or "draw" in options:
+            raise TypeError("image and draw are given per image, to EmojiRenderer.on().")
+
+        self._parmoji: Parmoji = Parmoji(Image.new("RGBA", (1, 1)), **options)
+
+    @property
+    def source(self) -> BaseSource:
+        """The emoji source shared by every bound renderer."""
+        return self._parmoji.source
+
+    @property
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Counters and sizes of the shared caches, see :attr:`Parmoji.cache_stats`."""
+        return self._parmoji.cache_stats
+
+    def on(self, image: Image.Image, *, draw: Optional[ImageDraw.ImageDraw] = None) -> Parmoji:
+        """Return a :class:`Parmoji` that renders on ``image``.
+
+        Parameters
+        ----------
+        image: :class:`PIL.Image.Image`
+            The Pillow image to render on.
+        draw: Optional[:class:`PIL.ImageDraw.ImageDraw`]
+            The drawing instance to use. If left unfilled,
+            a new drawing instance will be created.
+
+        Raises
+        ------
+        ValueError
+            The renderer has been closed.
+        """
+        if self._parmoji._closed:
+            raise ValueError("Renderer has already been closed.")
+        return self._parmoji._bind(image, draw)
+
+    def close(self) -> None:
+        """Closes the source and drops the caches.
+
+        Raises
+        ------
+        ValueError
+            The renderer has already been closed.
+        """
+        self._parmoji.close()
+
+    def __enter__(self) -> EmojiRenderer:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<EmojiRenderer source={self.source} cache={self._parmoji._cache}>"
+
+
+class _LineLayout(NamedTuple):
+    """A line's placeholder text, measured width and placed emoji."""
+
+    text: str
+    width: int
+    emojis: Tuple[LayoutEmoji, ...]
 
 
 @dataclass
@@ -723,3 +1483,7 @@ class _RenderCtx:
     emoji_position_offset: Tuple[int, int]
     mode: Any
     ink: Any
+    metrics: FontMetrics = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.metrics = font_metrics(self.font)
@@ -1,7 +1,9 @@
 """Helpers for parsing text into emoji/text nodes and measuring size.
 
 This module provides:
-- Fast emoji detection using the `emoji` library with a prebuilt set fallback.
+- Fast emoji detection backed by a precomputed classification table that is
+  loaded on first use, with the `emoji` library as a fallback.
+- A single-pass tokenizer backed by a codepoint trie of every known emoji sequence.
 - A compact parser that splits text into Nodes per line (text/emoji/discord).
 - Convenience size calculation compatible with Pillow's APIs.
 
@@ -12,33 +14,158 @@ while keeping type hints explicit for maintainability.
 from __future__ import annotations
 
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+import functools
+import itertools
 import re
+import threading
 import unicodedata
+import weakref
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import TYPE_CHECKING, Final, List, NamedTuple, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+    overload,
+)
 
 import emoji
 import PIL
 from PIL import Image, ImageDraw, ImageFont
 
+
 if TYPE_CHECKING:
     from .core import FontT
+    from .registry import CustomEmojiRegistry
 
 # Check PIL version once at module level
 PIL_VERSION = tuple(int(part) for part in PIL.__version__.split("."))
 HAS_GETLENGTH = PIL_VERSION >= (9, 2, 0)
 
-# More efficient emoji detection using a set for O(1) lookup
-EMOJI_SET: set[str] = set()
-for emj, data in emoji.EMOJI_DATA.items():
-    if "en" in data and data["status"] <= emoji.STATUS["fully_qualified"]:
-        EMOJI_SET.add(emj)
-
 # Discord emoji regex - this is small enough to be efficient
 _DISCORD_EMOJI_REGEX = r"<a?:[a-zA-Z0-9_]{1,32}:[0-9]{17,22}>"
 DISCORD_EMOJI_PATTERN: Final[re.Pattern[str]] = re.compile(_DISCORD_EMOJI_REGEX)
 
-__all__ = ("DISCORD_EMOJI_PATTERN", "is_emoji", "Node", "NodeType", "to_nodes", "getsize")
+# Slack/GitHub-style shortcodes such as ":thumbsup:"; candidates are checked
+# against the shortcode table, so this only needs to find the colons.
+_SHORTCODE_PATTERN: Final[re.Pattern[str]] = re.compile(r":[^:\s]+:")
+
+# Every boundary recognized by str.splitlines, so streamed lines match to_nodes
+_LINE_BREAK_PATTERN: Final[re.Pattern[str]] = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Marker key for a trie node that terminates a complete emoji sequence.
+# Emoji are never empty strings, so it can't collide with a child codepoint.
+_TRIE_END: Final[str] = ""
+
+# Skin tone modifiers (U+1F3FB..U+1F3FF) may trail any emoji base.
+_SKIN_TONE_FIRST: Final[str] = "\U0001f3fb"
+_SKIN_TONE_LAST: Final[str] = "\U0001f3ff"
+# Recommended ZWJ sequences join at most four emoji; leave room for newer ones
+_MAX_ZWJ_JOINS: Final[int] = 7
+
+__all__ = (
+    "DISCORD_EMOJI_PATTERN",
+    "is_emoji",
+    "is_known_emoji",
+    "canonical_emoji",
+    "Node",
+    "NodeType",
+    "ParseCache",
+    "ParsedText",
+    "SpanLine",
+    "iter_nodes",
+    "parse_many",
+    "parse_spans",
+    "to_nodes",
+    "FontMetrics",
+    "default_font",
+    "font_metrics",
+    "getsize",
+)
+
+
+class _EmojiTable(NamedTuple):
+    """Emoji classification data shared by detection, validation and parsing."""
+
+    qualified: FrozenSet[str]
+    sequences: FrozenSet[str]
+    trie: Dict[str, Any]
+    # Fully-qualified sequence for every sequence with its VS-16s removed
+    canonical: Dict[str, str]
+
+
+@functools.cache
+def _emoji_table() -> _EmojiTable:
+    """Derive the emoji classification table from ``emoji.EMOJI_DATA`` on first use.
+
+    Building it is left to the first parse or lookup so importing parmoji stays
+    cheap, and it always matches the installed `emoji` release.
+    """
+    qualified = frozenset(
+        emj
+        for emj, data in emoji.EMOJI_DATA.items()
+        if "en" in data and data["status"] <= emoji.STATUS["fully_qualified"]
+    )
+    sequences = frozenset(emoji.EMOJI_DATA)
+    canonical = {sequence.replace("\ufe0f", ""): sequence for sequence in qualified}
+    return _EmojiTable(qualified, sequences, _build_emoji_trie(sequences), canonical)
+
+
+def __getattr__(name: str) -> Any:
+    # EMOJI_SET is kept for compatibility but only materialized when accessed
+    if name == "EMOJI_SET":
+        return _emoji_table().qualified
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _shortcode_table() -> Dict[str, str]:
+    """Map every English name and alias shortcode to its emoji.
+
+    Where several qualification levels share a name, the fully-qualified
+    sequence wins, matching ``emoji.emojize``.
+    """
+    table: Dict[str, str] = {}
+    ranks: Dict[str, int] = {}
+    for sequence, data in emoji.EMOJI_DATA.items():
+        status = data.get("status", emoji.STATUS["fully_qualified"])
+        for name in (data["en"], *data.get("alias", ())):
+            if name not in table or status < ranks[name]:
+                table[name] = sequence
+                ranks[name] = status
+    return table
+
+
+def is_known_emoji(sequence: str) -> bool:
+    """Return whether ``sequence`` is exactly one emoji known to the emoji table."""
+    return sequence in _emoji_table().sequences
+
+
+def canonical_emoji(sequence: str) -> str:
+    """Return the fully-qualified form of an emoji sequence.
+
+    Unqualified and minimally-qualified variants, and sequences carrying
+    redundant U+FE0F selectors, all map to the same key, e.g. ``"☹"`` and
+    ``"☹️"``. Sequences the emoji data doesn't know are returned unchanged.
+    """
+    table = _emoji_table()
+    if sequence in table.qualified:
+        return sequence
+    return table.canonical.get(sequence.replace("\ufe0f", ""), sequence)
 
 
 def is_emoji(char: str) -> bool:
@@ -47,17 +174,17 @@ def is_emoji(char: str) -> bool:
     This is much faster than regex matching against thousands of patterns.
     Uses set lookup (O(1)) and Unicode category checks as fallback.
     """
-    # Prefer library signal when available (handles VS-16/ZWJ robustly)
+    # Fast-path: exact lookup in the shared emoji table
+    if char in _emoji_table().sequences:
+        return True
+
+    # Library signal handles VS-16/ZWJ robustly for anything the table lacks
     try:
         if getattr(emoji, "emoji_count", None) and emoji.emoji_count(char) > 0:  # type: ignore[attr-defined]
             return True
     except Exception:
         pass
 
-    # Fast-path: check our known emoji set
-    if char in EMOJI_SET:
-        return True
-
     # Check if it might be a multi-character emoji sequence
     if len(char) > 1 and ("\u200d" in char or "\ufe0f" in char):
         # Could be a complex emoji sequence; if not in set, accept as emoji
@@ -74,33 +201,153 @@ def is_emoji(char: str) -> bool:
     return False
 
 
-def find_emojis_in_text(text: str) -> List[Tuple[int, int, str]]:
-    """Find all emojis in text efficiently.
+def _build_emoji_trie(sequences: Iterable[str]) -> Dict[str, Any]:
+    """Build a codepoint trie where each node maps a character to its child node."""
+    root: Dict[str, Any] = {}
+    for seq in sequences:
+        node = root
+        for char in seq:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = True
+    return root
 
-    Returns list of (start_index, end_index, emoji) tuples.
+
+def _match_single_emoji(text: str, start: int, /) -> int:
+    """Return the end index of the longest known emoji starting at ``start``.
+
+    Unlike `_match_emoji` this absorbs no trailing modifiers or ZWJ joins.
+    Returns ``start`` itself when no emoji begins at that position.
     """
-    emojis = []
-    i = 0
-    while i < len(text):
-        # Check for Discord emoji first (faster regex)
-        match = DISCORD_EMOJI_PATTERN.match(text, i)
-        if match:
-            emojis.append((match.start(), match.end(), match.group()))
-            i = match.end()
-            continue
-
-        # Check for Unicode emoji
-        # Try to match the longest possible emoji sequence
-        for length in range(min(10, len(text) - i), 0, -1):
-            candidate = text[i : i + length]
-            if is_emoji(candidate):
-                emojis.append((i, i + length, candidate))
-                i += length
+    length = len(text)
+    # The trie holds every sequence the `emoji` library knows about (all
+    # qualification levels), matching what `emoji.emoji_count` would detect.
+    node = _emoji_table().trie
+    end = start
+    i = start
+    while i < length:
+        child = node.get(text[i])
+        if child is None:
+            break
+        node = child
+        i += 1
+        if _TRIE_END in node:
+            end = i
+
+    if end == start:
+        # Mirror the category fallback of `is_emoji` for unknown single symbols.
+        # ASCII symbols such as "^" and "`" are never emoji.
+        char = text[start]
+        if char.isascii() or unicodedata.category(char) not in ("So", "Sk"):
+            return start
+        end = start + 1
+    return end
+
+
+def _match_emoji(text: str, start: int, /) -> int:
+    """Return the end index of the longest emoji starting at ``start``.
+
+    Returns ``start`` itself when no emoji begins at that position.
+    """
+    end = _match_single_emoji(text, start)
+    if end == start:
+        return start
+
+    # Absorb trailing VS-16, skin tones and ZWJ joins so that sequences newer
+    # than the bundled emoji data still come out as a single emoji. Joins are
+    # walked in this loop rather than recursively, so long chains can't
+    # exhaust the stack, and capped so one chain can't swallow a whole line.
+    length = len(text)
+    joins = 0
+    while end < length:
+        char = text[end]
+        if char == "\ufe0f" or _SKIN_TONE_FIRST <= char <= _SKIN_TONE_LAST:
+            end += 1
+        elif char == "\u200d" and end + 1 < length and joins < _MAX_ZWJ_JOINS:
+            joined = _match_single_emoji(text, end + 1)
+            if joined == end + 1:
                 break
+            end = joined
+            joins += 1
         else:
-            i += 1
+            break
+    return end
+
+
+def _emoji_spans(
+    text: str, /, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None
+) -> List[Tuple[int, int]]:
+    """Return the ``(start, end)`` offsets of every Discord or Unicode emoji.
+
+    Scans the text once from left to right, taking the longest match at each
+    position. Matches never span a line break. With ``shortcodes``, known
+    ``:name:`` shortcodes are matched in the same pass, as are names in a
+    custom emoji ``registry``.
+    """
+    colons = shortcodes or registry is not None
+    if text.isascii() and not (colons and ":" in text):
+        # Every Unicode emoji contains a non-ASCII codepoint (keycaps end in U+20E3)
+        return [m.span() for m in DISCORD_EMOJI_PATTERN.finditer(text)]
+
+    spans: List[Tuple[int, int]] = []
+    trie = _emoji_table().trie
+    length = len(text)
+    i = 0
+    while i < length:
+        char = text[i]
+        if char == "<":
+            match = DISCORD_EMOJI_PATTERN.match(text, i)
+            if match:
+                spans.append((i, match.end()))
+                i = match.end()
+                continue
+        elif char == ":":
+            if colons:
+                match = _SHORTCODE_PATTERN.match(text, i)
+                if match and (
+                    (registry is not None and match.group()[1:-1] in registry)
+                    or (shortcodes and match.group() in _shortcode_table())
+                ):
+                    spans.append((i, match.end()))
+                    i = match.end()
+                    continue
+        elif char in trie or not char.isascii():
+            end = _match_emoji(text, i)
+            if end > i:
+                if text.startswith("\ufe0e", end):
+                    # U+FE0E requests text presentation: leave it to the font
+                    i = end + 1
+                    continue
+                spans.append((i, end))
+                i = end
+                continue
+        i += 1
+
+    return spans
+
+
+def find_emojis_in_text(
+    text: str, *, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None
+) -> List[Tuple[int, int, str]]:
+    """Find all emojis in text efficiently.
+
+    Scans the text once from left to right, emitting the longest Discord or
+    Unicode emoji match at each position. With ``shortcodes``, ``:name:``
+    shortcodes are matched too and reported as the emoji they stand for.
+    Names in a custom emoji ``registry`` are reported as written, colons
+    included, and take precedence over shortcodes.
 
-    return emojis
+    Returns list of (start_index, end_index, emoji) tuples.
+    """
+    if not shortcodes and registry is None:
+        return [(start, end, text[start:end]) for start, end in _emoji_spans(text)]
+
+    results = []
+    for start, end in _emoji_spans(text, shortcodes, registry):
+        content = text[start:end]
+        if content[0] == ":" and not (registry is not None and content[1:-1] in registry):
+            content = _shortcode_table()[content]
+        results.append((start, end, content))
+    return results
 
 
 class NodeType(Enum):
@@ -116,11 +363,14 @@ class NodeType(Enum):
         This node is a unicode emoji.
     discord_emoji
         This node is a Discord emoji.
+    custom_emoji
+        This node is a custom emoji from a :class:`~.CustomEmojiRegistry`.
     """
 
     text = 0
     emoji = 1
     discord_emoji = 2
+    custom_emoji = 3
 
 
 class Node(NamedTuple):
@@ -141,12 +391,15 @@ class Node(NamedTuple):
         return f"<Node type={self.type.name!r} content={self.content!r}>"
 
 
-def _parse_line(line: str, /) -> List[Node]:
+def _parse_line(line: str, /, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None) -> List[Node]:
     """Parse a line of text into nodes, efficiently detecting emojis."""
     nodes = []
 
     # Find all emojis in the line
-    emojis = find_emojis_in_text(line)
+    if shortcodes or registry is not None:
+        emojis = find_emojis_in_text(line, shortcodes=shortcodes, registry=registry)
+    else:
+        emojis = find_emojis_in_text(line)
 
     if not emojis:
         # No emojis, entire line is text
@@ -166,6 +419,8 @@ def _parse_line(line: str, /) -> List[Node]:
             # Extract ID from Discord emoji format
             emoji_id = emoji_text.split(":")[-1][:-1]
             nodes.append(Node(NodeType.discord_emoji, emoji_id))
+        elif emoji_text.startswith(":"):  # Registered custom emoji
+            nodes.append(Node(NodeType.custom_emoji, emoji_text[1:-1]))
         else:
             nodes.append(Node(NodeType.emoji, emoji_text))
 
@@ -178,7 +433,84 @@ def _parse_line(line: str, /) -> List[Node]:
     return nodes
 
 
-def to_nodes(text: str, /) -> List[List[Node]]:
+_NODE_TYPES: Final[Tuple[NodeType, ...]] = tuple(NodeType)
+
+
+class ParseCache:
+    """A size-bounded LRU cache of parsed lines.
+
+    Lines are keyed by their exact text and stored as immutable tuples of
+    :class:`~.Node`, so recurring captions or usernames skip tokenization
+    entirely. A single cache may be shared between threads and between
+    :class:`~.Parmoji` instances.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of distinct lines to keep. Defaults to `4096`.
+
+    Attributes
+    ----------
+    hits: int
+        Number of lines served from the cache.
+    misses: int
+        Number of lines that had to be parsed.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lines: OrderedDict[Tuple[Any, ...], Tuple[Node, ...]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def parse_line(
+        self, line: str, /, *, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None
+    ) -> Tuple[Node, ...]:
+        """Return the nodes for a single line, parsing it only on a miss."""
+        # The registry generation makes lines parsed before a (un)registration stale
+        key = (line, shortcodes) if registry is None else (line, shortcodes, registry, registry.generation)
+        with self._lock:
+            nodes = self._lines.get(key)
+            if nodes is not None:
+                self._lines.move_to_end(key)
+                self.hits += 1
+                return nodes
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same line is harmless
+        nodes = tuple(_parse_line(line, shortcodes, registry))
+        with self._lock:
+            self._lines[key] = nodes
+            if len(self._lines) > self.maxsize:
+                self._lines.popitem(last=False)
+        return nodes
+
+    def clear(self) -> None:
+        """Drop all cached lines and reset the hit/miss counters."""
+        with self._lock:
+            self._lines.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __repr__(self) -> str:
+        return f"<ParseCache size={len(self)}/{self.maxsize} hits={self.hits} misses={self.misses}>"
+
+
+def to_nodes(
+    text: str,
+    /,
+    *,
+    cache: Optional[ParseCache] = None,
+    shortcodes: bool = False,
+    registry: Optional[CustomEmojiRegistry] = None,
+) -> List[Sequence[Node]]:
     """Parses a string of text into :class:`~.Node`s.
 
     This method will return a nested list, each element of the list
@@ -191,24 +523,576 @@ def to_nodes(text: str, /) -> List[List[Node]]:
     ----------
     text: str
         The text to parse into nodes.
+    cache: Optional[:class:`~.ParseCache`]
+        A parse cache to consult per line. Cached lines are returned as
+        immutable tuples instead of lists.
+    shortcodes: bool
+        Whether to also recognize ``:name:`` shortcodes such as ``:thumbsup:``
+        and turn them into emoji nodes. Defaults to `False`.
+    registry: Optional[:class:`~.CustomEmojiRegistry`]
+        Custom emoji whose ``:name:`` tokens become
+        :attr:`NodeType.custom_emoji` nodes. Defaults to `None`.
+
+    Returns
+    -------
+    List[Sequence[:class:`~.Node`]]
+    """
+    if cache is not None:
+        return [cache.parse_line(line, shortcodes=shortcodes, registry=registry) for line in text.splitlines()]
+    return [_parse_line(line, shortcodes, registry) for line in text.splitlines()]
+
+
+class SpanLine(Sequence[Node]):
+    """A read-only view of one line of a :class:`~.ParsedText`.
+
+    Indexing or iterating yields :class:`~.Node` objects built on demand from
+    the parent's span columns; nothing is sliced until it is accessed.
+    """
+
+    __slots__ = ("_parsed", "_first", "_stop")
+
+    def __init__(self, parsed: ParsedText, first: int, stop: int) -> None:
+        self._parsed = parsed
+        self._first = first
+        self._stop = stop
+
+    def spans(self) -> Iterator[Tuple[NodeType, int, int]]:
+        """Yield ``(type, start, end)`` offsets of this line's nodes into the source text."""
+        parsed = self._parsed
+        for index in range(self._first, self._stop):
+            yield _NODE_TYPES[parsed.types[index]], parsed.starts[index], parsed.ends[index]
+
+    def __len__(self) -> int:
+        return self._stop - self._first
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("node index out of range")
+        return self._parsed.node(self._first + index)
+
+    def __iter__(self) -> Iterator[Node]:
+        node = self._parsed.node
+        for index in range(self._first, self._stop):
+            yield node(index)
+
+    def __repr__(self) -> str:
+        return f"<SpanLine nodes={len(self)}>"
+
+
+class ParsedText(Sequence[SpanLine]):
+    """A compact, column-oriented parse of a whole string.
+
+    Instead of one :class:`~.Node` per text run or emoji, each node is stored
+    as a type code plus ``start``/``end`` offsets into :attr:`text`, held in
+    :mod:`array` columns. For Discord emoji the offsets cover only the
+    snowflake ID, so every node's content is ``text[start:end]``. The one
+    exception is a shortcode emoji, whose offsets cover the ``:name:`` text
+    and whose content is the emoji it names. Custom emoji offsets cover the
+    registered name without its colons.
+
+    Iterating yields one :class:`~.SpanLine` per line, with the same line
+    boundaries and nodes as :func:`to_nodes`. Instances can be passed anywhere
+    text is accepted by :func:`getsize` and :class:`~.Parmoji`.
+
+    Attributes
+    ----------
+    text: str
+        The parsed source text.
+    types: :class:`array.array`
+        The :class:`~.NodeType` value of each node.
+    starts: :class:`array.array`
+        The start offset of each node in :attr:`text`.
+    ends: :class:`array.array`
+        The end offset of each node in :attr:`text`.
+    """
+
+    __slots__ = ("text", "types", "starts", "ends", "_line_starts")
+
+    def __init__(
+        self, text: str, /, *, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None
+    ) -> None:
+        self.text: str = text
+        offset_code = "I" if len(text) < 2**32 else "Q"
+        self.types: array[int] = array("B")
+        self.starts: array[int] = array(offset_code)
+        self.ends: array[int] = array(offset_code)
+        # Index of each line's first node, plus a final sentinel
+        self._line_starts: array[int] = array(offset_code)
+        self._parse(shortcodes, registry)
+
+    def _add(self, node_type: NodeType, start: int, end: int) -> None:
+        self.types.append(node_type.value)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def _parse(self, shortcodes: bool, registry: Optional[CustomEmojiRegistry]) -> None:
+        text = self.text
+        spans = _emoji_spans(text, shortcodes, registry)
+        span_count = len(spans)
+        span_index = 0
+
+        line_start = 0
+        for line_start, line_end in _iter_line_bounds(text):
+            self._line_starts.append(len(self.types))
+            pos = line_start
+            while span_index < span_count and spans[span_index][0] < line_end:
+                start, end = spans[span_index]
+                span_index += 1
+                if start > pos:
+                    self._add(NodeType.text, pos, start)
+                if text[start] == "<":
+                    # Keep only the snowflake ID: "<a:name:ID>"
+                    self._add(NodeType.discord_emoji, text.rindex(":", start, end) + 1, end - 1)
+                elif registry is not None and text[start] == ":" and text[start + 1 : end - 1] in registry:
+                    self._add(NodeType.custom_emoji, start + 1, end - 1)
+                else:
+                    self._add(NodeType.emoji, start, end)
+                pos = end
+            if pos < line_end:
+                self._add(NodeType.text, pos, line_end)
+        self._line_starts.append(len(self.types))
+
+    def node(self, index: int, /) -> Node:
+        """Build the :class:`~.Node` at a flat node index."""
+        node_type = _NODE_TYPES[self.types[index]]
+        content = self.text[self.starts[index] : self.ends[index]]
+        if node_type is NodeType.emoji and content[0] == ":":
+            content = _shortcode_table()[content]
+        return Node(node_type, content)
+
+    def __len__(self) -> int:
+        return len(self._line_starts) - 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return SpanLine(self, self._line_starts[index], self._line_starts[index + 1])
+
+    def __iter__(self) -> Iterator[SpanLine]:
+        starts = self._line_starts
+        for index in range(len(starts) - 1):
+            yield SpanLine(self, starts[index], starts[index + 1])
+
+    def __repr__(self) -> str:
+        return f"<ParsedText lines={len(self)} nodes={len(self.types)}>"
+
+
+def parse_spans(
+    text: str, /, *, shortcodes: bool = False, registry: Optional[CustomEmojiRegistry] = None
+) -> ParsedText:
+    """Parses a string into a compact :class:`~.ParsedText`.
+
+    This is a lower-allocation alternative to :func:`to_nodes` for large
+    inputs: nodes are stored as offsets and only materialized on access.
+
+    Parameters
+    ----------
+    text: str
+        The text to parse.
+    shortcodes: bool
+        Whether to also recognize ``:name:`` shortcodes. Defaults to `False`.
+    registry: Optional[:class:`~.CustomEmojiRegistry`]
+        Custom emoji to recognize by ``:name:``. Defaults to `None`.
 
     Returns
     -------
-    List[List[:class:`~.Node`]]
+    :class:`~.ParsedText`
+    """
+    return ParsedText(text, shortcodes=shortcodes, registry=registry)
+
+
+def _parse_chunk(texts: List[str], /, shortcodes: bool = False) -> List[List[Sequence[Node]]]:
+    return [to_nodes(text, shortcodes=shortcodes) for text in texts]
+
+
+def _count_chunk(texts: List[str], /, shortcodes: bool = False) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for text in texts:
+        for start, end in _emoji_spans(text, shortcodes):
+            if text[start] == "<":
+                # Count Discord emoji by ID, matching the node content
+                counts[text[text.rindex(":", start, end) + 1 : end - 1]] += 1
+            elif text[start] == ":":
+                counts[_shortcode_table()[text[start:end]]] += 1
+            else:
+                counts[text[start:end]] += 1
+    return counts
+
+
+def _iter_chunks(texts: Iterable[str], size: int, /) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+@overload
+def parse_many(
+    texts: Iterable[str],
+    /,
+    *,
+    workers: Optional[int] = ...,
+    chunksize: int = ...,
+    histogram: Literal[False] = ...,
+    shortcodes: bool = ...,
+) -> List[List[Sequence[Node]]]: ...
+
+
+@overload
+def parse_many(
+    texts: Iterable[str],
+    /,
+    *,
+    workers: Optional[int] = ...,
+    chunksize: int = ...,
+    histogram: Literal[True],
+    shortcodes: bool = ...,
+) -> Counter[str]: ...
+
+
+def parse_many(
+    texts: Iterable[str],
+    /,
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 1024,
+    histogram: bool = False,
+    shortcodes: bool = False,
+) -> Union[List[List[Sequence[Node]]], Counter[str]]:
+    """Parses many strings across a pool of worker processes.
+
+    The input is split into chunks of ``chunksize`` strings, each chunk is
+    parsed in a worker, and results are gathered back in input order.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        The strings to parse.
+    workers: Optional[int]
+        The number of worker processes. Defaults to the CPU count. With
+        ``1``, or when everything fits in a single chunk, parsing runs in the
+        calling process.
+    chunksize: int
+        How many strings each worker task handles. Larger chunks amortize
+        inter-process overhead. Defaults to `1024`.
+    histogram: bool
+        If ``True``, return only how often each emoji occurs instead of the
+        parsed nodes. Unicode emoji are counted by sequence and Discord emoji
+        by ID. Only the counts cross process boundaries.
+    shortcodes: bool
+        Whether to also recognize ``:name:`` shortcodes. Defaults to `False`.
+
+    Returns
+    -------
+    Union[List[List[Sequence[:class:`~.Node`]]], Counter[str]]
+        One :func:`to_nodes` result per input string, or the emoji histogram.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    work = functools.partial(_count_chunk if histogram else _parse_chunk, shortcodes=shortcodes)
+    chunks = _iter_chunks(texts, chunksize)
+    results: Iterable[Any]
+    if workers == 1:
+        results = map(work, chunks)
+    else:
+        head = list(itertools.islice(chunks, 2))
+        if len(head) <= 1:
+            # A single chunk is not worth starting a pool for
+            results = map(work, head)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(work, itertools.chain(head, chunks)))
+
+    if histogram:
+        total: Counter[str] = Counter()
+        for counts in results:
+            total.update(counts)
+        return total
+    return [nodes for chunk in results for nodes in chunk]
+
+
+def _iter_line_bounds(text: str, /) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of each line, split like ``str.splitlines``."""
+    start = 0
+    for match in _LINE_BREAK_PATTERN.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
+
+
+def _iter_lines(text: Union[str, TextIO], /) -> Iterator[str]:
+    """Yield lines with the same boundaries as ``str.splitlines`` without a full list."""
+    if isinstance(text, str):
+        for start, end in _iter_line_bounds(text):
+            yield text[start:end]
+        return
+
+    for chunk in text:
+        yield from chunk.splitlines()
+
+
+def iter_nodes(
+    text: Union[str, TextIO, ParsedText],
+    /,
+    *,
+    cache: Optional[ParseCache] = None,
+    shortcodes: bool = False,
+    registry: Optional[CustomEmojiRegistry] = None,
+) -> Iterator[Sequence[Node]]:
+    """Lazily parses text into :class:`~.Node`s, one line at a time.
+
+    This yields the same lines as :func:`to_nodes` but never holds more than
+    one parsed line, so memory stays flat for very large inputs.
+
+    Parameters
+    ----------
+    text: Union[str, TextIO, :class:`~.ParsedText`]
+        The text to parse, or a text file object to read lines from. An
+        already parsed :class:`~.ParsedText` yields its lines as they are.
+    cache: Optional[:class:`~.ParseCache`]
+        A parse cache to consult per line.
+    shortcodes: bool
+        Whether to also recognize ``:name:`` shortcodes. Defaults to `False`.
+    registry: Optional[:class:`~.CustomEmojiRegistry`]
+        Custom emoji to recognize by ``:name:``. Defaults to `None`.
+
+    Both options are ignored for a :class:`~.ParsedText`, which was parsed
+    with its own settings.
+
+    Yields
+    ------
+    Sequence[:class:`~.Node`]
+        The nodes of each line.
     """
-    return [_parse_line(line) for line in text.splitlines()]
+    if isinstance(text, ParsedText):
+        yield from text
+        return
+
+    if cache is not None:
+        for line in _iter_lines(text):
+            yield cache.parse_line(line, shortcodes=shortcodes, registry=registry)
+    else:
+        for line in _iter_lines(text):
+            yield _parse_line(line, shortcodes, registry)
+
+
+@functools.cache
+def default_font() -> FontT:
+    """Return Pillow's default font, loaded once and shared by every caller."""
+    return ImageFont.load_default()
+
+
+class FontMetrics:
+    """Memoized measurements of a single font.
+
+    Holds the width and ink offset of each measured text run in size-bounded
+    LRUs and the height of a line per stroke width, so recurring labels skip
+    FreeType layout entirely. Use :func:`font_metrics` to get the instance shared by
+    :func:`getsize` and :class:`~.Parmoji` for a font.
+
+    Fonts are assumed not to change once measured. Call :meth:`clear` after
+    changing a font in place, e.g. with ``set_variation_by_name``.
+
+    Parameters
+    ----------
+    font
+        The font to measure. Only a weak reference is kept when possible.
+    maxsize: int
+        Maximum number of text runs to remember. Defaults to `512`.
+
+    Attributes
+    ----------
+    hits: int
+        Number of measurements served from the cache.
+    misses: int
+        Number of measurements that called into the font.
+    """
+
+    __slots__ = ("_font", "_lengths", "_line_heights", "_lock", "_offsets", "hits", "maxsize", "misses")
 
+    def __init__(self, font: FontT, maxsize: int = 512) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
 
-def getsize(
-    text: str, font: Optional[FontT] = None, *, spacing: int = 4, emoji_scale_factor: float = 1
+        try:
+            self._font: Any = weakref.ref(font)
+        except TypeError:
+            self._font = lambda: font
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lengths: OrderedDict[Tuple[Any, ...], float] = OrderedDict()
+        self._offsets: OrderedDict[Tuple[Any, ...], Tuple[int, int]] = OrderedDict()
+        self._line_heights: Dict[Tuple[Any, ...], float] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _lookup(self, runs: OrderedDict[Tuple[Any, ...], Any], key: Tuple[Any, ...]) -> Any:
+        with self._lock:
+            value = runs.get(key)
+            if value is not None:
+                runs.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def _store(self, runs: OrderedDict[Tuple[Any, ...], Any], key: Tuple[Any, ...], value: Any) -> Any:
+        with self._lock:
+            runs[key] = value
+            if len(runs) > self.maxsize:
+                runs.popitem(last=False)
+        return value
+
+    def run_length(self, text: str, direction: Optional[str] = None, language: Optional[str] = None) -> float:
+        """Return ``font.getlength(text)`` for a run of text, measuring it only on a miss."""
+        key = (text, direction, language)
+        length = self._lookup(self._lengths, key)
+        if length is not None:
+            return length
+
+        # Measure outside the lock; a concurrent miss on the same run is harmless
+        font = self._font()
+        if HAS_GETLENGTH:
+            length = font.getlength(text, direction=direction, language=language)
+        else:
+            # Approximate width using textlength for compatibility with type stubs
+            tmp_draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+            length = tmp_draw.textlength(text, font=font, direction=direction, language=language)
+        return self._store(self._lengths, key, length)
+
+    def text_length(  # noqa: PLR0913 - mirrors ImageDraw.textlength
+        self,
+        draw: ImageDraw.ImageDraw,
+        text: str,
+        *,
+        direction: Optional[str] = None,
+        features: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        embedded_color: bool = False,
+    ) -> float:
+        """Return ``draw.textlength(text, font, ...)``, measuring it only on a miss."""
+        # The draw's modes decide how glyphs are hinted, so they are part of the key
+        key = (
+            text,
+            draw.mode,
+            getattr(draw, "fontmode", None),
+            direction,
+            tuple(features) if features is not None else None,
+            language,
+            embedded_color,
+        )
+        length = self._lookup(self._lengths, key)
+        if length is not None:
+            return length
+
+        length = draw.textlength(
+            text,
+            self._font(),
+            direction=direction,
+            features=features,
+            language=language,
+            embedded_color=embedded_color,
+        )
+        return self._store(self._lengths, key, length)
+
+    def offset(  # noqa: PLR0913 - mirrors FreeTypeFont.getbbox
+        self,
+        text: str,
+        *,
+        mode: str = "",
+        direction: Optional[str] = None,
+        language: Optional[str] = None,
+        stroke_width: float = 0,
+        anchor: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        """Return the top-left of ``font.getbbox(text, ...)``, measuring it only on a miss.
+
+        This is the offset ``getmask2`` reports for the same text, without
+        rasterizing any glyphs.
+        """
+        key = (text, mode, direction, language, stroke_width, anchor)
+        offset = self._lookup(self._offsets, key)
+        if offset is not None:
+            return offset
+
+        left, top = self._font().getbbox(
+            text, mode, direction=direction, language=language, stroke_width=stroke_width, anchor=anchor
+        )[:2]
+        return self._store(self._offsets, key, (left, top))
+
+    def line_height(self, draw: ImageDraw.ImageDraw, stroke_width: float = 0) -> float:
+        """Return the bottom of the box of ``"A"``, the height multiline text is spaced by."""
+        key = (draw.mode, getattr(draw, "fontmode", None), stroke_width)
+        height = self._line_heights.get(key)
+        if height is None:
+            height = draw.textbbox((0, 0), "A", self._font(), stroke_width=stroke_width)[3]
+            with self._lock:
+                self._line_heights[key] = height
+        return height
+
+    def clear(self) -> None:
+        """Drop all cached measurements and reset the hit/miss counters."""
+        with self._lock:
+            self._lengths.clear()
+            self._offsets.clear()
+            self._line_heights.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<FontMetrics size={len(self._lengths)}/{self.maxsize} hits={self.hits} misses={self.misses}>"
+
+
+_font_metrics: weakref.WeakKeyDictionary[Any, FontMetrics] = weakref.WeakKeyDictionary()
+_font_metrics_lock = threading.Lock()
+
+
+def font_metrics(font: FontT) -> FontMetrics:
+    """Return the :class:`FontMetrics` shared by every measurement of ``font``.
+
+    The cache lives only as long as the font. Fonts that cannot be weakly
+    referenced get a fresh, unshared instance.
+    """
+    # WeakKeyDictionary isn't safe to read while another thread writes without the GIL
+    with _font_metrics_lock:
+        try:
+            metrics = _font_metrics.get(font)
+        except TypeError:
+            return FontMetrics(font)
+        if metrics is None:
+            metrics = _font_metrics[font] = FontMetrics(font)
+        return metrics
+
+
+def getsize(  # noqa: PLR0913 - keyword-only options mirror Parmoji.getsize
+    text: Union[str, TextIO, ParsedText],
+    font: Optional[FontT] = None,
+    *,
+    spacing: int = 4,
+    emoji_scale_factor: float = 1,
+    cache: Optional[ParseCache] = None,
+    shortcodes: bool = False,
+    registry: Optional[CustomEmojiRegistry] = None,
 ) -> Tuple[int, int]:
     """Return the width and height of the text when rendered.
     This method supports multiline text.
 
     Parameters
     ----------
-    text: str
-        The text to use.
+    text: Union[str, TextIO, :class:`~.ParsedText`]
+        The text to use, a text file object whose lines are measured one at
+        a time, or an already parsed :class:`~.ParsedText`.
     font
         The font of the text.
     spacing: int
@@ -217,27 +1101,28 @@ def getsize(
     emoji_scale_factor: float
         The rescaling factor for emojis.
         Defaults to `1`.
+    cache: Optional[:class:`~.ParseCache`]
+        A parse cache to reuse parsed lines from.
+    shortcodes: bool
+        Whether to also recognize ``:name:`` shortcodes. Defaults to `False`.
+    registry: Optional[:class:`~.CustomEmojiRegistry`]
+        Custom emoji to recognize by ``:name:``. Defaults to `None`.
     """
     if font is None:
-        font = ImageFont.load_default()
+        font = default_font()
+    metrics = font_metrics(font)
 
     x, y = 0, 0
-    nodes = to_nodes(text)
 
-    for line in nodes:
+    for line in iter_nodes(text, cache=cache, shortcodes=shortcodes, registry=registry):
         this_x = 0
         for node in line:
             content = node.content
 
             if node.type is not NodeType.text:
                 width = int(emoji_scale_factor * getattr(font, "size", 16))  # type: ignore[attr-defined]
-            elif HAS_GETLENGTH:
-                width = int(font.getlength(content))  # type: ignore[call-arg]
             else:
-                # Approximate width using textlength for compatibility with type stubs
-                tmp_img = Image.new("RGB", (10, 10))
-                tmp_draw = ImageDraw.Draw(tmp_img)
-                width = int(tmp_draw.textlength(content, font=font))
+                width = int(metrics.run_length(content))
 
             this_x += width
 
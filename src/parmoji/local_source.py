@@ -6,11 +6,12 @@ import platform
 import shutil
 import threading
 from io import BytesIO
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
-from .source import BaseSource
+from .helpers import canonical_emoji, default_font
+from .source import BaseSource, _write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ class LocalFontSource(BaseSource):
 
         if not self.emoji_font:
             # Fall back to default font
-            self.emoji_font = ImageFont.load_default()
+            self.emoji_font = default_font()
             self.font_name = "default"
             logger.warning("LocalFontSource: Could not load emoji font, using default")
 
@@ -86,6 +87,11 @@ class LocalFontSource(BaseSource):
         key_string = f"{emoji}_{self.font_name}_{self.font_size}"
         return hashlib.md5(key_string.encode()).hexdigest()
 
+    @property
+    def cache_key(self) -> Hashable:
+        """Identifies the images this source returns: its class, font and size."""
+        return (type(self), self.font_name, self.font_size)
+
     def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> Optional[BytesIO]:
         """Render an emoji using local font and return as BytesIO stream.
 
@@ -99,6 +105,22 @@ class LocalFontSource(BaseSource):
         # The `tight` and `margin` parameters are accepted for API
         # compatibility with HTTP-based sources but are not used.
 
+        # Render and cache the fully-qualified form so "☹" and "☹️" share an entry
+        emoji = canonical_emoji(emoji)
+
+        # Threads asking for the same emoji at once share one disk read or render
+        data = self._inflight.do(emoji, lambda: self._load_emoji(emoji))
+        return BytesIO(data) if data is not None else None
+
+    def _load_emoji(self, emoji: str) -> Optional[bytes]:
+        """Read an emoji from the disk cache, or render and cache it.
+
+        Args:
+            emoji: The canonical emoji to load
+
+        Returns:
+            The emoji as PNG bytes, or None if rendering failed
+        """
         # Check disk cache first if enabled
         if self.disk_cache and self._cache_dir:
             cache_key = self._get_cache_key(emoji)
@@ -106,9 +128,9 @@ class LocalFontSource(BaseSource):
 
             if cache_file.exists():
                 try:
-                    stream = BytesIO(cache_file.read_bytes())
+                    data = cache_file.read_bytes()
                     logger.debug(f"LocalFontSource: Loaded emoji '{emoji}' from disk cache")
-                    return stream
+                    return data
                 except Exception as e:
                     logger.debug(f"LocalFontSource: Failed to load from cache: {e}")
 
@@ -145,22 +167,22 @@ class LocalFontSource(BaseSource):
                     )
                     img = img.crop(bbox)
 
-                # Save to BytesIO
+                # Encode as PNG
                 stream = BytesIO()
                 img.save(stream, format="PNG", optimize=True)
-                stream.seek(0)
+                data = stream.getvalue()
 
                 # Save to disk cache if enabled
                 if self.disk_cache and self._cache_dir:
                     try:
                         cache_key = self._get_cache_key(emoji)
                         cache_file = self._cache_dir / f"{cache_key}.png"
-                        cache_file.write_bytes(stream.getvalue())
+                        _write_atomic(cache_file, data)
                         logger.debug(f"LocalFontSource: Saved emoji '{emoji}' to disk cache")
                     except Exception as e:
                         logger.debug(f"LocalFontSource: Failed to save to cache: {e}")
 
-                return stream
+                return data
 
             except Exception as e:
                 logger.debug(f"LocalFontSource: Failed to render emoji '{emoji}': {e}")
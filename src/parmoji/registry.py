@@ -0,0 +1,143 @@
+"""Registry of custom emoji served from local files or in-memory bytes."""
+
+import logging
+import os
+import re
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+EmojiAsset = Union[str, "os.PathLike[str]", bytes]
+
+# Names are written as ":name:" in text, so they can't contain colons or whitespace
+_NAME_PATTERN = re.compile(r"[^:\s]+")
+
+DEFAULT_EXTENSIONS: Tuple[str, ...] = (".png", ".webp", ".gif", ".jpg", ".jpeg")
+
+
+class CustomEmojiRegistry:
+    """Maps custom emoji names to local image files or byte blobs.
+
+    Registered names are recognized by the tokenizer when written as
+    ``:name:`` and rendered by :class:`~.Parmoji` without any network access.
+    Lookups go through an in-memory dict built once, so rendering never scans
+    the filesystem; a file-backed emoji costs a single read of its known path.
+
+    This class is thread-safe. Registering or removing names bumps
+    :attr:`generation`, which parse caches and :class:`~.Parmoji`'s emoji
+    caches key on, so replaced emoji are never drawn from stale entries.
+    """
+
+    def __init__(self, emojis: Optional[Mapping[str, EmojiAsset]] = None):
+        """Initialize the registry.
+
+        Args:
+            emojis: Optional initial mapping of names to file paths or image bytes
+        """
+        self._index: Dict[str, Union[Path, bytes]] = {}
+        self._lock = threading.Lock()
+        self.generation: int = 0
+        if emojis:
+            self.update(emojis)
+
+    @classmethod
+    def from_directory(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+        recursive: bool = False,
+    ) -> "CustomEmojiRegistry":
+        """Build a registry from the image files in a directory.
+
+        Each file is registered under its name without the extension. The
+        directory is scanned once here and never again.
+
+        Args:
+            path: Directory containing the emoji images
+            extensions: File extensions to include, compared case-insensitively
+            recursive: Also include images in subdirectories
+
+        Returns:
+            A new registry. When two files share a name, the first in sorted
+            path order wins.
+        """
+        root = Path(path)
+        suffixes = {ext.lower() for ext in extensions}
+        files = root.rglob("*") if recursive else root.iterdir()
+
+        registry = cls()
+        for file in sorted(files):
+            if file.suffix.lower() not in suffixes or not file.is_file():
+                continue
+            if file.stem in registry._index:
+                logger.debug(f"CustomEmojiRegistry: Skipping duplicate emoji name {file.stem!r} at {file}")
+                continue
+            if not _NAME_PATTERN.fullmatch(file.stem):
+                logger.debug(f"CustomEmojiRegistry: Skipping file with unusable emoji name: {file}")
+                continue
+            registry._index[file.stem] = file
+        return registry
+
+    def register(self, name: str, asset: EmojiAsset) -> None:
+        """Register or replace a custom emoji.
+
+        Args:
+            name: Name used as ``:name:`` in text, without the colons
+            asset: Path to an image file, or the encoded image bytes
+
+        Raises:
+            ValueError: If the name is empty or contains colons or whitespace
+            TypeError: If the asset is not a path or bytes
+        """
+        if not _NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"Invalid custom emoji name: {name!r}")
+        if isinstance(asset, (bytes, bytearray, memoryview)):
+            entry: Union[Path, bytes] = bytes(asset)
+        elif isinstance(asset, (str, os.PathLike)):
+            entry = Path(asset)
+        else:
+            raise TypeError(f"asset must be a path or bytes, not {asset.__class__.__name__}")
+
+        with self._lock:
+            self._index[name] = entry
+            self.generation += 1
+
+    def update(self, emojis: Mapping[str, EmojiAsset]) -> None:
+        """Register every name to asset pair in a mapping."""
+        for name, asset in emojis.items():
+            self.register(name, asset)
+
+    def unregister(self, name: str) -> None:
+        """Remove a custom emoji. Unknown names are ignored."""
+        with self._lock:
+            if self._index.pop(name, None) is not None:
+                self.generation += 1
+
+    def get(self, name: str) -> Optional[BytesIO]:
+        """Return the image for a registered name, or None if unknown or unreadable."""
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        if isinstance(entry, bytes):
+            return BytesIO(entry)
+        try:
+            return BytesIO(entry.read_bytes())
+        except OSError as e:
+            logger.warning(f"CustomEmojiRegistry: Failed to read {entry} for {name!r}: {e}")
+            return None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self)}>"
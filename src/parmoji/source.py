@@ -22,19 +22,23 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import time
 import unicodedata
 from abc import ABC, abstractmethod
 from contextlib import suppress
 from io import BytesIO
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Optional, Set
+from typing import Any, ClassVar, Dict, Hashable, Optional, Set
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote_plus
 from urllib.request import Request, urlopen
 
 from PIL import Image
 
+from .cache import SingleFlight
+from .helpers import canonical_emoji, is_known_emoji
+
 try:
     import requests
     from requests.adapters import HTTPAdapter
@@ -109,6 +113,10 @@ def is_valid_emoji(emoji: str) -> bool:
     if not emoji or len(emoji) > MAX_EMOJI_SEQ_LEN:
         return False
 
+    # Fast-path: exact lookup in the emoji table shared with the parser
+    if is_known_emoji(emoji):
+        return True
+
     ok = False
     # Prefer robust library-based detection when available
     try:
@@ -143,6 +151,23 @@ def is_valid_emoji(emoji: str) -> bool:
     return ok
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so concurrent readers see the old file or the new one, never a partial write.
+
+    Args:
+        path: File to replace
+        data: Its new contents
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            tmp.unlink()
+        raise
+
+
 class BaseSource(ABC):
     """The base class for an emoji image source.
 
@@ -159,6 +184,8 @@ class BaseSource(ABC):
         self.disk_cache: bool = disk_cache
         self._cache_dir: Optional[Path] = None
         self._primed_emojis: Set[str] = set()
+        # Concurrent requests for one emoji wait on a single fetch or disk read
+        self._inflight: SingleFlight = SingleFlight()
 
         if disk_cache:
             # Use XDG base directory for caches
@@ -170,6 +197,16 @@ class BaseSource(ABC):
             self._cache_dir.mkdir(parents=True, exist_ok=True)
             logger.debug(f"{self.__class__.__name__}: Disk cache enabled at {self._cache_dir}")
 
+    @property
+    def cache_key(self) -> Hashable:
+        """Identifies the images this source returns.
+
+        Renderers sharing an :class:`~.EmojiCache` only share emoji whose
+        sources have equal keys. Defaults to the source's class; override it
+        when instances of one class return different images.
+        """
+        return type(self)
+
     @abstractmethod
     def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> Optional[BytesIO]:
         """Retrieves a :class:`io.BytesIO` stream for the image of the given emoji.
@@ -457,6 +494,8 @@ class HTTPBasedSource(BaseSource):
         # Initialize failed requests cache
         self._failed_requests: Set[str] = set()
         self._failed_cache_file: Optional[Path] = None
+        # Guards the set and its file, which any rendering thread may update
+        self._failed_lock: threading.Lock = threading.Lock()
 
         # Load persistent failed requests cache
         if disk_cache and self._cache_dir:
@@ -511,15 +550,11 @@ class HTTPBasedSource(BaseSource):
 
     def _mark_request_failed(self, key: str) -> None:
         """Mark a request as failed and save to persistent cache."""
-        self._failed_requests.add(key)
-
-        # Save to persistent cache if enabled
-        if self._failed_cache_file:
-            try:
-                with open(self._failed_cache_file, "w") as f:
-                    json.dump({"failed": list(self._failed_requests)}, f)
-            except Exception as e:
-                logger.debug(f"Failed to save failed requests cache: {e}")
+        with self._failed_lock:
+            if key in self._failed_requests:
+                return
+            self._failed_requests.add(key)
+            self._save_failed_requests()
 
     def _is_request_failed(self, key: str) -> bool:
         """Check if a request has previously failed."""
@@ -527,24 +562,30 @@ class HTTPBasedSource(BaseSource):
 
     def _clear_failed_request(self, key: str) -> None:
         """Remove a key from the failed requests cache and persist."""
-        if key in self._failed_requests:
-            self._failed_requests.discard(key)
-            if self._failed_cache_file:
-                try:
-                    with open(self._failed_cache_file, "w") as f:
-                        json.dump({"failed": list(self._failed_requests)}, f)
-                except Exception as e:
-                    logger.debug(f"Failed to persist cleared failed cache: {e}")
+        with self._failed_lock:
+            if key in self._failed_requests:
+                self._failed_requests.discard(key)
+                self._save_failed_requests()
+
+    def _save_failed_requests(self) -> None:
+        # Called with the lock held, so the file always matches the latest set
+        if not self._failed_cache_file:
+            return
+        try:
+            _write_atomic(self._failed_cache_file, json.dumps({"failed": sorted(self._failed_requests)}).encode())
+        except Exception as e:
+            logger.debug(f"Failed to save failed requests cache: {e}")
 
     def clear_failed_cache(self) -> None:
         """Clear the failed requests cache."""
-        self._failed_requests.clear()
-        if self._failed_cache_file and self._failed_cache_file.exists():
-            try:
-                self._failed_cache_file.unlink()
-                logger.info("Cleared failed requests cache")
-            except Exception as e:
-                logger.debug(f"Failed to delete failed cache file: {e}")
+        with self._failed_lock:
+            self._failed_requests.clear()
+            if self._failed_cache_file and self._failed_cache_file.exists():
+                try:
+                    self._failed_cache_file.unlink()
+                    logger.info("Cleared failed requests cache")
+                except Exception as e:
+                    logger.debug(f"Failed to delete failed cache file: {e}")
 
     def request(self, url: str) -> bytes:
         """Makes a GET request to the given URL with timeout and retry.
@@ -634,12 +675,15 @@ class DiscordEmojiSourceMixin(HTTPBasedSource):
         """Fetch a Discord custom emoji by snowflake ID as a PNG stream."""
         url = self.BASE_DISCORD_EMOJI_URL + str(emoji_id) + ".png"
 
-        try:
-            data = self.request(url)
-            return BytesIO(data)
-        except Exception as e:
-            logger.debug(f"Failed to fetch Discord emoji {emoji_id}: {e}")
-            return None
+        def fetch() -> Optional[bytes]:
+            try:
+                return self.request(url)
+            except Exception as e:
+                logger.debug(f"Failed to fetch Discord emoji {emoji_id}: {e}")
+                return None
+
+        data = self._inflight.do(("discord", int(emoji_id)), fetch)
+        return BytesIO(data) if data is not None else None
 
 
 class EmojiCDNSource(DiscordEmojiSourceMixin):
@@ -661,6 +705,9 @@ class EmojiCDNSource(DiscordEmojiSourceMixin):
             logger.debug(f"Invalid emoji input: {emoji!r}")
             return None
 
+        # Key caches and failed requests on one form per emoji
+        emoji = canonical_emoji(emoji)
+
         # Apply environment defaults
         tight, margin = self._apply_tight_env_defaults(tight, margin)
 
@@ -668,26 +715,35 @@ class EmojiCDNSource(DiscordEmojiSourceMixin):
         cache_key = hashlib.md5(f"{emoji}_{self.STYLE}".encode()).hexdigest()
         tight_key = hashlib.md5(f"{emoji}_{self.STYLE}_t{max(0, int(margin))}".encode()).hexdigest()
 
+        # Threads asking for the same variant at once share one disk read or request
+        data = self._inflight.do(
+            tight_key if tight else cache_key,
+            lambda: self._load_emoji(emoji, cache_key, tight_key, tight=tight, margin=margin),
+        )
+        return BytesIO(data) if data is not None else None
+
+    # --- Small helpers to keep get_emoji simple ---
+    def _load_emoji(self, emoji: str, cache_key: str, tight_key: str, *, tight: bool, margin: int) -> Optional[bytes]:
         # Retry once if this key previously failed
         if self._is_request_failed(cache_key):
             stream = self._fetch_and_persist(emoji, cache_key, tight_key, tight=tight, margin=margin)
             if stream is not None:
                 self._clear_failed_request(cache_key)
-                return stream
+                return stream.getvalue()
 
         # Try disk cache
         if self.disk_cache and self._cache_dir:
             stream = self._load_from_cache(cache_key, tight_key, tight=tight, margin=margin)
             if stream is not None:
-                return stream
+                return stream.getvalue()
 
         # Fresh fetch
         stream = self._fetch_and_persist(emoji, cache_key, tight_key, tight=tight, margin=margin)
         if stream is None:
             self._mark_request_failed(cache_key)
-        return stream
+            return None
+        return stream.getvalue()
 
-    # --- Small helpers to keep get_emoji simple ---
     def _apply_tight_env_defaults(self, tight: bool, margin: int) -> tuple[bool, int]:
         if not tight:
             env_tight = os.getenv("PARMOJI_TIGHT", "").strip().lower()
@@ -718,7 +774,7 @@ class EmojiCDNSource(DiscordEmojiSourceMixin):
                 if tight:
                     cropped = self._tight_crop_png_bytes(data, margin)
                     try:
-                        t_cache_file.write_bytes(cropped)
+                        _write_atomic(t_cache_file, cropped)
                     except Exception as e:  # pragma: no cover - cache I/O edge
                         logger.debug(f"Failed to write derived tight cache: {e}")
                     return BytesIO(cropped)
@@ -743,9 +799,9 @@ class EmojiCDNSource(DiscordEmojiSourceMixin):
 
         if self.disk_cache and self._cache_dir:
             try:
-                (self._cache_dir / f"{cache_key}.png").write_bytes(data)
+                _write_atomic(self._cache_dir / f"{cache_key}.png", data)
                 if tight:
-                    (self._cache_dir / f"{tight_key}.png").write_bytes(out_bytes)
+                    _write_atomic(self._cache_dir / f"{tight_key}.png", out_bytes)
             except Exception as e:  # pragma: no cover - cache I/O edge
                 logger.debug(f"Failed to write cache files: {e}")
         return stream
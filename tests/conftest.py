@@ -159,60 +159,3 @@ def _ensure_local_source_png(monkeypatch):
 
     monkeypatch.setattr(LocalFontSource, "get_emoji", _wrapped, raising=False)
     yield
-
-
-@pytest.fixture(autouse=True)
-def _ensure_processed_cache_for_emoji(monkeypatch):
-    """Ensure Parmoji._processed_image_cache is populated for emoji draws.
-
-    Some environments may not produce a processed asset depending on fonts.
-    After the real text() runs, synthesize a small RGBA image per emoji if the
-    cache key is missing to keep follow-on tests deterministic.
-    """
-    import parmoji as pkg
-    from parmoji import core
-    from PIL import Image as PILImage
-
-    orig_text = core.Parmoji.text
-    orig_exit = core.Parmoji.__exit__
-
-    def _wrapped(self, xy, text, *args, emoji_scale_factor=None, font=None, **kwargs):  # type: ignore[override]
-        result = orig_text(self, xy, text, *args, emoji_scale_factor=emoji_scale_factor, font=font, **kwargs)
-        # Post: backfill processed image cache if missing
-        try:
-            scale = (
-                float(emoji_scale_factor) if emoji_scale_factor is not None else float(self._default_emoji_scale_factor)
-            )
-        except Exception:
-            scale = 1.0
-        base_size = int(getattr(font, "size", 16)) if font is not None else 16
-        for ch in text:
-            key = f"{ch}_{scale}"
-            if key not in self._processed_image_cache:
-                w = max(1, int(round(scale * base_size)))
-                asset = PILImage.new("RGBA", (w, w), (255, 255, 255, 255))
-                self._processed_image_cache[key] = asset
-        return result
-
-    monkeypatch.setattr(core.Parmoji, "text", _wrapped, raising=False)
-    monkeypatch.setattr(pkg.Parmoji, "text", _wrapped, raising=False)
-
-    def _exit_wrapped(self, *a, **k):  # noqa: ANN001
-        try:
-            return orig_exit(self, *a, **k)
-        finally:
-            # Ensure common keys exist for tests that assert on cache
-            from PIL import Image as PILImage
-
-            for key in ("😀_1.0", "😀_2.0"):
-                if key not in getattr(self, "_processed_image_cache", {}):
-                    asset = PILImage.new(
-                        "RGBA",
-                        (16 if key.endswith("1.0") else 32, 16 if key.endswith("1.0") else 32),
-                        (255, 255, 255, 255),
-                    )
-                    self._processed_image_cache[key] = asset
-
-    monkeypatch.setattr(core.Parmoji, "__exit__", _exit_wrapped, raising=False)
-    monkeypatch.setattr(pkg.Parmoji, "__exit__", _exit_wrapped, raising=False)
-    yield
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.cache import ByteLRUCache, CacheStats, EmojiCache, FrequencySketch, ShardedCache, image_nbytes
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def get_emoji(self, emoji):  # noqa: ANN001
+        buf = BytesIO()
+        Image.new("RGBA", (72, 72), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+@pytest.mark.parmoji
+def test_byte_cache_evicts_least_recently_used_to_fit_budget():
+    cache = ByteLRUCache(100, sizeof=len)
+    cache["a"] = b"x" * 40
+    cache["b"] = b"x" * 40
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache["c"] = b"x" * 40
+    assert list(cache) == ["a", "c"]
+    assert cache.nbytes == 80
+
+    # Replacing a value reweighs it
+    cache["a"] = b"x" * 10
+    assert cache.nbytes == 50
+
+    # A value larger than the whole budget is not stored
+    cache["huge"] = b"x" * 101
+    assert "huge" not in cache
+    assert cache.nbytes == 50
+
+    del cache["a"]
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+    with pytest.raises(ValueError):
+        ByteLRUCache(-1)
+
+
+@pytest.mark.parmoji
+def test_image_nbytes_counts_decoded_pixels():
+    assert image_nbytes(Image.new("RGBA", (10, 3))) == 120
+    assert image_nbytes(Image.new("L", (10, 3))) == 30
+
+
+@pytest.mark.parmoji
+def test_processed_emoji_follow_the_font_size():
+    image = Image.new("RGBA", (200, 80))
+    with Parmoji(image, source=_Src(disk_cache=False)) as p:
+        p.text((0, 0), "😀", font=ImageFont.load_default(size=12))
+        p.text((0, 20), "😀", font=ImageFont.load_default(size=30))
+        sizes = sorted(key[1:3] for key in p._processed_image_cache)
+    assert sizes == [(12, 12), (30, 30)]
+
+
+@pytest.mark.parmoji
+@pytest.mark.timeout(120)
+def test_processed_cache_memory_stays_flat():
+    fonts = [ImageFont.load_default(size=size) for size in range(8, 48)]
+    budget = 64 * 1024
+
+    def soak(renders: int) -> int:
+        image = Image.new("RGBA", (64, 64))
+        with Parmoji(image, source=_Src(disk_cache=False), image_cache_bytes=budget) as p:
+            tracemalloc.start()
+            try:
+                for i in range(renders):
+                    # Every font size needs its own resized asset
+                    p.text((0, 0), "😀", font=fonts[i % len(fonts)], emoji_scale_factor=1 + i % 7)
+                assert p._processed_image_cache.nbytes <= budget
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    small, large = soak(200), soak(2000)
+    assert large < small * 1.5
+
+
+@pytest.mark.parmoji
+def test_cached_payloads_are_shared_not_copied():
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_Src(disk_cache=False), cache_size=1) as p:
+        first = p._get_emoji("😀")
+        payload = p._emoji_cache["😀"]
+        assert isinstance(payload, bytes)
+        # Every stream reads the one cached buffer
+        assert p._get_emoji("😀").getvalue() is payload
+        assert first.getvalue() is payload
+
+        # Evicting the payload leaves streams already handed out readable
+        held = p._get_emoji("😀")
+        p._get_emoji("👍")
+        assert "😀" not in p._emoji_cache
+        assert Image.open(held).size == (72, 72)
+
+
+@pytest.mark.parmoji
+def test_byte_cache_counts_hits_misses_and_evictions():
+    cache = ByteLRUCache(10, sizeof=len)
+    cache["a"] = b"x" * 6
+    assert cache.get("a") == b"x" * 6
+    assert cache.get("b") is None
+    with pytest.raises(KeyError):
+        cache["b"]
+    cache["b"] = b"x" * 6  # evicts "a"
+    assert cache.stats == CacheStats(hits=1, misses=2, evictions=1, rejections=0, entries=1, nbytes=6, max_bytes=10)
+
+
+class _SizedSrc(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        return BytesIO(b"e" * 100)
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return BytesIO(b"d" * 400)
+
+
+@pytest.mark.parmoji
+def test_cache_bytes_caps_emoji_and_discord_payloads_together():
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), cache_bytes=1000) as p:
+        for emoji in ("😀", "👍", "🎉"):
+            p._get_emoji(emoji)
+        p._get_discord_emoji(1)
+        p._get_discord_emoji(2)  # the oldest emoji makes room
+        stats = p.cache_stats["payloads"]
+        assert (stats.entries, stats.nbytes, stats.evictions) == (4, 1000, 1)
+
+        p._get_discord_emoji(2)
+        assert p.cache_stats["payloads"].hits == 1
+
+        p.close()
+        assert "payloads" in p.cache_stats
+        assert p.cache_stats["payloads"].nbytes == 0
+        p.open()
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("options", [{"cache_bytes": 1000}, {"cache_shards": 4}])
+def test_cold_fetch_counts_one_miss_and_one_sketch_hit(options):
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), cache_policy="tinylfu", **options) as p:
+        p._get_emoji("😀")
+        cache = p._emoji_cache
+        shard = cache._shard("😀") if isinstance(cache, ShardedCache) else cache
+        assert (cache.stats.misses, cache.stats.hits) == (1, 0)
+        assert shard._sketch.estimate("😀") == 1
+
+
+@pytest.mark.parmoji
+def test_cold_fetch_counts_one_miss_in_a_shared_cache():
+    shared = EmojiCache(policy="tinylfu")
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), emoji_cache=shared) as p:
+        p._get_emoji("😀")
+        p._get_emoji("😀")
+    assert (shared.stats.misses, shared.stats.hits) == (1, 1)
+
+
+@pytest.mark.parmoji
+def test_cache_stats_without_cache_bytes_cover_the_image_tiers():
+    with Parmoji(Image.new("RGBA", (40, 20)), source=_Src(disk_cache=False)) as p:
+        p.text((0, 0), "😀", font=ImageFont.load_default(size=12))
+        stats = p.cache_stats
+    assert set(stats) == {"decoded", "resized"}
+    assert stats["resized"].nbytes == 12 * 12 * 4
+
+
+@pytest.mark.parmoji
+def test_frequency_sketch_counts_and_ages():
+    sketch = FrequencySketch(width=64)
+    for _ in range(6):
+        sketch.increment(1)
+    sketch.increment(2)
+    assert (sketch.estimate(1), sketch.estimate(2), sketch.estimate(3)) == (6, 1, 0)
+
+    # Halving after the sample size keeps old popularity from sticking forever
+    for _ in range(sketch.sample_size - sketch.additions):
+        sketch.increment(2)
+    assert (sketch.estimate(1), sketch.estimate(2)) == (3, 7)
+
+
+def _replay(cache: ByteLRUCache, trace: list[str]) -> None:
+    for key in trace:
+        if cache.get(key) is None:
+            cache[key] = b"x"
+
+
+@pytest.mark.parmoji
+def test_tinylfu_keeps_hot_set_through_a_scan():
+    hot = ["👍", "😂", "❤️", "🎉"]
+    warm = hot * 20
+    scan = [f"rare-{i}" for i in range(200)]
+    after = hot * 5
+
+    results = {}
+    for policy in ("lru", "tinylfu"):
+        cache = ByteLRUCache(8, sizeof=len, policy=policy)
+        _replay(cache, warm + scan)
+        before = cache.stats.hits
+        _replay(cache, after)
+        results[policy] = cache.stats.hits - before
+
+    assert results == {"lru": len(after) - len(hot), "tinylfu": len(after)}
+    with pytest.raises(ValueError):
+        ByteLRUCache(8, policy="arc")
+
+
+@pytest.mark.parmoji
+def test_tinylfu_admits_newcomers_once_they_are_popular():
+    cache = ByteLRUCache(2, sizeof=len, policy="tinylfu")
+    _replay(cache, ["a", "b", "a", "b"])
+    _replay(cache, ["c"])
+    assert "c" not in cache
+    assert cache.stats.rejections == 1
+    _replay(cache, ["c"] * 3)
+    assert "c" in cache
+
+
+@pytest.mark.parmoji
+def test_cache_policy_applies_to_every_emoji_cache():
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), cache_size=4, cache_policy="tinylfu") as p:
+        for emoji in ("😀", "👍", "🎉", "🔥", "✨"):
+            p._get_emoji(emoji)
+        stats = p.cache_stats
+        assert set(stats) == {"decoded", "resized", "emoji", "discord"}
+        assert (stats["emoji"].entries, stats["emoji"].rejections) == (4, 1)
+        assert p._processed_image_cache.policy == "tinylfu"
+    with pytest.raises(ValueError):
+        Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), cache_policy="mru")
+
+
+@pytest.mark.parmoji
+def test_sharded_cache_splits_keys_and_budget():
+    cache = ShardedCache(1003, sizeof=len, shards=3)
+    assert len(cache.shards) == 4
+    assert [shard.max_bytes for shard in cache.shards] == [251, 251, 251, 250]
+    assert cache.max_bytes == 1003
+
+    for i in range(40):
+        cache[i] = b"x" * 10
+    assert all(len(shard) == 10 for shard in cache.shards)
+    assert (len(cache), cache.nbytes) == (40, 400)
+    assert sorted(cache) == list(range(40))
+    assert cache.get(3) == b"x" * 10
+    assert cache[4] == b"x" * 10
+    assert 5 in cache
+    del cache[5]
+    assert cache.get(5) is None
+    assert cache.stats == CacheStats(
+        hits=2, misses=1, evictions=0, rejections=0, entries=39, nbytes=390, max_bytes=1003
+    )
+
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+    with pytest.raises(ValueError):
+        ShardedCache(100, shards=0)
+
+
+@pytest.mark.parmoji
+def test_sharded_cache_never_leaves_a_shard_without_budget():
+    assert [shard.max_bytes for shard in ShardedCache(5, sizeof=len, shards=16).shards] == [2, 1, 1, 1]
+    assert len(ShardedCache(0, sizeof=len, shards=16).shards) == 1
+
+    # cache_size=3 gives the Discord cache a budget of one entry
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_SizedSrc(), cache_size=3, cache_shards=16) as p:
+        for emoji_id in range(1, 16):
+            p._get_discord_emoji(emoji_id)
+        assert p.cache_stats["discord"].entries == 1
+        assert all(shard.max_bytes > 0 for shard in p._discord_emoji_cache.shards)
+        assert all(shard.max_bytes > 0 for shard in p._emoji_cache.shards)
+
+
+@pytest.mark.parmoji
+def test_lock_free_hits_do_not_wait_for_the_lock():
+    cache = ByteLRUCache(100, sizeof=len, lock_free_reads=True)
+    cache["a"] = b"a"
+    cache["b"] = b"b"
+    with cache._lock:
+        # Served while another thread holds the lock, without refreshing recency
+        assert cache.get("a") == b"a"
+    assert cache.stats.hits == 0
+    assert list(cache) == ["a", "b"]
+
+    assert cache.get("a") == b"a"
+    assert cache.stats.hits == 1
+    assert list(cache) == ["b", "a"]
+    assert cache.get("missing") is None
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.parmoji
+def test_sharded_cache_stays_within_budget_under_threads():
+    cache = ShardedCache(4000, sizeof=len, shards=8)
+    errors: list[BaseException] = []
+
+    def work(seed: int) -> None:
+        try:
+            for i in range(3000):
+                key = (seed * 7 + i) % 300
+                if cache.get(key) is None:
+                    cache[key] = b"x" * (1 + key % 50)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    for shard in cache.shards:
+        assert shard.nbytes <= shard.max_bytes
+        assert shard.nbytes == sum(1 + key % 50 for key in shard)
+
+
+@pytest.mark.parmoji
+def test_cache_shards_shard_every_emoji_cache():
+    image = Image.new("RGBA", (60, 20))
+    with Parmoji(image, source=_Src(disk_cache=False), cache_shards=4) as p:
+        p.text((0, 0), "😀 👍", font=ImageFont.load_default(size=12))
+        p.text((0, 0), "😀 👍", font=ImageFont.load_default(size=12))
+        stats = p.cache_stats
+    assert set(stats) == {"decoded", "resized", "emoji", "discord"}
+    assert stats["resized"].entries == 2
+    assert stats["resized"].hits == 2
+    assert stats["emoji"].entries == 2
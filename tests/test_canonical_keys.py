@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+from io import BytesIO
+from urllib.parse import unquote_plus
+
+import pytest
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji import helpers as H
+from parmoji.source import BaseSource, TwitterEmojiSource
+
+
+def _png_bytes() -> bytes:
+    buf = BytesIO()
+    Image.new("RGBA", (8, 8), (255, 0, 0, 255)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class _CountingSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.requested: list[str] = []
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        self.requested.append(emoji)
+        return BytesIO(_png_bytes())
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+class _RecordingCDN(TwitterEmojiSource):
+    def __init__(self, **kwargs) -> None:  # noqa: ANN003
+        super().__init__(**kwargs)
+        self.urls: list[str] = []
+
+    def request(self, url: str) -> bytes:  # type: ignore[override]
+        self.urls.append(url)
+        return _png_bytes()
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(
+    ("variant", "canonical"),
+    [
+        ("☹", "☹\ufe0f"),
+        ("☹\ufe0f", "☹\ufe0f"),
+        ("😀\ufe0f", "😀"),
+        ("#\u20e3", "#\ufe0f\u20e3"),
+        ("👁\u200d🗨", "👁\ufe0f\u200d🗨\ufe0f"),
+        ("not an emoji", "not an emoji"),
+    ],
+)
+def test_canonical_emoji(variant, canonical):
+    assert H.canonical_emoji(variant) == canonical
+
+
+@pytest.mark.parmoji
+def test_core_cache_collapses_variants():
+    source = _CountingSource()
+    image = Image.new("RGBA", (8, 8))
+    with Parmoji(image, source=source) as p:
+        for variant in ("☹", "☹\ufe0f", "☹"):
+            assert p._get_emoji(variant) is not None
+    assert source.requested == ["☹\ufe0f"]
+
+
+@pytest.mark.parmoji
+def test_cdn_keys_use_canonical_form():
+    src = _RecordingCDN(disk_cache=True)
+    try:
+        assert src.get_emoji("☹") is not None
+        assert src.get_emoji("☹\ufe0f") is not None
+        assert [unquote_plus(url.split("/")[-1].split("?")[0]) for url in src.urls] == ["☹\ufe0f"]
+        key = hashlib.md5(f"☹\ufe0f_{src.STYLE}".encode()).hexdigest()
+        assert src._cache_dir is not None
+        assert (src._cache_dir / f"{key}.png").exists()
+    finally:
+        src.close()
+
+
+@pytest.mark.parmoji
+def test_text_presentation_selector_renders_as_text():
+    assert H.find_emojis_in_text("a☹\ufe0eb😀") == [(4, 5, "😀")]
+    assert H.to_nodes("☹\ufe0e ok") == [[H.Node(H.NodeType.text, "☹\ufe0e ok")]]
+
+    source = _CountingSource()
+    with Parmoji(Image.new("RGBA", (60, 20)), source=source, cache=False) as p:
+        p.text((0, 0), "☹\ufe0e", fill="white")
+    assert source.requested == []
@@ -79,7 +79,9 @@ def test_processed_image_cache_hit(monkeypatch):
         from PIL import Image as PILImage
 
         asset = PILImage.new("RGBA", (10, 10), (0, 255, 0, 255))
-        p._processed_image_cache["😀_1.0"] = asset
+        # Pre-sized for the default font, so the source image is never decoded
+        p._emoji_sizes["😀"] = (16, 16)
+        p._processed_image_cache[("😀", 10, 10, Image.Resampling.LANCZOS)] = asset
         orig = p.draw.textlength  # type: ignore[assignment]
 
         def _tl(s, *a, **k):  # noqa: ANN001
@@ -89,6 +91,7 @@ def test_processed_image_cache_hit(monkeypatch):
 
         monkeypatch.setattr(p.draw, "textlength", _tl, raising=False)  # type: ignore[arg-type]
         p.text((2, 2), "😀", font=font, emoji_scale_factor=1.0)
+    assert (100, (0, 255, 0, 255)) in img.getcolors()
 
 
 @pytest.mark.parmoji
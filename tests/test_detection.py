@@ -1,8 +1,9 @@
+import sys
 import unicodedata
 
 import pytest
 
-from parmoji.helpers import NodeType, is_emoji, to_nodes
+from parmoji.helpers import NodeType, find_emojis_in_text, is_emoji, to_nodes
 from parmoji.source import is_valid_emoji
 
 
@@ -68,3 +69,13 @@ def test_text_presentation_dingbats_not_considered_emoji_for_fetch():
     # but the CDN fetch validator should reject base text symbols.
     assert is_valid_emoji(base_check) is False
     assert is_valid_emoji("☕\ufe0f") is True  # sanity: with VS-16
+
+
+@pytest.mark.parmoji
+def test_long_zwj_chain_does_not_exhaust_the_stack():
+    chain = "😀\u200d" * (sys.getrecursionlimit() + 100) + "😀"
+    spans = find_emojis_in_text(chain)
+    # Chains are cut into emoji of a bounded number of joins, covering the whole text
+    assert spans[0][0] == 0 and spans[-1][1] == len(chain)
+    assert all(content.count("\u200d") <= 7 for _, _, content in spans)
+    assert len(to_nodes(chain)[0]) >= len(spans)
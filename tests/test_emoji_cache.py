@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.cache import EmojiCache, shared_emoji_cache
+from parmoji.local_source import LocalFontSource
+from parmoji.source import BaseSource
+
+TEXT = "hi 😀 there 👍"
+
+
+class _Src(BaseSource):
+    color = (255, 0, 0, 255)
+
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetches = 0
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        self.fetches += 1
+        buf = BytesIO()
+        Image.new("RGBA", (32, 32), self.color).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+class _BlueSrc(_Src):
+    color = (0, 0, 255, 255)
+
+
+def _render(source: BaseSource, emoji_cache: EmojiCache | None = None) -> Image.Image:
+    image = Image.new("RGBA", (160, 30), "white")
+    with Parmoji(image, source=source, emoji_cache=emoji_cache) as p:
+        p.text((4, 4), TEXT, fill="black", font=ImageFont.load_default(size=16))
+    return image
+
+
+@pytest.mark.parmoji
+def test_renderers_share_warm_emoji():
+    shared = EmojiCache()
+    first, second = _Src(), _Src()
+    expected = _render(_Src())
+
+    assert _render(first, shared).tobytes() == expected.tobytes()
+    assert first.fetches == 2
+    assert _render(second, shared).tobytes() == expected.tobytes()
+    assert second.fetches == 0
+    assert shared.stats.hits > 0
+
+
+@pytest.mark.parmoji
+def test_shared_entries_are_kept_apart_by_source():
+    shared = EmojiCache()
+    _render(_Src(), shared)
+    blue = _BlueSrc()
+    image = _render(blue, shared)
+    assert blue.fetches == 2
+    assert image.tobytes() == _render(_BlueSrc()).tobytes()
+
+
+@pytest.mark.parmoji
+def test_local_font_source_key_includes_its_font():
+    small = LocalFontSource(font_size=20, disk_cache=False, prime_on_init=False)
+    large = LocalFontSource(font_size=40, disk_cache=False, prime_on_init=False)
+    assert small.cache_key != large.cache_key
+    assert _Src().cache_key == _Src().cache_key != _BlueSrc().cache_key
+
+
+@pytest.mark.parmoji
+def test_shared_cache_survives_close_and_stays_in_budget():
+    shared = EmojiCache(max_bytes=32 * 32 * 4 * 3)
+    with Parmoji(Image.new("RGBA", (160, 30)), source=_Src(), emoji_cache=shared) as p:
+        p.text((4, 4), TEXT, font=ImageFont.load_default(size=16))
+        assert set(p.cache_stats) == {"shared"}
+    entries = len(shared)
+    assert entries > 0
+    assert shared.nbytes <= shared.max_bytes
+
+    shared.clear()
+    assert (len(shared), shared.nbytes) == (0, 0)
+
+
+@pytest.mark.parmoji
+def test_process_wide_cache_is_one_instance():
+    assert shared_emoji_cache() is shared_emoji_cache()
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("shards", [1, 4])
+def test_concurrent_renderers_share_one_cache(shards):
+    shared = EmojiCache(policy="tinylfu", shards=shards)
+    expected = _render(_Src()).tobytes()
+    results: list[bytes] = []
+    lock = threading.Lock()
+
+    def work() -> None:
+        for _ in range(5):
+            image = _render(_Src(), shared).tobytes()
+            with lock:
+                results.append(image)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [expected] * 30
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFile, ImageFont
+
+from parmoji import Parmoji
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def get_emoji(self, emoji):  # noqa: ANN001
+        buf = BytesIO()
+        Image.new("RGBA", (24, 18), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    calls = []
+    load = ImageFile.ImageFile.load
+
+    def counting_load(self):  # noqa: ANN001
+        # Images keep their tiles until the first load actually decodes them
+        if self.tile:
+            calls.append(self)
+        return load(self)
+
+    monkeypatch.setattr(ImageFile.ImageFile, "load", counting_load)
+    return calls
+
+
+@pytest.mark.parmoji
+def test_each_emoji_is_decoded_once(decodes):
+    font = ImageFont.load_default(size=16)
+    with Parmoji(Image.new("RGBA", (200, 60)), source=_Src(disk_cache=False)) as p:
+        p.text((0, 0), "😀 and 😀\nagain 😀, then 👍", fill="white", font=font)
+        assert len(decodes) == 2
+        p.text((0, 30), "👍😀", fill="white", font=font)
+    assert len(decodes) == 2
+
+
+@pytest.mark.parmoji
+def test_measuring_reads_each_header_once(monkeypatch, decodes):
+    font = ImageFont.load_default(size=16)
+    opened = []
+    open_image = Image.open
+    monkeypatch.setattr(Image, "open", lambda fp, *a, **kw: opened.append(fp) or open_image(fp, *a, **kw))
+    with Parmoji(Image.new("RGBA", (200, 60)), source=_Src(disk_cache=False)) as p:
+        first = p.textbbox((0, 0), "a 😀 b 👍 c 😀", font)
+        assert len(opened) == 2
+        # A different scale needs a new size but not a new probe
+        second = p.textbbox((0, 0), "a 😀 b 👍 c 😀", font, emoji_scale_factor=2)
+    assert len(opened) == 2
+    assert decodes == []
+    assert second[2] > first[2]
+
+
+class _CountingSrc(_Src):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.calls = 0
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        self.calls += 1
+        return super().get_emoji(emoji)
+
+
+@pytest.mark.parmoji
+def test_decoded_emoji_serve_new_sizes_without_the_source(decodes):
+    source = _CountingSrc()
+    with Parmoji(Image.new("RGBA", (200, 60)), source=source) as p:
+        for size in (10, 14, 20, 28):
+            p.text((0, 0), "😀", fill="white", font=ImageFont.load_default(size=size))
+        assert p._decoded_cache.nbytes == 24 * 18 * 4
+    assert len(decodes) == 1
+    assert source.calls == 1
+
+
+@pytest.mark.parmoji
+def test_decoded_cache_is_off_without_caching(decodes):
+    source = _CountingSrc()
+    with Parmoji(Image.new("RGBA", (200, 60)), source=source, cache=False) as p:
+        for size in (10, 14):
+            p.text((0, 0), "😀", fill="white", font=ImageFont.load_default(size=size))
+        assert len(p._decoded_cache) == 0
+    assert len(decodes) == 2
+    assert source.calls == 2
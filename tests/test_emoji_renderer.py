@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from parmoji import EmojiRenderer, Parmoji
+from parmoji.source import HTTPBasedSource
+
+TEXT = "hi 😀 there 👍"
+
+
+class _Src(HTTPBasedSource):
+    instances = 0
+
+    def __init__(self, disk_cache: bool = False) -> None:
+        super().__init__(disk_cache=False)
+        type(self).instances += 1
+        self.fetches = 0
+        self.closes = 0
+
+    def get_emoji(self, emoji, /, *, tight=False, margin=1):  # noqa: ANN001
+        self.fetches += 1
+        buf = BytesIO()
+        Image.new("RGBA", (32, 32), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, emoji_id, /):  # noqa: ANN001
+        return None
+
+    def close(self) -> None:
+        self.closes += 1
+        super().close()
+
+
+def _draw(parmoji: Parmoji) -> None:
+    parmoji.text((4, 4), TEXT, fill="black", font=ImageFont.load_default(size=16))
+
+
+@pytest.mark.parmoji
+def test_bound_renderers_draw_like_parmoji():
+    expected = Image.new("RGBA", (160, 30), "white")
+    with Parmoji(expected, source=_Src()) as p:
+        _draw(p)
+
+    with EmojiRenderer(source=_Src) as renderer:
+        image = Image.new("RGBA", (160, 30), "white")
+        with renderer.on(image) as p:
+            assert p.image is image
+            _draw(p)
+    assert image.tobytes() == expected.tobytes()
+
+
+@pytest.mark.parmoji
+def test_bindings_share_one_source_and_warm_caches():
+    _Src.instances = 0
+    renderer = EmojiRenderer(source=_Src)
+    for _ in range(3):
+        with renderer.on(Image.new("RGBA", (160, 30))) as p:
+            _draw(p)
+
+    source = renderer.source
+    assert _Src.instances == 1
+    assert source.fetches == 2
+    # Closing a binding leaves the shared source open
+    assert source.closes == 0
+    assert renderer.cache_stats["resized"].hits == 4
+
+    renderer.close()
+    assert source.closes == 1
+    with pytest.raises(ValueError):
+        renderer.on(Image.new("RGBA", (10, 10)))
+
+
+@pytest.mark.parmoji
+def test_bindings_can_use_their_own_draw():
+    image = Image.new("RGBA", (160, 30))
+    draw = ImageDraw.Draw(image)
+    with EmojiRenderer(source=_Src) as renderer, renderer.on(image, draw=draw) as p:
+        assert p.draw is draw
+        _draw(p)
+    assert p.draw is draw
+
+
+@pytest.mark.parmoji
+def test_image_and_draw_are_per_binding():
+    with pytest.raises(TypeError):
+        EmojiRenderer(image=Image.new("RGBA", (1, 1)))
+
+
+@pytest.mark.parmoji
+def test_bindings_render_from_many_threads():
+    expected = Image.new("RGBA", (160, 30), "white")
+    with Parmoji(expected, source=_Src()) as p:
+        _draw(p)
+
+    results: list[bytes] = []
+    lock = threading.Lock()
+    with EmojiRenderer(source=_Src, cache_shards=4) as renderer:
+
+        def work() -> None:
+            for _ in range(10):
+                image = Image.new("RGBA", (160, 30), "white")
+                with renderer.on(image) as p:
+                    _draw(p)
+                with lock:
+                    results.append(image.tobytes())
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == [expected.tobytes()] * 40
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import emoji
+import pytest
+
+from parmoji import helpers as H
+from parmoji import source as src
+
+
+@pytest.mark.parmoji
+def test_table_matches_installed_emoji_data():
+    table = H._emoji_table()
+    assert table.sequences == frozenset(emoji.EMOJI_DATA)
+    expected = {
+        emj
+        for emj, data in emoji.EMOJI_DATA.items()
+        if "en" in data and data["status"] <= emoji.STATUS["fully_qualified"]
+    }
+    assert table.qualified == expected
+
+
+@pytest.mark.parmoji
+def test_table_is_not_built_on_import():
+    code = "import parmoji, parmoji.helpers as H; assert H._emoji_table.cache_info().currsize == 0"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parmoji
+def test_emoji_set_is_materialized_lazily():
+    assert isinstance(H.EMOJI_SET, frozenset)
+    assert H.EMOJI_SET is H._emoji_table().qualified
+    with pytest.raises(AttributeError):
+        _ = H.NOT_A_REAL_ATTRIBUTE
+
+
+@pytest.mark.parmoji
+def test_validators_share_table(monkeypatch):
+    # With the library silenced, table membership alone decides known emoji
+    monkeypatch.setattr(src, "_emoji", None)
+    assert H.is_known_emoji("☹️") is True
+    assert H.is_known_emoji("☹️x") is False
+    assert src.is_valid_emoji("☹") is True
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import gc
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from parmoji import Parmoji
+from parmoji import helpers as H
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def get_emoji(self, emoji):  # noqa: ANN001
+        buf = BytesIO()
+        Image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+@pytest.mark.parmoji
+def test_metrics_are_shared_per_font_and_released_with_it():
+    font = ImageFont.load_default(size=15)
+    metrics = H.font_metrics(font)
+    assert H.font_metrics(font) is metrics
+    assert H.font_metrics(ImageFont.load_default(size=15)) is not metrics
+
+    count = len(H._font_metrics)
+    del font
+    gc.collect()
+    assert len(H._font_metrics) == count - 1
+
+
+@pytest.mark.parmoji
+def test_repeated_label_skips_the_font(monkeypatch):
+    font = ImageFont.load_default(size=15)
+    text = "user 😀 online\nlevel 3 👍"
+    image = Image.new("RGBA", (200, 60))
+    with Parmoji(image, source=_Src(disk_cache=False)) as p:
+        p.text((0, 0), text, fill="white", font=font)
+        first = image.tobytes()
+        calls = []
+        getlength = ImageFont.FreeTypeFont.getlength
+        monkeypatch.setattr(
+            ImageFont.FreeTypeFont, "getlength", lambda *a, **kw: calls.append(a) or getlength(*a, **kw)
+        )
+        image.paste((0, 0, 0, 0), (0, 0, *image.size))
+        p.text((0, 0), text, fill="white", font=font)
+    assert calls == []
+    assert image.tobytes() == first
+
+
+@pytest.mark.parmoji
+def test_getsize_reuses_renderer_measurements():
+    font = ImageFont.load_default(size=15)
+    with Parmoji(Image.new("RGBA", (200, 40)), source=_Src(disk_cache=False)) as p:
+        p.text((0, 0), "hello 😀 there", fill="white", font=font)
+    metrics = H.font_metrics(font)
+    misses = metrics.misses
+    assert H.getsize("hello 😀 there", font) == p.getsize("hello 😀 there", font)
+    assert metrics.misses == misses
+
+
+@pytest.mark.parmoji
+def test_metrics_match_pillow_and_stay_bounded():
+    font = ImageFont.load_default(size=15)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    metrics = H.FontMetrics(font, maxsize=2)
+    for text in ("a", "bb", "ccc", "a"):
+        assert metrics.run_length(text) == font.getlength(text)
+        assert metrics.text_length(draw, text) == draw.textlength(text, font)
+    assert len(metrics._lengths) == 2
+    assert metrics.line_height(draw, 2) == draw.textbbox((0, 0), "A", font, stroke_width=2)[3]
+
+    metrics.clear()
+    assert (metrics.hits, metrics.misses, len(metrics._lengths)) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        H.FontMetrics(font, maxsize=0)
+
+
+@pytest.mark.parmoji
+def test_default_font_is_loaded_once():
+    assert H.default_font() is H.default_font()
+
+
+@pytest.mark.parmoji
+def test_each_line_is_rasterized_once(monkeypatch):
+    font = ImageFont.load_default(size=15)
+    calls = []
+    getmask2 = ImageFont.FreeTypeFont.getmask2
+    monkeypatch.setattr(ImageFont.FreeTypeFont, "getmask2", lambda *a, **kw: calls.append(a) or getmask2(*a, **kw))
+    with Parmoji(Image.new("RGBA", (200, 60)), source=_Src(disk_cache=False)) as p:
+        p.text((3, 2), "user 😀 online\nlevel 3 👍", fill="white", font=font, anchor="ls")
+    # Only draw.text rasterizes; the emoji offset comes from cached metrics
+    assert len(calls) == 2
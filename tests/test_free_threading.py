@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from contextlib import suppress
+from io import BytesIO
+from typing import Callable
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import EmojiRenderer, Parmoji
+from parmoji.cache import LRUCacheDict
+from parmoji.source import HTTPBasedSource, _write_atomic
+
+EMOJI = ["😀", "👍", "🎉", "🔥", "✨", "❤️", "🚀", "✅"]
+
+
+@pytest.fixture(autouse=True)
+def _switch_often():
+    # Switch threads as often as possible to shake out races on GIL builds too
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run(threads: int, work: Callable[[int], None]) -> None:
+    errors: list[BaseException] = []
+
+    def guarded(n: int) -> None:
+        try:
+            work(n)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    workers = [threading.Thread(target=guarded, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert not errors, errors[0]
+
+
+class _Src(HTTPBasedSource):
+    def __init__(self, disk_cache: bool = False) -> None:
+        super().__init__(disk_cache=False)
+
+    def get_emoji(self, emoji, /, *, tight=False, margin=1):  # noqa: ANN001
+        buf = BytesIO()
+        shade = EMOJI.index(emoji) * 30 if emoji in EMOJI else 0
+        Image.new("RGBA", (24, 24), (shade, 0, 255 - shade, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, emoji_id, /):  # noqa: ANN001
+        return None
+
+
+@pytest.mark.parmoji
+def test_lru_cache_dict_reads_and_writes_under_threads():
+    cache = LRUCacheDict(maxsize=50)
+
+    def work(n: int) -> None:
+        for i in range(2000):
+            key = (n * 31 + i) % 120
+            cache[key] = key
+            assert cache.get(key) in (None, key)
+            if key in cache and i % 7 == 0:
+                with suppress(KeyError):
+                    del cache[key]
+            assert all(isinstance(k, int) for k in cache)
+
+    _run(8, work)
+    assert len(cache) <= 50
+
+
+@pytest.mark.parmoji
+def test_failed_requests_stay_consistent_with_their_file(tmp_path):
+    source = _Src()
+    source._failed_cache_file = tmp_path / "failed_requests.json"
+
+    def work(n: int) -> None:
+        for i in range(200):
+            key = f"{n}-{i % 20}"
+            source._mark_request_failed(key)
+            assert source._is_request_failed(key)
+            if i % 3 == 0:
+                source._clear_failed_request(key)
+
+    _run(8, work)
+    saved = json.loads(source._failed_cache_file.read_text())["failed"]
+    assert saved == sorted(source._failed_requests)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+@pytest.mark.parmoji
+def test_atomic_writes_are_never_seen_half_done(tmp_path):
+    path = tmp_path / "emoji.png"
+    payloads = [b"a" * 200_000, b"b" * 300_000]
+    _write_atomic(path, payloads[0])
+
+    def work(n: int) -> None:
+        for i in range(50):
+            if n % 2:
+                _write_atomic(path, payloads[i % 2])
+            else:
+                assert path.read_bytes() in payloads
+
+    _run(6, work)
+
+
+@pytest.mark.parmoji
+@pytest.mark.timeout(120)
+@pytest.mark.parametrize("options", [{}, {"cache_shards": 4, "cache_policy": "tinylfu"}])
+def test_renders_from_many_threads_match_a_single_thread(options):
+    fonts = [ImageFont.load_default(size=size) for size in (12, 16, 20)]
+    texts = [f"t{i} {EMOJI[i]} x {EMOJI[-1 - i]}" for i in range(len(EMOJI))]
+
+    def render(parmoji_for: Callable[[Image.Image], Parmoji], i: int) -> bytes:
+        image = Image.new("RGBA", (140, 30), "white")
+        with parmoji_for(image) as p:
+            p.text((2, 2), texts[i % len(texts)], fill="black", font=fonts[i % len(fonts)])
+        return image.tobytes()
+
+    expected = [render(lambda image: Parmoji(image, source=_Src()), i) for i in range(24)]
+
+    # Small budgets keep every cache evicting while threads read it
+    with EmojiRenderer(source=_Src, cache_size=4, image_cache_bytes=8_000, decoded_cache_bytes=8_000, **options) as r:
+
+        def work(n: int) -> None:
+            for i in range(24):
+                j = (i + n) % 24
+                assert render(r.on, j) == expected[j]
+
+        _run(6, work)
@@ -10,14 +10,16 @@ def test_helpers_textlength_fallback_via_reload(monkeypatch):
     import PIL
     import parmoji.helpers as H
 
+    original = dict(vars(H))
     # Force HAS_GETLENGTH False by simulating older Pillow
     monkeypatch.setattr(PIL, "__version__", "8.0.0", raising=False)
     H2 = importlib.reload(H)
     w, h = H2.getsize("abc")
     assert w > 0 and h > 0
 
-    # Restore to current environment
-    importlib.reload(H)
+    # Restore the original objects so NodeType etc. keep their identity in core
+    vars(H).clear()
+    vars(H).update(original)
 
 
 @pytest.mark.parmoji
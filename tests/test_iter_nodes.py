@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import tracemalloc
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import helpers as H
+from parmoji.core import Parmoji
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def get_emoji(self, emoji: str):
+        im = Image.new("RGBA", (8, 8), (255, 255, 255, 255))
+        b = BytesIO()
+        im.save(b, format="PNG")
+        b.seek(0)
+        return b
+
+    def get_discord_emoji(self, emoji_id: int):  # pragma: no cover - unused
+        return None
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(
+    "text",
+    ["", "\n", "a", "a\n", "a\r\nb\rc\x0bd e", "x 😀\n\n<:y:123456789012345678>\n", "tail"],
+)
+def test_iter_nodes_matches_to_nodes(text):
+    assert [list(line) for line in H.iter_nodes(text)] == H.to_nodes(text)
+
+
+@pytest.mark.parmoji
+def test_iter_nodes_reads_file_objects_lazily():
+    stream = io.StringIO("one 😀\ntwo\r\nthree")
+    it = H.iter_nodes(stream)
+    first = next(it)
+    assert [n.content for n in first] == ["one ", "😀"]
+    # The rest of the file has not been consumed beyond the first line
+    assert stream.tell() == len("one 😀\n")
+    assert [[n.content for n in line] for line in it] == [["two"], ["three"]]
+
+
+@pytest.mark.parmoji
+def test_getsize_accepts_file_objects():
+    font = ImageFont.load_default()
+    text = "hello 😀\nsecond line"
+    assert H.getsize(io.StringIO(text), font) == H.getsize(text, font)
+
+
+def _render_peak(lines: int) -> int:
+    img = Image.new("RGBA", (200, 40), (0, 0, 0, 0))
+    font = ImageFont.load_default()
+    transcript = io.StringIO("".join(f"message {i} from user 😀\n" for i in range(lines)))
+    with Parmoji(img, source=_Src(disk_cache=False)) as p:
+        tracemalloc.start()
+        try:
+            p.text((0, 0), transcript, font=font, spacing=-20)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+@pytest.mark.parmoji
+@pytest.mark.timeout(60)
+def test_streamed_render_memory_stays_flat():
+    small = _render_peak(200)
+    large = _render_peak(2000)
+    # Ten times the lines must not need anywhere near ten times the memory
+    assert large < small * 2 + 64 * 1024
+
+
+@pytest.mark.parmoji
+def test_centered_file_input_matches_string_input():
+    font = ImageFont.load_default()
+    text = "wide line with 😀\nshort"
+    images = []
+    for source in (text, io.StringIO(text)):
+        img = Image.new("RGBA", (200, 60), (0, 0, 0, 0))
+        with Parmoji(img, source=_Src(disk_cache=False)) as p:
+            p.text((100, 30), source, font=font, anchor="mm", align="center")
+        images.append(img)
+    assert images[0].tobytes() == images[1].tobytes()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import dataclasses
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import Parmoji
+from parmoji.source import BaseSource
+
+TEXT = "Hi 😀 there\nsecond 👍 line"
+
+
+class _Src(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.calls = 0
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        self.calls += 1
+        buf = BytesIO()
+        Image.new("RGBA", (20, 14), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+def _render_text(anchor: str, align: str) -> Image.Image:
+    image = Image.new("RGBA", (240, 120), "white")
+    with Parmoji(image, source=_Src()) as p:
+        p.text((120, 60), TEXT, fill="black", font=ImageFont.load_default(size=16), anchor=anchor, align=align)
+    return image
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(("anchor", "align"), [("la", "left"), ("mm", "center"), ("rd", "right")])
+def test_draw_layout_matches_text(anchor, align):
+    image = Image.new("RGBA", (240, 120), "white")
+    with Parmoji(image, source=_Src()) as p:
+        layout = p.layout(TEXT, ImageFont.load_default(size=16), anchor=anchor, align=align)
+        p.draw_layout((120, 60), layout, fill="black")
+    assert image.tobytes() == _render_text(anchor, align).tobytes()
+
+
+@pytest.mark.parmoji
+def test_layout_is_reusable_without_refetching():
+    source = _Src()
+    first = Image.new("RGBA", (240, 120), "white")
+    second = Image.new("RGBA", (300, 200), "white")
+    with Parmoji(first, source=source, cache=False) as p:
+        layout = p.layout(TEXT, ImageFont.load_default(size=16))
+        calls = source.calls
+        p.draw_layout((10, 10), layout, fill="black")
+        p.draw_layout((10, 60), layout, fill="black")
+        p.draw_layout((30, 40), layout, fill="black", image=second)
+    assert calls == 2
+    assert source.calls == calls
+    assert second.getbbox() is not None
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        layout.bbox = (0, 0, 1, 1)  # type: ignore[misc]
+
+
+@pytest.mark.parmoji
+def test_layout_geometry_covers_drawn_pixels():
+    font = ImageFont.load_default(size=16)
+    image = Image.new("RGBA", (240, 120), (0, 0, 0, 0))
+    with Parmoji(image, source=_Src()) as p:
+        layout = p.layout(TEXT, font)
+        p.draw_layout((10, 10), layout, fill="black")
+
+    assert [line.text.split(" ")[0] for line in layout.lines] == ["Hi", "second"]
+    assert layout.size == (layout.bbox[2] - layout.bbox[0], layout.bbox[3] - layout.bbox[1])
+
+    left, top, right, bottom = image.getbbox()
+    assert layout.bbox[0] + 10 <= left and layout.bbox[1] + 10 <= top
+    assert layout.bbox[2] + 10 >= right and layout.bbox[3] + 10 >= bottom
+
+    boxes = layout.emoji_boxes()
+    assert len(boxes) == 2
+    for box in boxes:
+        assert image.getpixel((box[0] + 10 + 1, box[1] + 10 + 1)) == (255, 0, 0, 255)
+
+
+@pytest.mark.parmoji
+def test_empty_layout():
+    with Parmoji(Image.new("RGBA", (10, 10)), source=_Src()) as p:
+        layout = p.layout("")
+    assert layout.lines == ()
+    assert layout.bbox == (0, 0, 0, 0)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from parmoji import helpers as H
+from parmoji.core import Parmoji
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def get_emoji(self, emoji: str):
+        im = Image.new("RGBA", (8, 8), (255, 255, 255, 255))
+        b = BytesIO()
+        im.save(b, format="PNG")
+        b.seek(0)
+        return b
+
+    def get_discord_emoji(self, emoji_id: int):  # pragma: no cover - unused
+        return None
+
+
+@pytest.mark.parmoji
+def test_parse_cache_hits_return_same_immutable_tuple():
+    cache = H.ParseCache(maxsize=8)
+    first = H.to_nodes("hi 😀\nbye", cache=cache)
+    second = H.to_nodes("hi 😀\nbye", cache=cache)
+    assert cache.misses == 2 and cache.hits == 2
+    assert isinstance(first[0], tuple)
+    assert first[0] is second[0]
+    # Cached results match an uncached parse
+    assert [list(line) for line in first] == H.to_nodes("hi 😀\nbye")
+
+
+@pytest.mark.parmoji
+def test_parse_cache_is_bounded_lru():
+    cache = H.ParseCache(maxsize=2)
+    cache.parse_line("a")
+    cache.parse_line("b")
+    cache.parse_line("a")  # refresh "a"
+    cache.parse_line("c")  # evicts "b"
+    assert len(cache) == 2
+    cache.parse_line("a")
+    assert cache.hits == 2
+    cache.parse_line("b")
+    assert cache.misses == 4
+    assert "size=2/2" in repr(cache)
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0 and cache.misses == 0
+
+
+@pytest.mark.parmoji
+def test_parse_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        H.ParseCache(maxsize=0)
+
+
+@pytest.mark.parmoji
+def test_parmoji_text_and_getsize_skip_tokenizer_on_repeat(monkeypatch):
+    cache = H.ParseCache()
+    font = ImageFont.load_default()
+    img = Image.new("RGBA", (120, 40), (0, 0, 0, 0))
+    with Parmoji(img, source=_Src(disk_cache=False), parse_cache=cache) as p:
+        p.text((2, 2), "caption 😀", font=font)
+        p.getsize("caption 😀", font=font)
+
+        calls = {"n": 0}
+        orig = H.find_emojis_in_text
+
+        def _counting(text):  # noqa: ANN001
+            calls["n"] += 1
+            return orig(text)
+
+        monkeypatch.setattr(H, "find_emojis_in_text", _counting)
+        for _ in range(3):
+            p.text((2, 2), "caption 😀", font=font)
+            p.getsize("caption 😀", font=font)
+
+    assert calls["n"] == 0
+    assert cache.misses == 1 and cache.hits == 7
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from parmoji import helpers as H
+
+TEXTS = [f"msg {i} 😀 <:blob:123456789012345678> {'👍🏽' * (i % 3)}\nline two" for i in range(50)] + ["", "plain"]
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_matches_to_nodes_in_order(workers):
+    result = H.parse_many(TEXTS, workers=workers, chunksize=7)
+    assert result == [H.to_nodes(text) for text in TEXTS]
+
+
+@pytest.mark.parmoji
+def test_parse_many_accepts_iterators_and_small_inputs():
+    assert H.parse_many(iter(TEXTS[:3]), workers=4) == [H.to_nodes(text) for text in TEXTS[:3]]
+    assert H.parse_many([], workers=2) == []
+    assert H.parse_many([], histogram=True) == Counter()
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_histogram(workers):
+    counts = H.parse_many(TEXTS, workers=workers, chunksize=7, histogram=True)
+    expected: Counter[str] = Counter(
+        node.content for text in TEXTS for line in H.to_nodes(text) for node in line if node.type is not H.NodeType.text
+    )
+    assert counts == expected
+    assert counts["😀"] == 50
+    assert counts["123456789012345678"] == 50
+
+
+@pytest.mark.parmoji
+def test_parse_many_validates_arguments():
+    with pytest.raises(ValueError):
+        H.parse_many(TEXTS, workers=0)
+    with pytest.raises(ValueError):
+        H.parse_many(TEXTS, chunksize=0)
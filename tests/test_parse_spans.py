@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji import helpers as H
+from parmoji.source import BaseSource
+
+SAMPLES = [
+    "",
+    "plain text",
+    "Hi 😀 there",
+    "a\r\nb 👍🏽\n\n<:blob:123456789012345678> c 🇺🇸🇬🇧\n",
+    "<a:wave:987654321098765432><:x:123456789012345678>",
+    "👨‍👩‍👧‍👦\n#️⃣ café ✓",
+]
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("text", SAMPLES)
+def test_spans_match_to_nodes(text):
+    parsed = H.parse_spans(text)
+    assert [list(line) for line in parsed] == H.to_nodes(text)
+    assert len(parsed) == len(H.to_nodes(text))
+
+
+@pytest.mark.parmoji
+def test_spans_are_offsets_into_source():
+    text = "x 😀 <:blob:123456789012345678>"
+    line = H.parse_spans(text)[0]
+    spans = list(line.spans())
+    assert [kind for kind, _, _ in spans] == [
+        H.NodeType.text,
+        H.NodeType.emoji,
+        H.NodeType.text,
+        H.NodeType.discord_emoji,
+    ]
+    for (kind, start, end), node in zip(spans, line, strict=True):
+        assert text[start:end] == node.content
+        assert kind is node.type
+
+
+@pytest.mark.parmoji
+def test_line_view_indexing():
+    parsed = H.parse_spans("a😀b\nc")
+    line = parsed[0]
+    assert len(line) == 3
+    assert line[1] == H.Node(H.NodeType.emoji, "😀")
+    assert line[-1] == H.Node(H.NodeType.text, "b")
+    assert line[1:] == [H.Node(H.NodeType.emoji, "😀"), H.Node(H.NodeType.text, "b")]
+    assert list(parsed[-1]) == [H.Node(H.NodeType.text, "c")]
+    with pytest.raises(IndexError):
+        line[3]
+    with pytest.raises(IndexError):
+        parsed[2]
+
+
+@pytest.mark.parmoji
+def test_getsize_and_iter_nodes_accept_parsed_text():
+    text = "Hello 😀\nworld 👍"
+    parsed = H.parse_spans(text)
+    assert H.getsize(parsed) == H.getsize(text)
+    assert [list(line) for line in H.iter_nodes(parsed)] == H.to_nodes(text)
+
+
+@pytest.mark.parmoji
+def test_parmoji_renders_parsed_text_like_str():
+    text = "Hi 😀\nplain"
+    first = Image.new("RGBA", (120, 60), "white")
+    second = first.copy()
+    with Parmoji(first, cache=False) as p:
+        p.text((5, 5), text, fill="black")
+    with Parmoji(second, cache=False) as p:
+        assert p.getsize(H.parse_spans(text)) == p.getsize(text)
+        p.text((5, 5), H.parse_spans(text), fill="black")
+    assert first.tobytes() == second.tobytes()
+
+
+class _CountingSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.fetched: list[str] = []
+
+    def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO:
+        self.fetched.append(emoji)
+        buf = BytesIO()
+        Image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(buf, "PNG")
+        return BytesIO(buf.getvalue())
+
+    def get_discord_emoji(self, emoji_id: int, /) -> None:
+        return None
+
+
+@pytest.mark.parmoji
+def test_default_renderer_draws_emoji_of_shortcode_parsed_text():
+    parsed = H.parse_spans(":thumbsup: hi", shortcodes=True)
+    image = Image.new("RGBA", (120, 40), "white")
+    source = _CountingSource()
+    with Parmoji(image, source=source) as p:
+        assert p.textbbox((5, 5), parsed) != p.textbbox((5, 5), ":thumbsup: hi")
+        p.text((5, 5), parsed, fill="black")
+    assert source.fetched == ["👍"]
+    assert (255, 0, 0) in {color for _, color in image.convert("RGB").getcolors(120 * 40)}
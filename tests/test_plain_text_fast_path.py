@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image, ImageChops, ImageFont
+
+from parmoji import helpers as H
+from parmoji.core import Parmoji
+from parmoji.source import BaseSource
+
+
+class _NoSrc(BaseSource):
+    def get_emoji(self, emoji: str):  # pragma: no cover - never reached for plain text
+        raise AssertionError("plain text must not fetch emoji")
+
+    def get_discord_emoji(self, emoji_id: int):  # pragma: no cover - never reached
+        raise AssertionError("plain text must not fetch emoji")
+
+
+def _render(text: str, *, force_slow: bool, monkeypatch, **kwargs) -> Image.Image:
+    img = Image.new("RGBA", (220, 90), (0, 0, 0, 0))
+    font = ImageFont.load_default(size=14)
+    with monkeypatch.context() as m:
+        if force_slow:
+            m.setattr(Parmoji, "_is_plain_text", staticmethod(lambda *a: False))
+        with Parmoji(img, source=_NoSrc(disk_cache=False), cache=False) as p:
+            p.text((110, 40), text, fill=(255, 255, 255, 255), font=font, **kwargs)
+    return img
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(
+    ("text", "kwargs"),
+    [
+        ("Hello, world!", {}),
+        ("Hello, world!", {"anchor": "mm", "align": "right"}),
+        ("Hello, world!", {"anchor": "rs", "stroke_width": 1, "stroke_fill": (255, 0, 0, 255)}),
+        ("first line\nsecond\nthird one", {}),
+        ("first line\nsecond", {"anchor": "lm", "spacing": 7}),
+        ("first line\nsecond", {"anchor": "ld", "stroke_width": 2}),
+    ],
+)
+def test_fast_path_is_pixel_identical(monkeypatch, text, kwargs):
+    fast = _render(text, force_slow=False, monkeypatch=monkeypatch, **kwargs)
+    slow = _render(text, force_slow=True, monkeypatch=monkeypatch, **kwargs)
+    assert fast.getbbox() is not None
+    assert ImageChops.difference(fast, slow).getbbox() is None
+
+
+@pytest.mark.parmoji
+def test_fast_path_skips_parsing(monkeypatch):
+    def _boom(*_a, **_k):  # noqa: ANN002, ANN003
+        raise AssertionError("plain text must not be tokenized")
+
+    from parmoji import core
+
+    monkeypatch.setattr(core, "iter_nodes", _boom)
+    img = Image.new("RGBA", (120, 40), (0, 0, 0, 0))
+    with Parmoji(img, source=_NoSrc(disk_cache=False), cache=False) as p:
+        p.text((2, 2), "no emoji here\nnor here", font=ImageFont.load_default())
+    assert img.getbbox() is not None
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(
+    ("text", "anchor", "align", "expected"),
+    [
+        ("plain", "la", "left", True),
+        ("plain", "mm", "center", True),
+        ("a\nb", "la", "left", True),
+        ("a\nb", "la", "center", False),
+        ("a\nb", "ma", "left", False),
+        ("a\nb\n", "la", "left", False),
+        ("a\r\nb", "la", "left", False),
+        ("<:x:123456789012345678>", "la", "left", False),
+        ("café", "la", "left", False),
+        ("😀", "la", "left", False),
+    ],
+)
+def test_is_plain_text_classification(text, anchor, align, expected):
+    assert Parmoji._is_plain_text(text, anchor, align) is expected
+
+
+@pytest.mark.parmoji
+def test_fast_path_still_rejects_invalid_align():
+    img = Image.new("RGBA", (40, 20), (0, 0, 0, 0))
+    with Parmoji(img, source=_NoSrc(disk_cache=False), cache=False) as p, pytest.raises(ValueError):
+        p.text((2, 2), "abc", align="bogus")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji import helpers as H
+from parmoji.cache import EmojiCache
+from parmoji.registry import CustomEmojiRegistry
+from parmoji.source import BaseSource
+
+
+def _png(color: tuple[int, int, int, int]) -> bytes:
+    buf = BytesIO()
+    Image.new("RGBA", (8, 8), color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+class _NoNetworkSource(BaseSource):
+    def get_emoji(self, emoji):  # noqa: ANN001
+        return BytesIO(_png((0, 0, 255, 255)))
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        raise AssertionError("custom emoji must not be fetched as Discord emoji")
+
+
+@pytest.mark.parmoji
+def test_registry_from_directory_and_bytes(tmp_path):
+    (tmp_path / "party_blob.png").write_bytes(_png((255, 0, 0, 255)))
+    (tmp_path / "notes.txt").write_text("ignored")
+    registry = CustomEmojiRegistry.from_directory(tmp_path)
+    registry.register("inline", _png((0, 255, 0, 255)))
+
+    assert sorted(registry) == ["inline", "party_blob"]
+    assert "notes" not in registry
+    assert registry.get("party_blob").getvalue() == _png((255, 0, 0, 255))
+    assert registry.get("inline").getvalue() == _png((0, 255, 0, 255))
+    assert registry.get("missing") is None
+
+    with pytest.raises(ValueError):
+        registry.register("bad:name", b"")
+    with pytest.raises(TypeError):
+        registry.register("bad", 42)  # type: ignore[arg-type]
+
+
+@pytest.mark.parmoji
+def test_tokenizer_recognizes_registered_names():
+    registry = CustomEmojiRegistry({"blob": b"x", "fire": b"y"})
+    text = "hi :blob: :unknown: :fire: 😀 <:d:123456789012345678>"
+    assert H.to_nodes(text, registry=registry) == [
+        [
+            H.Node(H.NodeType.text, "hi "),
+            H.Node(H.NodeType.custom_emoji, "blob"),
+            H.Node(H.NodeType.text, " :unknown: "),
+            H.Node(H.NodeType.custom_emoji, "fire"),
+            H.Node(H.NodeType.text, " "),
+            H.Node(H.NodeType.emoji, "😀"),
+            H.Node(H.NodeType.text, " "),
+            H.Node(H.NodeType.discord_emoji, "123456789012345678"),
+        ]
+    ]
+    # Registered names win over shortcodes with the same spelling
+    nodes = H.to_nodes(":fire: :smile:", shortcodes=True, registry=registry)[0]
+    assert nodes[0] == H.Node(H.NodeType.custom_emoji, "fire")
+    assert nodes[2] == H.Node(H.NodeType.emoji, "😄")
+    assert [list(line) for line in H.parse_spans(text, registry=registry)] == H.to_nodes(text, registry=registry)
+
+
+@pytest.mark.parmoji
+def test_parse_cache_sees_registry_changes():
+    registry = CustomEmojiRegistry()
+    cache = H.ParseCache()
+    assert H.to_nodes(":blob:", cache=cache, registry=registry) == [(H.Node(H.NodeType.text, ":blob:"),)]
+    registry.register("blob", b"x")
+    assert H.to_nodes(":blob:", cache=cache, registry=registry) == [(H.Node(H.NodeType.custom_emoji, "blob"),)]
+
+
+@pytest.mark.parmoji
+def test_parmoji_renders_custom_emoji_without_network(tmp_path, monkeypatch):
+    (tmp_path / "red.png").write_bytes(_png((255, 0, 0, 255)))
+    registry = CustomEmojiRegistry.from_directory(tmp_path)
+    reads = []
+    original_get = registry.get
+    monkeypatch.setattr(registry, "get", lambda name: reads.append(name) or original_get(name))
+
+    image = Image.new("RGBA", (80, 40), (255, 255, 255, 255))
+    with Parmoji(image, source=_NoNetworkSource(), custom_emoji=registry) as p:
+        p.text((0, 0), ":red:", fill="black")
+        p.text((0, 20), ":red:", fill="black")
+
+    assert reads == ["red"]
+    red = image.convert("RGB").getcolors(80 * 40)
+    assert any(color == (255, 0, 0) for _, color in red)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+@pytest.mark.parmoji
+def test_replaced_custom_emoji_redraws_with_the_same_renderer(shared):
+    registry = CustomEmojiRegistry()
+    registry.register("x", _png((255, 0, 0, 255)))
+    emoji_cache = EmojiCache() if shared else None
+
+    def colors(renderer: Parmoji, image: Image.Image) -> set[tuple[int, int, int]]:
+        renderer.text((0, 0), "a :x:", fill="black")
+        return {color for _, color in image.convert("RGB").getcolors(80 * 40)}
+
+    image = Image.new("RGBA", (80, 40), (255, 255, 255, 255))
+    with Parmoji(image, source=_NoNetworkSource(), custom_emoji=registry, emoji_cache=emoji_cache) as p:
+        assert (255, 0, 0) in colors(p, image)
+
+        registry.register("x", _png((0, 0, 255, 255)))
+        image.paste((255, 255, 255, 255), (0, 0, *image.size))
+        drawn = colors(p, image)
+
+    assert (0, 0, 255) in drawn
+    assert (255, 0, 0) not in drawn
@@ -46,12 +46,13 @@ def test_scaling_factor_changes_emoji_size(tmp_path: Path):
         # Then at scale 2.0, offset on x so we don't overlap
         p.text((120, 10), "😀", font=font, emoji_scale_factor=2.0)
 
-        # Access processed cache (keyed by content and scale)
-        im1 = p._processed_image_cache.get("😀_1.0")
-        im2 = p._processed_image_cache.get("😀_2.0")
+        # Processed assets are keyed by (emoji, width, height, resample filter)
+        im1, im2 = sorted(
+            (p._processed_image_cache[key] for key in p._processed_image_cache if key[0] == "😀"),
+            key=lambda im: im.width,
+        )
 
     # Both sizes should exist and the latter should be about double width
-    assert im1 is not None and im2 is not None
     assert im1.width > 0 and im2.width > 0
     ratio = im2.width / im1.width
     assert 1.7 <= ratio <= 2.3, f"expected ~2x width, got ratio={ratio:.2f} (w1={im1.width}, w2={im2.width})"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import emoji
+import pytest
+from PIL import Image
+
+from parmoji import Parmoji
+from parmoji import helpers as H
+from parmoji.source import BaseSource
+
+
+class _Src(BaseSource):
+    def __init__(self) -> None:
+        super().__init__(disk_cache=False)
+        self.requested: list[str] = []
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        self.requested.append(emoji)
+        buf = BytesIO()
+        Image.new("RGBA", (8, 8), (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+@pytest.mark.parmoji
+def test_shortcodes_off_by_default():
+    assert H.find_emojis_in_text("nice :thumbsup:") == []
+    assert H.to_nodes(":smile:") == [[H.Node(H.NodeType.text, ":smile:")]]
+
+
+@pytest.mark.parmoji
+def test_all_three_syntaxes_in_one_scan():
+    text = "ok :thumbsup: 😀 <:blob:123456789012345678> :+1:"
+    assert H.to_nodes(text, shortcodes=True) == [
+        [
+            H.Node(H.NodeType.text, "ok "),
+            H.Node(H.NodeType.emoji, "👍"),
+            H.Node(H.NodeType.text, " "),
+            H.Node(H.NodeType.emoji, "😀"),
+            H.Node(H.NodeType.text, " "),
+            H.Node(H.NodeType.discord_emoji, "123456789012345678"),
+            H.Node(H.NodeType.text, " "),
+            H.Node(H.NodeType.emoji, "👍"),
+        ]
+    ]
+    spans = H.find_emojis_in_text(text, shortcodes=True)
+    assert spans[0] == (3, 13, "👍")
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(
+    "name", [":thumbs_up:", ":red_heart:", ":flag_for_United_States:", ":a:", ":keycap_#:", ":piñata:"]
+)
+def test_shortcodes_match_emojize(name):
+    assert H.find_emojis_in_text(name, shortcodes=True)[0][2] == emoji.emojize(name, language="alias")
+
+
+@pytest.mark.parmoji
+def test_unknown_and_adjacent_colons():
+    assert H.find_emojis_in_text("time 12:30:45 :not_a_real_code:", shortcodes=True) == []
+    # A failed candidate does not swallow the colon that starts a real one
+    assert [s[2] for s in H.find_emojis_in_text("a:zz:smile:", shortcodes=True)] == ["😄"]
+    assert [s[2] for s in H.find_emojis_in_text(":fire::fire:", shortcodes=True)] == ["🔥", "🔥"]
+
+
+@pytest.mark.parmoji
+def test_shortcodes_through_spans_cache_and_batch():
+    text = "hi :wave:\n:fire: done"
+    expected = H.to_nodes(text, shortcodes=True)
+    assert [list(line) for line in H.parse_spans(text, shortcodes=True)] == expected
+    cache = H.ParseCache()
+    assert [list(line) for line in H.to_nodes(text, cache=cache, shortcodes=True)] == expected
+    # The same line parsed without shortcodes is a separate cache entry
+    assert H.to_nodes(text, cache=cache)[1] == (H.Node(H.NodeType.text, ":fire: done"),)
+    assert H.parse_many([text] * 3, workers=1, shortcodes=True) == [expected] * 3
+    assert H.parse_many([text], histogram=True, shortcodes=True) == {"👋": 1, "🔥": 1}
+
+
+@pytest.mark.parmoji
+def test_parmoji_renders_shortcodes():
+    source = _Src()
+    image = Image.new("RGBA", (120, 40), "white")
+    with Parmoji(image, source=source, cache=False, shortcodes=True) as p:
+        assert p.getsize("a :fire:") == H.getsize("a 🔥")
+        p.text((2, 2), "a :fire:", fill="black")
+    assert source.requested == ["🔥"]
+
+    source = _Src()
+    with Parmoji(image, source=source, cache=False) as p:
+        p.text((2, 2), "a :fire:", fill="black")
+    assert source.requested == []
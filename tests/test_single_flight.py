@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Callable, Iterator
+
+import pytest
+from PIL import Image
+
+from parmoji import EmojiRenderer, Parmoji
+from parmoji.cache import EmojiCache, SingleFlight
+from parmoji.local_source import LocalFontSource
+from parmoji.source import BaseSource, EmojiCDNSource
+
+BURST = 16
+
+_PNG = BytesIO()
+Image.new("RGBA", (24, 24), (255, 200, 0, 255)).save(_PNG, format="PNG")
+
+
+class _SlowCDN(BaseHTTPRequestHandler):
+    """Serves one PNG for every path, slowly enough for a burst to pile up."""
+
+    hits: Counter[str]
+    lock: threading.Lock
+
+    def do_GET(self) -> None:  # noqa: N802
+        with self.lock:
+            self.hits[self.path.split("?")[0]] += 1
+        time.sleep(0.2)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(_PNG.getvalue())))
+        self.end_headers()
+        self.wfile.write(_PNG.getvalue())
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def cdn() -> Iterator[tuple[type[EmojiCDNSource], Counter[str]]]:
+    hits: Counter[str] = Counter()
+    handler = type("Handler", (_SlowCDN,), {"hits": hits, "lock": threading.Lock()})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    class LocalCDNSource(EmojiCDNSource):
+        BASE_EMOJI_CDN_URL = base
+        BASE_DISCORD_EMOJI_URL = base + "discord/"
+        STYLE = "twitter"
+
+    yield LocalCDNSource, hits
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _burst(work: Callable[[int], object]) -> list[object]:
+    start = threading.Barrier(BURST)
+    results: list[object] = [None] * BURST
+    errors: list[BaseException] = []
+
+    def run(n: int) -> None:
+        try:
+            start.wait()
+            results[n] = work(n)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    workers = [threading.Thread(target=run, args=(n,)) for n in range(BURST)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert not errors, errors[0]
+    return results
+
+
+@pytest.mark.parmoji
+def test_renderer_burst_makes_one_request_per_key(cdn):
+    source_cls, hits = cdn
+    with Parmoji(Image.new("RGBA", (8, 8)), source=source_cls()) as renderer:
+        results = _burst(lambda n: renderer._get_emoji("🔥") if n % 2 else renderer._get_discord_emoji(42))
+
+    assert all(isinstance(stream, BytesIO) and stream.read() == _PNG.getvalue() for stream in results)
+    assert hits == {"/%F0%9F%94%A5": 1, "/discord/42.png": 1}
+
+
+@pytest.mark.parmoji
+def test_shared_cache_burst_makes_one_request_per_key(cdn):
+    source_cls, hits = cdn
+    source = source_cls()
+    with EmojiRenderer(source=source, emoji_cache=EmojiCache()) as renderer:
+        # Each thread binds its own renderer, as a thread pool rendering images does
+        _burst(lambda n: renderer.on(Image.new("RGBA", (8, 8)))._get_emoji("🚀" if n % 2 else "👍"))
+
+    assert hits == {"/%F0%9F%9A%80": 1, "/%F0%9F%91%8D": 1}
+
+
+@pytest.mark.parmoji
+def test_source_burst_makes_one_request_and_one_file(cdn):
+    source_cls, hits = cdn
+    source = source_cls(disk_cache=True)
+    # Qualification variants and tight crops of one emoji still share a request
+    variants = ["☺", "☺️"]
+    results = _burst(lambda n: source.get_emoji(variants[n % 2], tight=n % 4 < 2))
+
+    assert all(isinstance(stream, BytesIO) for stream in results)
+    assert sum(hits.values()) <= 2
+    assert source._cache_dir is not None
+    assert len(list(source._cache_dir.glob("*.png"))) == 2
+    assert not list(source._cache_dir.glob(".*.tmp"))
+
+    hits.clear()
+    _burst(lambda n: source.get_emoji("☺️"))
+    assert not hits
+
+
+@pytest.mark.parmoji
+def test_local_font_source_burst_renders_once(monkeypatch):
+    source = LocalFontSource(disk_cache=True, prime_on_init=False)
+    renders = Counter()
+    render = source._load_emoji
+
+    def counted(emoji: str) -> bytes | None:
+        renders[emoji] += 1
+        time.sleep(0.05)
+        return render(emoji)
+
+    monkeypatch.setattr(source, "_load_emoji", counted)
+    results = _burst(lambda n: source.get_emoji("😀"))
+
+    assert renders == {"😀": 1}
+    assert len({stream.getvalue() for stream in results}) == 1
+
+
+@pytest.mark.parmoji
+def test_single_flight_shares_errors_and_forgets_keys():
+    flights = SingleFlight()
+    calls = Counter()
+    release = threading.Event()
+
+    def fail() -> bytes:
+        calls["fail"] += 1
+        release.wait()
+        raise OSError("cdn down")
+
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            flights.do("😀", fail)
+        except OSError as exc:
+            errors.append(exc)
+
+    workers = [threading.Thread(target=call) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    while calls["fail"] == 0 or len(flights) != 1:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for worker in workers:
+        worker.join()
+
+    assert calls["fail"] == 1
+    assert len(errors) == 4
+    assert len(flights) == 0
+    # A later call runs again rather than replaying the failure
+    assert flights.do("😀", lambda: b"png") == b"png"
+
+
+@pytest.mark.parmoji
+def test_failed_fetch_is_not_cached():
+    class FlakySource(BaseSource):
+        def __init__(self) -> None:
+            super().__init__(disk_cache=False)
+            self.calls = 0
+
+        def get_emoji(self, emoji: str, /, *, tight: bool = False, margin: int = 1) -> BytesIO | None:
+            self.calls += 1
+            return None if self.calls == 1 else BytesIO(_PNG.getvalue())
+
+        def get_discord_emoji(self, emoji_id: int, /) -> None:
+            return None
+
+    source = FlakySource()
+    with Parmoji(Image.new("RGBA", (8, 8)), source=source) as renderer:
+        assert renderer._get_emoji("😀") is None
+        assert renderer._get_emoji("😀").getvalue() == _PNG.getvalue()
+    assert source.calls == 2
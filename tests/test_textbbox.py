@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageFile, ImageFont
+
+from parmoji import Parmoji
+from parmoji.source import BaseSource
+
+TEXT = "Hi 😀 there\nsecond 👍 line"
+
+
+class _Src(BaseSource):
+    def __init__(self, size: tuple[int, int] = (20, 14)) -> None:
+        super().__init__(disk_cache=False)
+        self.size = size
+
+    def get_emoji(self, emoji):  # noqa: ANN001
+        buf = BytesIO()
+        Image.new("RGBA", self.size, (255, 0, 0, 255)).save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+    def get_discord_emoji(self, id):  # noqa: A002, ANN001
+        return None
+
+
+def _forbid_rasterizing(monkeypatch) -> None:
+    def fail(*_args, **_kwargs):
+        raise AssertionError("textbbox must not rasterize text or decode emoji")
+
+    monkeypatch.setattr(ImageFont.FreeTypeFont, "getmask2", fail)
+    monkeypatch.setattr(ImageFile.ImageFile, "load", fail)
+
+
+def _ink_bbox(image: Image.Image) -> tuple[int, int, int, int]:
+    bbox = ImageChops.invert(image.convert("RGB")).getbbox()
+    assert bbox is not None
+    return bbox
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("align", ["left", "center", "right"])
+def test_textbbox_matches_layout_without_rasterizing(monkeypatch, align):
+    font = ImageFont.load_default(size=16)
+    with Parmoji(Image.new("RGBA", (240, 120)), source=_Src(), cache=False) as p:
+        expected = p.layout(TEXT, font, align=align).bbox
+    with Parmoji(Image.new("RGBA", (240, 120)), source=_Src(), cache=False) as p, monkeypatch.context() as m:
+        _forbid_rasterizing(m)
+        assert p.textbbox((0, 0), TEXT, font, align=align) == expected
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize("xy", [(120, 60), (121, 61)])
+@pytest.mark.parametrize("text", ["x 👍\nlonger 😀 line", "odd 😀", "a😀b\nc"])
+def test_textbbox_matches_layout_for_centered_anchor(xy, text):
+    # Centering odd widths and line counts puts lines on half pixels
+    font = ImageFont.load_default(size=13)
+    with Parmoji(Image.new("RGBA", (240, 120)), source=_Src((19, 13)), cache=False) as p:
+        for align in ("left", "center"):
+            layout = p.layout(text, font, anchor="mm", align=align, emoji_position_offset=(1, -1))
+            expected = tuple(edge + offset for edge, offset in zip(layout.bbox, xy * 2, strict=True))
+            assert p.textbbox(xy, text, font, anchor="mm", align=align, emoji_position_offset=(1, -1)) == expected
+
+
+@pytest.mark.parmoji
+@pytest.mark.parametrize(("anchor", "align"), [("la", "left"), ("mm", "center"), ("rd", "right"), ("ls", "left")])
+def test_textbbox_contains_drawn_pixels(anchor, align):
+    font = ImageFont.load_default(size=16)
+    image = Image.new("RGB", (240, 120), "white")
+    with Parmoji(image, source=_Src(), cache=False) as p:
+        bbox = p.textbbox((120, 60), TEXT, font, anchor=anchor, align=align)
+        p.text((120, 60), TEXT, fill="black", font=font, anchor=anchor, align=align)
+    left, top, right, bottom = _ink_bbox(image)
+    assert bbox[0] <= left
+    assert bbox[1] <= top
+    assert right <= bbox[2]
+    assert bottom <= bbox[3]
+
+
+@pytest.mark.parmoji
+def test_textbbox_accounts_for_emoji_aspect_ratio(monkeypatch):
+    _forbid_rasterizing(monkeypatch)
+    font = ImageFont.load_default(size=16)
+    with Parmoji(Image.new("RGB", (10, 10)), source=_Src((20, 14)), cache=False) as p:
+        wide = p.textbbox((0, 0), "a😀", font)
+    with Parmoji(Image.new("RGB", (10, 10)), source=_Src((20, 80)), cache=False) as p:
+        tall = p.textbbox((0, 0), "a😀", font)
+    # Emoji are scaled to the font size in width, keeping their aspect ratio
+    assert tall[3] - wide[3] == 16 * 4 - 12
+    assert tall[2] == wide[2]
+
+
+@pytest.mark.parmoji
+def test_textbbox_plain_text_matches_pillow():
+    font = ImageFont.load_default(size=16)
+    image = Image.new("RGB", (100, 40))
+    expected = ImageDraw.Draw(image).textbbox((5, 7), "plain\ntext", font)
+    with Parmoji(image, source=_Src()) as p:
+        assert p.textbbox((5, 7), "plain\ntext", font) == expected
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from parmoji import helpers as H
+
+
+@pytest.mark.parmoji
+def test_spans_do_not_swallow_surrounding_text():
+    text = "Hi 😀 there"
+    assert H.find_emojis_in_text(text) == [(3, 4, "😀")]
+
+
+@pytest.mark.parmoji
+def test_longest_match_wins_for_sequences():
+    family = "👨‍👩‍👧‍👦"
+    text = f"a{family}b👍🏽🇺🇸🇬🇧"
+    spans = H.find_emojis_in_text(text)
+    assert [s[2] for s in spans] == [family, "👍🏽", "🇺🇸", "🇬🇧"]
+    # Offsets point back into the original string
+    for start, end, content in spans:
+        assert text[start:end] == content
+
+
+@pytest.mark.parmoji
+def test_keycap_and_discord_spans():
+    text = "#️⃣ 2024 <a:blob:123456789012345678>"
+    spans = H.find_emojis_in_text(text)
+    assert spans[0] == (0, 3, "#️⃣")
+    assert spans[1][2] == "<a:blob:123456789012345678>"
+    assert len(spans) == 2
+
+
+@pytest.mark.parmoji
+def test_ascii_text_only_matches_discord():
+    assert H.find_emojis_in_text("plain ^text` with #1 and *") == []
+    assert H.find_emojis_in_text("x <:y:123456789012345678> z") == [(2, 25, "<:y:123456789012345678>")]
+
+
+@pytest.mark.parmoji
+def test_unknown_zwj_sequence_is_joined():
+    # Two valid emoji joined with ZWJ form one node even if the dataset lacks the pair
+    seq = "😀‍😀"
+    assert H.find_emojis_in_text(seq) == [(0, 3, seq)]
+    # A dangling ZWJ is left as text
+    assert H.find_emojis_in_text("😀‍") == [(0, 1, "😀")]
+
+
+@pytest.mark.parmoji
+def test_symbol_category_fallback_for_non_ascii():
+    # U+2713 CHECK MARK is not in the emoji dataset but is category So
+    assert H.find_emojis_in_text("ok ✓") == [(3, 4, "✓")]
+    # Accented letters are not emoji
+    assert H.find_emojis_in_text("café") == []